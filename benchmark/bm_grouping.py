@@ -0,0 +1,93 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmark comparing the number of groups and the runtime of the Pauli grouping methods.
+
+The Pauli words are sampled uniformly at random from a seeded generator, such that the group
+counts are reproducible. Usage:
+
+.. code-block:: console
+
+    python benchmark/bm_grouping.py --qubits 8 --terms 100 1000 3000 --grouping-type qwc
+"""
+import argparse
+import time
+
+import numpy as np
+
+import pennylane as qml
+from pennylane.grouping import group_observables, string_to_pauli_word
+
+METHODS = ["lf", "rlf", "dsatur", "si"]
+
+
+def random_pauli_words(n_qubits, n_terms, rng):
+    """Returns distinct random Pauli words on the given number of qubits, and random
+    coefficients"""
+    words = set()
+    while len(words) < n_terms:
+        word = "".join(rng.choice(list("IXYZ"), size=n_qubits))
+        if word != "I" * n_qubits:
+            words.add(word)
+
+    wire_map = {i: i for i in range(n_qubits)}
+    observables = [string_to_pauli_word(w, wire_map=wire_map) for w in sorted(words)]
+    return observables, rng.normal(size=n_terms)
+
+
+def benchmark(n_qubits, n_terms, grouping_type, seed, repeat):
+    """Returns the number of groups and the best runtime in seconds of each method"""
+    observables, coefficients = random_pauli_words(n_qubits, n_terms, np.random.default_rng(seed))
+    results = {}
+
+    for method in METHODS:
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            groups, _ = group_observables(observables, coefficients, grouping_type, method)
+            times.append(time.perf_counter() - start)
+
+        results[method] = (len(groups), min(times))
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--qubits", type=int, default=8, help="number of qubits")
+    parser.add_argument(
+        "--terms", type=int, nargs="+", default=[100, 1000, 3000], help="numbers of Pauli words"
+    )
+    parser.add_argument("--grouping-type", default="qwc", choices=["qwc", "commuting"])
+    parser.add_argument("--seed", type=int, default=42, help="seed of the random generator")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per method, best is kept")
+    args = parser.parse_args()
+
+    print(
+        f"PennyLane {qml.version()}, {args.qubits} qubits, {args.grouping_type}, seed {args.seed}"
+    )
+    print(
+        f"{'terms':>6} " + " ".join(f"{m + ' groups':>13} {m + ' time (s)':>15}" for m in METHODS)
+    )
+
+    for n_terms in args.terms:
+        results = benchmark(args.qubits, n_terms, args.grouping_type, args.seed, args.repeat)
+        print(
+            f"{n_terms:>6} "
+            + " ".join(f"{results[m][0]:>13} {results[m][1]:>15.4f}" for m in METHODS)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -14,9 +14,11 @@
 """
 This is the top level module from which all basic functions and classes of
 PennyLane can be directly imported.
+
+To keep ``import pennylane`` fast, the subpackages that are not required by the core
+of PennyLane, and the installed plugins, are only loaded when first accessed.
 """
-from importlib import reload
-import pkg_resources
+import importlib
 
 import numpy as _np
 from semantic_version import Spec, Version
@@ -24,12 +26,9 @@ from semantic_version import Spec, Version
 from pennylane.queuing import apply, QueuingContext
 
 import pennylane.init
-import pennylane.fourier
 import pennylane.gradients
-import pennylane.kernels
 import pennylane.math
 import pennylane.operation
-import pennylane.qnn
 import pennylane.templates
 from pennylane._device import Device, DeviceError
 from pennylane._grad import grad, jacobian, finite_diff
@@ -43,7 +42,6 @@ from pennylane.io import *
 from pennylane.measure import density_matrix, expval, probs, sample, state, var
 from pennylane.ops import *
 from pennylane.optimize import *
-from pennylane import qaoa
 from pennylane.qnode import QNode, qnode
 from pennylane.templates import broadcast, layer, template
 from pennylane.transforms import (
@@ -61,24 +59,32 @@ from pennylane.transforms import (
     apply_controlled_Q,
 )
 from pennylane.utils import inv
-from pennylane.vqe import ExpvalCost, Hamiltonian, VQECost
-
-# QueuingContext and collections needs to be imported after all other pennylane imports
-from .collections import QNodeCollection, dot, map, sum
-import pennylane.grouping  # pylint:disable=wrong-import-order
+from pennylane.vqe import ExpvalCost, Hamiltonian, PauliSum, VQECost
+from pennylane._entry_points import EntryPointTable, entry_points as _get_entry_points
 
 # Look for an existing configuration file
 default_config = Configuration("config.toml")
 
+_LAZY_SUBPACKAGES = frozenset(["collections", "fourier", "grouping", "kernels", "qaoa", "qnn"])
+"""frozenset[str]: subpackages that are imported when first accessed"""
+
+_LAZY_ATTRIBUTES = {
+    "QNodeCollection": "collections",
+    "dot": "collections",
+    "map": "collections",
+    "sum": "collections",
+}
+"""dict[str, str]: attributes that are imported from a subpackage when first accessed"""
+
 
 class QuantumFunctionError(Exception):
     """Exception raised when an illegal operation is defined in a quantum function."""
 
 
-def _get_device_entrypoints():
+def _get_device_entrypoints(refresh=False):
     """Returns a dictionary mapping the device short name to the
     loadable entrypoint"""
-    return {entry.name: entry for entry in pkg_resources.iter_entry_points("pennylane.plugins")}
+    return _get_entry_points("pennylane.plugins", refresh=refresh)
 
 
 def refresh_devices():
@@ -88,16 +94,15 @@ def refresh_devices():
     # which is to update the global plugin_devices variable.
 
     # We wish to retain the behaviour of a global plugin_devices dictionary,
-    # as re-importing pkg_resources can be a very slow operation on systems
+    # as scanning the installed distributions can be a very slow operation on systems
     # with a large number of installed packages.
     global plugin_devices  # pylint:disable=global-statement
 
-    reload(pkg_resources)
-    plugin_devices = _get_device_entrypoints()
+    plugin_devices = _get_device_entrypoints(refresh=True)
 
 
-# get list of installed devices
-plugin_devices = _get_device_entrypoints()
+# list of installed devices, which are discovered when first accessed
+plugin_devices = EntryPointTable("pennylane.plugins")
 
 
 # get chemistry plugin
@@ -125,11 +130,38 @@ class NestedAttrError:
     __repr__ = __str__
 
 
-qchem = NestedAttrError()
+def _load_qchem():
+    """Loads the chemistry plugin, or a placeholder raising an import error if it is
+    not installed."""
+    entry = _get_entry_points("pennylane.qchem").get("OpenFermion", None)
+
+    if entry is None:
+        return NestedAttrError()
+
+    return entry.load()
+
+
+def __getattr__(name):
+    """Imports the lazily loaded subpackages and the chemistry plugin when first accessed."""
+    global qchem  # pylint:disable=global-variable-undefined
+
+    if name in _LAZY_SUBPACKAGES:
+        return importlib.import_module("pennylane." + name)
+
+    if name in _LAZY_ATTRIBUTES:
+        attribute = getattr(importlib.import_module("pennylane." + _LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = attribute
+        return attribute
+
+    if name == "qchem":
+        qchem = _load_qchem()
+        return qchem
+
+    raise AttributeError("module 'pennylane' has no attribute '{}'".format(name))
+
 
-for entry in pkg_resources.iter_entry_points("pennylane.qchem"):
-    if entry.name == "OpenFermion":
-        qchem = entry.load()
+def __dir__():
+    return sorted(set(globals()) | _LAZY_SUBPACKAGES | set(_LAZY_ATTRIBUTES) | {"qchem"})
 
 
 def device(name, *args, **kwargs):
@@ -0,0 +1,201 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+This module contains functions to discover the entry points of PennyLane plugins.
+
+Scanning the metadata of all installed distributions is slow in large environments.
+The entry points are therefore only discovered when first needed, and the table of
+entry points is cached on disk. The cache is invalidated whenever the environment
+fingerprint changes, i.e., the Python version, the entries of ``sys.path``, or the
+modification times of these directories, which change whenever a distribution is
+installed or removed.
+"""
+from collections.abc import Mapping
+import hashlib
+import json
+import os
+import sys
+import tempfile
+
+from appdirs import user_cache_dir
+
+GROUPS = ("pennylane.plugins", "pennylane.io", "pennylane.qchem")
+"""tuple[str]: the entry point groups discovered and cached jointly"""
+
+_table = None
+
+
+def _metadata():
+    """Returns the ``importlib.metadata`` module, or its backport for Python 3.7."""
+    try:
+        from importlib import metadata  # pylint: disable=import-outside-toplevel
+    except ImportError:  # pragma: no cover
+        import importlib_metadata as metadata  # pylint: disable=import-outside-toplevel
+
+    return metadata
+
+
+def cache_file():
+    """Returns the path of the file caching the entry points.
+
+    Each Python environment, identified by its interpreter and ``sys.path``, uses a separate
+    cache file. The directory can be set using the ``PENNYLANE_CACHE_DIR`` environment variable,
+    and defaults to the user cache directory.
+
+    Returns:
+        str: path of the cache file
+    """
+    directory = os.environ.get("PENNYLANE_CACHE_DIR", None) or user_cache_dir("pennylane", "Xanadu")
+    environment = hashlib.sha256(repr([sys.executable] + sys.path).encode()).hexdigest()
+    return os.path.join(directory, "entry_points_{}.json".format(environment[:16]))
+
+
+def fingerprint():
+    """Computes a fingerprint of the Python environment.
+
+    Returns:
+        str: hexadecimal digest of the Python version, and the entries of ``sys.path``
+        together with their modification times
+    """
+    h = hashlib.sha256(sys.version.encode())
+
+    for path in sys.path:
+        try:
+            mtime = os.stat(path or os.curdir).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        h.update("{}:{};".format(path, mtime).encode())
+
+    return h.hexdigest()
+
+
+def _scan():
+    """Scans the metadata of the installed distributions for PennyLane entry points.
+
+    Returns:
+        dict[str, dict[str, str]]: the object references of the entry points of each group,
+        keyed by their names
+    """
+    entry_points = _metadata().entry_points()
+    table = {}
+
+    for group in GROUPS:
+        if hasattr(entry_points, "select"):
+            entries = entry_points.select(group=group)
+        else:
+            entries = entry_points.get(group, [])
+
+        # distributions found on several paths shadow each other in the order of sys.path
+        table[group] = {}
+        for entry in entries:
+            table[group].setdefault(entry.name, entry.value)
+
+    return table
+
+
+def _load_table(refresh=False):
+    """Loads the entry point table from the cache file, or scans the installed distributions
+    if the cache is missing or outdated.
+
+    Args:
+        refresh (bool): whether to scan the installed distributions even if the cache is valid
+
+    Returns:
+        dict[str, dict[str, str]]: the object references of the entry points of each group,
+        keyed by their names
+    """
+    path = cache_file()
+    key = fingerprint()
+
+    if not refresh:
+        try:
+            with open(path, "r") as f:
+                cache = json.load(f)
+
+            if cache["fingerprint"] == key:
+                return cache["entry_points"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    table = _scan()
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".json")
+
+        with os.fdopen(fd, "w") as f:
+            json.dump({"fingerprint": key, "entry_points": table}, f)
+
+        os.replace(tmp_path, path)
+    except OSError:
+        # the cache is an optimization; read-only file systems are not an error
+        pass
+
+    return table
+
+
+def entry_points(group, refresh=False):
+    """Returns the entry points of a group.
+
+    Args:
+        group (str): the entry point group, which must be one of :data:`GROUPS`
+        refresh (bool): If ``True``, the installed distributions are scanned again, and the
+            cache is updated. Otherwise, the entry points loaded previously in this process,
+            or the cached entry points, are returned.
+
+    Returns:
+        dict[str, importlib.metadata.EntryPoint]: dictionary mapping the entry point names
+        to the loadable entry points
+    """
+    global _table  # pylint:disable=global-statement
+
+    if refresh or _table is None:
+        _table = _load_table(refresh=refresh)
+
+    entry_point = _metadata().EntryPoint
+    return {name: entry_point(name, value, group) for name, value in _table.get(group, {}).items()}
+
+
+class EntryPointTable(Mapping):
+    """Read-only dictionary of the entry points of a group, which are only discovered
+    when the dictionary is first accessed.
+
+    Args:
+        group (str): the entry point group, which must be one of :data:`GROUPS`
+    """
+
+    def __init__(self, group):
+        self.group = group
+        self._entry_points = None
+
+    @property
+    def entry_points(self):
+        """dict[str, importlib.metadata.EntryPoint]: the entry points of the group"""
+        if self._entry_points is None:
+            self._entry_points = entry_points(self.group)
+
+        return self._entry_points
+
+    def __getitem__(self, name):
+        return self.entry_points[name]
+
+    def __iter__(self):
+        return iter(self.entry_points)
+
+    def __len__(self):
+        return len(self.entry_points)
+
+    def __repr__(self):
+        return "<EntryPointTable: group={}>".format(self.group)
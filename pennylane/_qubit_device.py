@@ -32,13 +32,12 @@ from pennylane.operation import (
     Expectation,
     Probability,
     State,
-    operation_derivative,
 )
 from pennylane import Device
-from pennylane.math import sum as qmlsum
 from pennylane.wires import Wires
 
 from pennylane.measure import MeasurementProcess
+from pennylane.utils import _observable_fingerprint
 
 
 class QubitDevice(Device):
@@ -124,9 +123,15 @@ class QubitDevice(Device):
     def __init__(self, wires=1, shots=None, cache=0, analytic=None):
         super().__init__(wires=wires, shots=shots, analytic=analytic)
 
-        self._samples = None
+        self._binary_samples = None
+        """None or array[int]: stores the samples generated by the device
+        *after* rotation to diagonalize the observables, in binary representation."""
+
+        self._sample_indices = None
         """None or array[int]: stores the samples generated by the device
-        *after* rotation to diagonalize the observables."""
+        *after* rotation to diagonalize the observables, as the integer indices
+        of the sampled computational basis states. Used instead of the binary
+        representation if the samples are generated by :meth:`generate_sample_indices`."""
 
         self._cache = cache
         """int: Number of device executions to store in a cache to speed up subsequent
@@ -136,6 +141,34 @@ class QubitDevice(Device):
         """OrderedDict[int: Any]: Mapping from hashes of the circuit to results of executing the
         device."""
 
+        self._structure_cache = None
+        """None or dict[tuple: list[~.Operation]]: Mapping from the structure of circuits that
+        have already been validated during the current :meth:`batch_execute` call to
+        their diagonalizing gates. Set to ``None`` outside of :meth:`batch_execute`."""
+
+        self._sample_index_cache = None
+        """None or dict[tuple: array[int]]: Mapping from shot ranges and device wires to the
+        samples of these wires as integer indices, shared by all measurements computed during
+        the current :meth:`statistics` call. Set to ``None`` outside of :meth:`statistics`."""
+
+    @property
+    def _samples(self):
+        """None or array[int]: the samples generated by the device *after* rotation to
+        diagonalize the observables, in binary representation of shape ``(shots, num_wires)``.
+
+        If the samples are stored as integer indices, they are converted on first access.
+        Setting this attribute discards the integer indices.
+        """
+        if self._binary_samples is None and self._sample_indices is not None:
+            self._binary_samples = self.states_to_binary(self._sample_indices, self.num_wires)
+
+        return self._binary_samples
+
+    @_samples.setter
+    def _samples(self, samples):
+        self._binary_samples = samples
+        self._sample_indices = None
+
     @classmethod
     def capabilities(cls):
 
@@ -184,18 +217,24 @@ class QubitDevice(Device):
         """
 
         if self._cache:
-            circuit_hash = circuit.graph.hash
+            circuit_hash = circuit.hash
             if circuit_hash in self._cache_execute:
                 return self._cache_execute[circuit_hash]
 
-        self.check_validity(circuit.operations, circuit.observables)
+        rotations = self._validate_and_diagonalize(circuit)
 
         # apply all circuit operations
-        self.apply(circuit.operations, rotations=circuit.diagonalizing_gates, **kwargs)
+        self.apply(circuit.operations, rotations=rotations, **kwargs)
 
         # generate computational basis samples
         if self.shots is not None or circuit.is_sampled:
-            self._samples = self.generate_samples()
+            if type(self).generate_samples is QubitDevice.generate_samples:
+                # keep the samples as integer indices, and only extract
+                # the bits of the wires that are measured
+                self._samples = None
+                self._sample_indices = self.generate_sample_indices()
+            else:
+                self._samples = self.generate_samples()
 
         multiple_sampled_jobs = circuit.is_sampled and self._has_partitioned_shots()
 
@@ -270,13 +309,21 @@ class QubitDevice(Device):
         # once it has the same signature in the execute() method
 
         results = []
-        for circuit in circuits:
-            # we need to reset the device here, else it will
-            # not start the next computation in the zero state
-            self.reset()
 
-            res = self.execute(circuit)
-            results.append(res)
+        # Circuits within a batch frequently share the same structure, differing only
+        # in their parameters; validate and diagonalize each structure only once.
+        self._structure_cache = {}
+
+        try:
+            for circuit in circuits:
+                # we need to reset the device here, else it will
+                # not start the next computation in the zero state
+                self.reset()
+
+                res = self.execute(circuit)
+                results.append(res)
+        finally:
+            self._structure_cache = None
 
         if self.tracker.active:
             self.tracker.update(batches=1, batch_len=len(circuits))
@@ -284,6 +331,58 @@ class QubitDevice(Device):
 
         return results
 
+    @staticmethod
+    def circuit_structure(circuit):
+        """Returns a hashable description of the structure of a circuit.
+
+        The structure consists of the names and wires of all operations, as well as the
+        return types and observables of all measurements. Gate parameters are not included,
+        so that circuits only differing in their gate parameters share the same structure.
+        Observable parameters, such as the matrix of a :class:`~.Hermitian` observable,
+        are part of the structure, since they determine the diagonalizing gates.
+
+        Args:
+            circuit (~.tape.QuantumTape): circuit to describe
+
+        Returns:
+            tuple: the structure of the circuit
+        """
+        operations = tuple((op.name, op.wires.labels) for op in circuit.operations)
+
+        measurements = tuple(
+            (m.return_type, m.wires.labels, _observable_fingerprint(m.obs))
+            for m in circuit.measurements
+        )
+
+        return operations, measurements
+
+    def _validate_and_diagonalize(self, circuit):
+        """Checks that the operations and observables of a circuit are supported by the device,
+        and returns the gates diagonalizing its observables.
+
+        Within :meth:`batch_execute`, the result is memoized per circuit structure.
+
+        Args:
+            circuit (~.tape.QuantumTape): circuit to validate
+
+        Raises:
+            DeviceError: if there are operations or observables that the device does not support
+
+        Returns:
+            list[~.Operation]: the operations that diagonalize the observables
+        """
+        if self._structure_cache is None:
+            self.check_validity(circuit.operations, circuit.observables)
+            return circuit.diagonalizing_gates
+
+        structure = self.circuit_structure(circuit)
+
+        if structure not in self._structure_cache:
+            self.check_validity(circuit.operations, circuit.observables)
+            self._structure_cache[structure] = circuit.diagonalizing_gates
+
+        return self._structure_cache[structure]
+
     @abc.abstractmethod
     def apply(self, operations, **kwargs):
         """Apply quantum operations, rotate the circuit into the measurement
@@ -388,40 +487,47 @@ class QubitDevice(Device):
         """
         results = []
 
-        for obs in observables:
-            # Pass instances directly
-            if obs.return_type is Expectation:
-                results.append(self.expval(obs, shot_range=shot_range, bin_size=bin_size))
+        # measurements on the same wires share their sample indices
+        self._sample_index_cache = {}
 
-            elif obs.return_type is Variance:
-                results.append(self.var(obs, shot_range=shot_range, bin_size=bin_size))
+        try:
+            for obs in observables:
+                # Pass instances directly
+                if obs.return_type is Expectation:
+                    results.append(self.expval(obs, shot_range=shot_range, bin_size=bin_size))
 
-            elif obs.return_type is Sample:
-                results.append(self.sample(obs, shot_range=shot_range, bin_size=bin_size))
+                elif obs.return_type is Variance:
+                    results.append(self.var(obs, shot_range=shot_range, bin_size=bin_size))
 
-            elif obs.return_type is Probability:
-                results.append(
-                    self.probability(wires=obs.wires, shot_range=shot_range, bin_size=bin_size)
-                )
+                elif obs.return_type is Sample:
+                    results.append(self.sample(obs, shot_range=shot_range, bin_size=bin_size))
 
-            elif obs.return_type is State:
-                if len(observables) > 1:
-                    raise qml.QuantumFunctionError(
-                        "The state or density matrix cannot be returned in combination"
-                        " with other return types"
+                elif obs.return_type is Probability:
+                    results.append(
+                        self.probability(wires=obs.wires, shot_range=shot_range, bin_size=bin_size)
                     )
-                if self.wires.labels != tuple(range(self.num_wires)):
+
+                elif obs.return_type is State:
+                    if len(observables) > 1:
+                        raise qml.QuantumFunctionError(
+                            "The state or density matrix cannot be returned in combination"
+                            " with other return types"
+                        )
+                    if self.wires.labels != tuple(range(self.num_wires)):
+                        raise qml.QuantumFunctionError(
+                            "Returning the state is not supported when using custom wire labels"
+                        )
+                    # Check if the state is accessible and decide to return the state or
+                    # the density matrix.
+                    results.append(self.access_state(wires=obs.wires))
+
+                elif obs.return_type is not None:
                     raise qml.QuantumFunctionError(
-                        "Returning the state is not supported when using custom wire labels"
+                        "Unsupported return type specified for observable {}".format(obs.name)
                     )
-                # Check if the state is accessible and decide to return the state or the density
-                # matrix.
-                results.append(self.access_state(wires=obs.wires))
 
-            elif obs.return_type is not None:
-                raise qml.QuantumFunctionError(
-                    "Unsupported return type specified for observable {}".format(obs.name)
-                )
+        finally:
+            self._sample_index_cache = None
 
         return results
 
@@ -475,12 +581,32 @@ class QubitDevice(Device):
         samples = self.sample_basis_states(number_of_states, rotated_prob)
         return QubitDevice.states_to_binary(samples, self.num_wires)
 
+    def generate_sample_indices(self):
+        r"""Returns the computational basis samples generated for all wires, as the
+        integer indices of the sampled basis states.
+
+        This compact representation stores a single integer per shot. The bit of wire
+        :math:`i` is the :math:`(N-1-i)`-th least significant bit of the index.
+
+        Returns:
+             array[int]: array of samples in the shape ``(dev.shots,)``
+        """
+        number_of_states = 2 ** self.num_wires
+
+        rotated_prob = self.analytic_probability()
+
+        return self.sample_basis_states(number_of_states, rotated_prob)
+
     def sample_basis_states(self, number_of_states, state_probability):
         """Sample from the computational basis states based on the state
         probability.
 
         This is an auxiliary method to the generate_samples method.
 
+        The samples are drawn by inverting the cumulative distribution function,
+        computed once for all shots, using a binary search for each shot. This draws
+        the same samples as :func:`numpy.random.choice`.
+
         Args:
             number_of_states (int): the number of basis states to sample from
             state_probability (array[float]): the computational basis probability vector
@@ -498,8 +624,79 @@ class QubitDevice(Device):
 
         shots = self.shots or 1000
 
-        basis_states = np.arange(number_of_states)
-        return np.random.choice(basis_states, shots, p=state_probability)
+        cdf = np.cumsum(np.asarray(state_probability, dtype=np.float64))
+        cdf /= cdf[-1]
+
+        # searching the uniform samples in sorted order keeps the memory
+        # accesses into the cumulative distribution function local
+        uniform = np.random.random_sample(shots)
+        order = np.argsort(uniform)
+
+        samples = np.empty(shots, dtype=np.int64)
+        samples[order] = np.searchsorted(cdf, uniform[order], side="right")
+        return samples
+
+    def _sample_wires(self, sample_slice, device_wires):
+        """Returns the binary samples of the given wires.
+
+        Args:
+            sample_slice (slice or Ellipsis): the range of samples to use
+            device_wires (list[int]): device wires to return the samples for
+
+        Returns:
+            array[int]: samples of shape ``(shots, len(device_wires))``
+        """
+        if self._sample_indices is None:
+            return self._samples[sample_slice, np.array(device_wires)]
+
+        shifts = self.num_wires - 1 - np.array(device_wires)
+        return (self._sample_indices[sample_slice, None] >> shifts) & 1
+
+    def _sample_basis_indices(self, sample_slice, device_wires):
+        """Returns the samples of the given wires as integer indices of the
+        basis states of these wires.
+
+        During a :meth:`statistics` call, the indices are computed once per shot range
+        and wires, and shared by all measurements.
+
+        Args:
+            sample_slice (slice or Ellipsis): the range of samples to use
+            device_wires (list[int]): device wires to return the samples for
+
+        Returns:
+            array[int]: samples of shape ``(shots,)``
+        """
+        if self._sample_index_cache is None:
+            return self._compute_sample_basis_indices(sample_slice, device_wires)
+
+        # slices are not hashable
+        shots = None if sample_slice is Ellipsis else (sample_slice.start, sample_slice.stop)
+        key = (shots, tuple(device_wires))
+
+        if key not in self._sample_index_cache:
+            self._sample_index_cache[key] = self._compute_sample_basis_indices(
+                sample_slice, device_wires
+            )
+
+        return self._sample_index_cache[key]
+
+    def _compute_sample_basis_indices(self, sample_slice, device_wires):
+        """Computes the samples of the given wires as integer indices of the
+        basis states of these wires.
+
+        Args:
+            sample_slice (slice or Ellipsis): the range of samples to use
+            device_wires (list[int]): device wires to return the samples for
+
+        Returns:
+            array[int]: samples of shape ``(shots,)``
+        """
+        if self._sample_indices is not None and list(device_wires) == list(range(self.num_wires)):
+            return self._sample_indices[sample_slice]
+
+        samples = self._sample_wires(sample_slice, device_wires)
+        powers_of_two = 2 ** np.arange(len(device_wires))[::-1]
+        return samples @ powers_of_two
 
     @staticmethod
     def generate_basis_states(num_wires, dtype=np.uint32):
@@ -636,28 +833,25 @@ class QubitDevice(Device):
         device_wires = self.map_wires(wires)
 
         sample_slice = Ellipsis if shot_range is None else slice(*shot_range)
-        samples = self._samples[sample_slice, device_wires]
 
-        # convert samples from a list of 0, 1 integers, to base 10 representation
-        powers_of_two = 2 ** np.arange(len(device_wires))[::-1]
-        indices = samples @ powers_of_two
+        # samples in base 10 representation
+        indices = self._sample_basis_indices(sample_slice, device_wires)
+
+        num_states = 2 ** len(device_wires)
 
         # count the basis state occurrences, and construct the probability vector
         if bin_size is not None:
-            bins = len(samples) // bin_size
+            bins = len(indices) // bin_size
 
-            indices = indices.reshape((bins, -1))
-            prob = np.zeros([2 ** len(device_wires), bins], dtype=np.float64)
+            # offset the indices of each bin, such that all bins are counted at once
+            offsets = np.arange(bins)[:, None] * num_states
+            indices = np.reshape(indices, (bins, -1)) + offsets
 
-            # count the basis state occurrences, and construct the probability vector
-            for b, idx in enumerate(indices):
-                basis_states, counts = np.unique(idx, return_counts=True)
-                prob[basis_states, b] = counts / bin_size
+            counts = np.bincount(np.ravel(indices), minlength=bins * num_states)
+            prob = np.reshape(counts, (bins, num_states)).T / bin_size
 
         else:
-            basis_states, counts = np.unique(indices, return_counts=True)
-            prob = np.zeros([2 ** len(device_wires)], dtype=np.float64)
-            prob[basis_states] = counts / len(samples)
+            prob = np.bincount(indices, minlength=num_states) / len(indices)
 
         return self._asarray(prob, dtype=self.R_DTYPE)
 
@@ -799,7 +993,7 @@ class QubitDevice(Device):
 
         if isinstance(name, str) and name in {"PauliX", "PauliY", "PauliZ", "Hadamard"}:
             # Process samples for observables with eigenvalues {1, -1}
-            samples = 1 - 2 * self._samples[sample_slice, device_wires[0]]
+            samples = 1 - 2 * self._sample_basis_indices(sample_slice, device_wires[:1])
 
         elif isinstance(
             observable, MeasurementProcess
@@ -807,18 +1001,14 @@ class QubitDevice(Device):
             if (
                 len(observable.wires) != 0
             ):  # if wires are provided, then we only return samples from those wires
-                samples = self._samples[sample_slice, np.array(device_wires)]
+                samples = self._sample_wires(sample_slice, device_wires)
             else:
                 samples = self._samples[sample_slice]
 
         else:
             # Replace the basis state in the computational basis with the correct eigenvalue.
             # Extract only the columns of the basis samples required based on ``wires``.
-            samples = self._samples[
-                sample_slice, np.array(device_wires)
-            ]  # Add np.array here for Jax support.
-            powers_of_two = 2 ** np.arange(samples.shape[-1])[::-1]
-            indices = samples @ powers_of_two
+            indices = self._sample_basis_indices(sample_slice, device_wires)
             samples = observable.eigvals[indices]
 
         if bin_size is None:
@@ -858,12 +1048,9 @@ class QubitDevice(Device):
 
         Raises:
             QuantumFunctionError: if the input tape has measurements that are not expectation values
-                or contains a multi-parameter operation aside from :class:`~.Rot`
+                or contains a trainable operation that can neither be differentiated using its
+                generator nor decomposed into such operations
         """
-        # broadcasted inner product not summing over first dimension of b
-        sum_axes = tuple(range(1, self.num_wires + 1))
-        dot_product_real = lambda b, k: self._real(qmlsum(self._conj(b) * k, axis=sum_axes))
-
         for m in tape.measurements:
             if m.return_type is not qml.operation.Expectation:
                 raise qml.QuantumFunctionError(
@@ -871,9 +1058,6 @@ class QubitDevice(Device):
                     f" measurement {m.return_type.value}"
                 )
 
-            if not hasattr(m.obs, "base_name"):
-                m.obs.base_name = None  # This is needed for when the observable is a tensor product
-
         if self.shots is not None:
             warnings.warn(
                 "Requested adjoint differentiation to be computed with finite shots."
@@ -890,52 +1074,241 @@ class QubitDevice(Device):
                 self.execute(tape)
             ket = self._pre_rotated_state
 
+        # the ket and the bras are stacked along the first axis, such that the
+        # adjoint of each operation is applied to all of them at once
         n_obs = len(tape.observables)
-        bras = np.empty([n_obs] + [2] * self.num_wires, dtype=np.complex128)
-        for kk in range(n_obs):
-            bras[kk, ...] = self._apply_operation(ket, tape.observables[kk])
+        states = np.empty([n_obs + 1] + [2] * self.num_wires, dtype=np.complex128)
+        states[0] = ket
+        for kk, obs in enumerate(tape.observables):
+            states[kk + 1] = self._apply_observable(ket, obs)
+
+        ket, bras = states[0], states[1:]
+
+        # indices of the parameters of each operation, and the corresponding jacobian columns
+        param_indices = {}
+        for idx, info in sorted(tape._par_info.items()):  # pylint: disable=protected-access
+            param_indices.setdefault(id(info["op"]), []).append(idx)
+
+        columns = {idx: col for col, idx in enumerate(sorted(tape.trainable_params))}
+        jac = np.zeros((n_obs, len(columns)))
 
-        expanded_ops = []
         for op in reversed(tape.operations):
-            if op.num_params > 1:
-                if isinstance(op, qml.Rot) and not op.inverse:
-                    ops = op.decomposition(*op.parameters, wires=op.wires)
-                    expanded_ops.extend(reversed(ops))
-                else:
-                    raise qml.QuantumFunctionError(
-                        f"The {op.name} operation is not supported using "
-                        'the "adjoint" differentiation method'
-                    )
-            else:
-                if op.name not in ("QubitStateVector", "BasisState"):
-                    expanded_ops.append(op)
+            if op.name in ("QubitStateVector", "BasisState"):
+                continue
 
-        jac = np.zeros((len(tape.observables), len(tape.trainable_params)))
+            trainable = [
+                (p, columns[idx])
+                for p, idx in enumerate(param_indices.get(id(op), []))
+                if idx in columns and not isinstance(op.data[p], str)
+            ]
 
-        param_number = len(tape._par_info) - 1  # pylint: disable=protected-access
-        trainable_param_number = len(tape.trainable_params) - 1
-        for op in expanded_ops:
+            if not trainable:
+                self._apply_adjoint_stacked(states, op)
+                continue
 
-            if (op.grad_method is not None) and (param_number in tape.trainable_params):
-                d_op_matrix = operation_derivative(op)
+            for sub_op, coeffs in self._adjoint_expand(op, [p for p, _ in trainable]):
+                if coeffs is not None:
+                    derivative = self._generator_expval(bras, ket, sub_op)
 
-            op.inv()
-            # Ideally use use op.adjoint() here
-            # then we don't have to re-invert the operation at the end
-            ket = self._apply_operation(ket, op)
+                    for coeff, (_, col) in zip(coeffs, trainable):
+                        jac[:, col] += coeff * derivative
 
-            if op.grad_method is not None:
-                if param_number in tape.trainable_params:
+                self._apply_adjoint_stacked(states, sub_op)
 
-                    ket_temp = self._apply_unitary(ket, d_op_matrix, op.wires)
+        return jac
 
-                    jac[:, trainable_param_number] = 2 * dot_product_real(bras, ket_temp)
+    def _apply_observable(self, state, observable):
+        """Applies an observable to the input state.
 
-                    trainable_param_number -= 1
-                param_number -= 1
+        Tensor products are applied factor by factor, and Hamiltonians term by term.
 
-            for kk in range(n_obs):
-                bras[kk, ...] = self._apply_operation(bras[kk, ...], op)
-            op.inv()
+        Args:
+            state (array[complex]): input state
+            observable (.Observable or .Hamiltonian): observable to apply
 
-        return jac
+        Returns:
+            array[complex]: output state
+        """
+        if isinstance(observable, qml.Hamiltonian):
+            return sum(
+                c * self._apply_observable(state, obs)
+                for c, obs in zip(observable.coeffs, observable.ops)
+            )
+
+        if isinstance(observable, qml.operation.Tensor):
+            for obs in observable.obs:
+                state = self._apply_observable(state, obs)
+            return state
+
+        if observable.name == "Identity":
+            return state
+
+        if isinstance(observable, qml.operation.Operation):
+            return self._apply_operation(state, observable)
+
+        # observables that are not operations, such as Hermitian, are applied as matrices
+        return self._apply_unitary(state, observable.matrix, observable.wires)
+
+    def _apply_adjoint_stacked(self, states, operation):
+        """Applies the adjoint of an operation to a stack of states.
+
+        Args:
+            states (array[complex]): states stacked along the first axis; updated in place
+            operation (.Operation): operation whose adjoint is applied
+        """
+        device_wires = self.map_wires(operation.wires)
+        axes = [w + 1 for w in device_wires]
+
+        if isinstance(operation, qml.operation.DiagonalOperation):
+            # multiply by the conjugated eigenvalues, broadcast along the unused axes
+            phases = np.reshape(np.conj(operation.eigvals), [2] * len(axes))
+            phases = np.transpose(phases, np.argsort(axes))
+
+            shape = [1] * states.ndim
+            for axis in axes:
+                shape[axis] = 2
+
+            states *= np.reshape(phases, shape)
+            return
+
+        mat = np.conj(operation.matrix).T
+
+        if len(axes) == 1:
+            # update the two halves of the stacked states in place
+            view = np.reshape(states, (-1, 2, 2 ** (self.num_wires - device_wires[0] - 1)))
+            first = view[:, 0].copy()
+            view[:, 0] *= mat[0, 0]
+            view[:, 0] += mat[0, 1] * view[:, 1]
+            view[:, 1] *= mat[1, 1]
+            view[:, 1] += mat[1, 0] * first
+            return
+
+        mat = np.reshape(mat, [2] * len(axes) * 2)
+        tdot = np.tensordot(mat, states, axes=(list(range(len(axes), 2 * len(axes))), axes))
+
+        # tensordot moves the target axes to the front
+        states[...] = np.moveaxis(tdot, list(range(len(axes))), axes)
+
+    def _generator_expval(self, bras, ket, operation):
+        r"""Computes :math:`2\text{Re}\langle b | \partial U | k\rangle` for each bra,
+        where :math:`| k\rangle` is the state before the operation :math:`U` is applied.
+
+        For :math:`U = e^{i s \theta G}`, this is equal to
+        :math:`-2 s \text{Im}\langle b | G U | k\rangle`, which only requires
+        applying the generator :math:`G` to the current ket.
+
+        Args:
+            bras (array[complex]): bras stacked along the first axis
+            ket (array[complex]): ket after the operation has been applied
+            operation (.Operation): operation with a generator
+
+        Returns:
+            array[float]: the derivative of the expectation value for each bra
+        """
+        generator, prefactor = operation.generator
+
+        if operation.inverse:
+            prefactor = -prefactor
+
+        if isinstance(generator, np.ndarray):
+            gen_ket = self._apply_unitary(ket, generator, operation.wires)
+        else:
+            gen_ket = self._apply_operation(ket, generator(wires=operation.wires, do_queue=False))
+
+        # <b|G|k> is the complex conjugate of the product of b with the conjugated G|k>
+        overlaps = np.reshape(bras, (len(bras), -1)) @ np.conj(np.ravel(gen_ket))
+        return 2 * prefactor * np.imag(overlaps)
+
+    @staticmethod
+    def _adjoint_expand(operation, trainable):
+        """Expands an operation into operations that can each be differentiated
+        using their generator.
+
+        Operations with a generator are returned as is. Operations with multiple parameters are
+        recursively decomposed into operations with at most one parameter, and the derivatives
+        of the decomposed parameters with respect to the trainable parameters are computed.
+        These must be constant, i.e., the decomposed parameters must depend affinely on the
+        original ones.
+
+        Args:
+            operation (.Operation): operation to expand
+            trainable (list[int]): positions of the trainable parameters of the operation
+
+        Returns:
+            list[tuple[.Operation, list[float] or None]]: the expanded operations, in reverse
+            order of application, and the derivatives of their parameter with respect to each
+            trainable parameter, or ``None`` if they do not depend on the trainable parameters
+
+        Raises:
+            QuantumFunctionError: if the operation cannot be expanded
+        """
+        unsupported = qml.QuantumFunctionError(
+            f"The {operation.name} operation is not supported using "
+            'the "adjoint" differentiation method'
+        )
+
+        if operation.generator[0] is not None:
+            if trainable != [0]:
+                raise unsupported
+            return [(operation, [1.0])]
+
+        if operation.num_params <= 1:
+            raise unsupported
+
+        def decompose(params):
+            ops = [operation.__class__(*params, wires=operation.wires, do_queue=False)]
+
+            while any(op.num_params > 1 and op.generator[0] is None for op in ops):
+                expanded = []
+
+                for op in ops:
+                    if op.num_params > 1 and op.generator[0] is None:
+                        try:
+                            expanded.extend(op.expand().operations)
+                        except NotImplementedError as e:
+                            raise unsupported from e
+                    else:
+                        expanded.append(op)
+
+                ops = expanded
+
+            return ops, [float(op.data[0]) if op.num_params else 0.0 for op in ops]
+
+        params = list(operation.data)
+        ops, base = decompose(params)
+
+        derivatives = []
+        for p in trainable:
+            shifted = []
+
+            for shift in [1.0, -1.0]:
+                shifted_params = params.copy()
+                shifted_params[p] = params[p] + shift
+                shifted.append(decompose(shifted_params)[1])
+
+            if not len(shifted[0]) == len(shifted[1]) == len(base):
+                raise unsupported
+
+            forward = np.array(shifted[0]) - base
+            if not np.allclose(forward, base - np.array(shifted[1])):
+                raise unsupported
+
+            derivatives.append(forward)
+
+        expanded = []
+
+        for op, coeffs in zip(ops, np.transpose(derivatives)):
+            if not np.allclose(coeffs, 0):
+                if op.generator[0] is None:
+                    raise unsupported
+                coeffs = list(coeffs)
+            else:
+                coeffs = None
+
+            if operation.inverse:
+                op.inv()
+
+            expanded.append((op, coeffs))
+
+        # the operations of the inverse are applied in reverse order
+        return expanded if operation.inverse else expanded[::-1]
@@ -18,24 +18,29 @@ e.g., OS, version, `Numpy` and `Scipy` versions, installation method.
 import platform
 import importlib
 import sys
-from pkg_resources import iter_entry_points
+
 import numpy
 import scipy
 
-# The following if/else block enables support for pip versions 19.3.x
-_parent_module = importlib.util.find_spec("pip._internal.main") or importlib.util.find_spec(
-    "pip._internal"
-)
-_internal_main = importlib.util.module_from_spec(_parent_module)
-_parent_module.loader.exec_module(_internal_main)
+from pennylane._entry_points import _metadata
+
+
+def _pip_main():
+    """Returns the main function of pip."""
+    # The following if/else block enables support for pip versions 19.3.x
+    _parent_module = importlib.util.find_spec("pip._internal.main") or importlib.util.find_spec(
+        "pip._internal"
+    )
+    _internal_main = importlib.util.module_from_spec(_parent_module)
+    _parent_module.loader.exec_module(_internal_main)
+    return _internal_main.main
 
 
 def about():
     """
     Prints the information for pennylane installation.
     """
-    plugin_devices = iter_entry_points("pennylane.plugins")
-    _internal_main.main(["show", "pennylane"])
+    _pip_main()(["show", "pennylane"])
     print("Platform info:           {}".format(platform.platform(aliased=True)))
     print("Python version:          {0}.{1}.{2}".format(*sys.version_info[0:3]))
     print("Numpy version:           {}".format(numpy.__version__))
@@ -43,8 +48,15 @@ def about():
 
     print("Installed devices:")
 
-    for d in plugin_devices:
-        print("- {} ({}-{})".format(d.name, d.dist.project_name, d.dist.version))
+    # distributions found on several paths shadow each other in the order of sys.path
+    dists = {}
+    for dist in _metadata().distributions():
+        dists.setdefault(dist.metadata["Name"].lower(), dist)
+
+    for dist in dists.values():
+        for d in dist.entry_points:
+            if d.group == "pennylane.plugins":
+                print("- {} ({}-{})".format(d.name, dist.metadata["Name"], dist.version))
 
 
 if __name__ == "__main__":
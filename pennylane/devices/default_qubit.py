@@ -18,15 +18,23 @@ It implements the necessary :class:`~pennylane._device.Device` methods as well a
 :mod:`qubit operations <pennylane.ops.qubit>`, and provides a very simple pure state
 simulation of a qubit-based quantum circuit architecture.
 """
+from concurrent.futures import ThreadPoolExecutor
 import itertools
 import functools
 from string import ascii_letters as ABC
 
 import numpy as np
-from scipy.sparse import coo_matrix
 
-from pennylane import QubitDevice, DeviceError, QubitStateVector, BasisState
-from pennylane.operation import DiagonalOperation
+from pennylane import (
+    QubitDevice,
+    DeviceError,
+    QubitStateVector,
+    BasisState,
+    QubitUnitary,
+    DiagonalQubitUnitary,
+)
+from pennylane.operation import DiagonalOperation, Expectation, Probability, Variance
+from pennylane.utils import _parity, _pauli_word_masks, expand, expand_vector
 from pennylane.wires import WireError
 from .._version import __version__
 
@@ -38,6 +46,20 @@ SQRT2INV = 1 / np.sqrt(2)
 TPHASE = np.exp(1j * np.pi / 4)
 
 
+@functools.lru_cache()
+def _get_thread_pool(num_threads):
+    """Returns the thread pool shared by all devices using the given number of threads,
+    such that the worker threads are not created anew for every device instance.
+
+    Args:
+        num_threads (int): number of worker threads
+
+    Returns:
+        ThreadPoolExecutor: the shared thread pool
+    """
+    return ThreadPoolExecutor(max_workers=num_threads)
+
+
 def _get_slice(index, axis, num_axes):
     """Allows slicing along an arbitrary axis of an array or tensor.
 
@@ -82,8 +104,31 @@ class DefaultQubit(QubitDevice):
             executions. A value of ``0`` indicates that no caching will take place. Once filled,
             older elements of the cache are removed and replaced with the most recent device
             executions to keep the cache up to date.
+        max_fused_wires (int): If larger than zero, adjacent gates acting on at most this many
+            wires are fused into a single unitary before being applied, reducing the number of
+            passes over the full state vector. Defaults to ``0``, in which case every gate is
+            applied individually.
+        inplace (bool): If ``True``, gates are applied by writing into one of two preallocated
+            state buffers rather than allocating a new state for every gate. This avoids
+            repeated allocations when simulating large numbers of qubits.
+        broadcast (bool): If ``True``, structurally identical circuits within a call to
+            :meth:`~.batch_execute` that only differ in their gate parameters are simulated
+            jointly, as a single state with a leading batch dimension. Only used in analytic
+            mode, i.e., when ``shots=None``.
+        num_threads (int): Number of threads used to apply gates and compute probabilities.
+            If larger than one, the state is split into chunks along axes not acted on by the
+            gate, which are processed in parallel. Only used for states of at least
+            16 qubits. The worker threads are shared by all devices using the same number
+            of threads. Defaults to ``1``.
     """
 
+    _parallel_min_wires = 16
+    """int: minimum number of wires for which gates are applied using multiple threads"""
+
+    _pauli_block_wires = 16
+    """int: base-2 logarithm of the number of amplitudes processed at once when computing
+    the expectation values of Pauli words"""
+
     name = "Default qubit PennyLane plugin"
     short_name = "default.qubit"
     pennylane_requires = __version__
@@ -146,11 +191,43 @@ class DefaultQubit(QubitDevice):
         "Identity",
         "Projector",
         "SparseHamiltonian",
+        "Hamiltonian",
     }
 
-    def __init__(self, wires, *, shots=None, cache=0, analytic=None):
+    def __init__(
+        self,
+        wires,
+        *,
+        shots=None,
+        cache=0,
+        analytic=None,
+        max_fused_wires=0,
+        inplace=False,
+        broadcast=False,
+        num_threads=1,
+    ):
         super().__init__(wires, shots, cache=cache, analytic=analytic)
 
+        if max_fused_wires < 0:
+            raise ValueError("The maximum number of fused wires must be a non-negative integer.")
+
+        if num_threads < 1:
+            raise ValueError("The number of threads must be a positive integer.")
+
+        self._num_threads = num_threads
+
+        self._max_fused_wires = max_fused_wires
+        self._broadcast = broadcast
+
+        # Two preallocated state buffers; gates read from the active
+        # buffer and write their result into the inactive one.
+        self._buffers = None
+
+        if inplace:
+            self._buffers = tuple(
+                np.empty([2] * self.num_wires, dtype=self.C_DTYPE) for _ in range(2)
+            )
+
         # Create the initial state. Internally, we store the
         # state as an array of dimension [2]*wires.
         self._state = self._create_basis_state(0)
@@ -170,6 +247,21 @@ class DefaultQubit(QubitDevice):
             "Toffoli": self._apply_toffoli,
         }
 
+        self._apply_ops_inplace = {
+            "PauliX": self._apply_x_inplace,
+            "PauliY": self._apply_y_inplace,
+            "PauliZ": self._apply_z_inplace,
+            "Hadamard": self._apply_hadamard_inplace,
+            "S": self._apply_s_inplace,
+            "T": self._apply_t_inplace,
+            "CNOT": functools.partial(self._apply_controlled_inplace, kernel=self._apply_x_inplace),
+            "CZ": functools.partial(self._apply_controlled_inplace, kernel=self._apply_z_inplace),
+            "Toffoli": functools.partial(
+                self._apply_controlled_inplace, kernel=self._apply_x_inplace
+            ),
+            "SWAP": self._apply_swap_inplace,
+        }
+
     @functools.lru_cache()
     def map_wires(self, wires):
         # temporarily overwrite this method to bypass
@@ -195,6 +287,9 @@ class DefaultQubit(QubitDevice):
     def apply(self, operations, rotations=None, **kwargs):
         rotations = rotations or []
 
+        if self._max_fused_wires:
+            operations = self._fuse_operations(operations)
+
         # apply the circuit operations
         for i, operation in enumerate(operations):
 
@@ -208,6 +303,8 @@ class DefaultQubit(QubitDevice):
                 self._apply_state_vector(operation.parameters[0], operation.wires)
             elif isinstance(operation, BasisState):
                 self._apply_basis_state(operation.parameters[0], operation.wires)
+            elif self._buffers is not None:
+                self._state = self._apply_operation_inplace(self._state, operation)
             else:
                 self._state = self._apply_operation(self._state, operation)
 
@@ -218,6 +315,274 @@ class DefaultQubit(QubitDevice):
         for operation in rotations:
             self._state = self._apply_operation(self._state, operation)
 
+    def batch_execute(self, circuits):
+        if not self._broadcast or self.shots is not None:
+            return super().batch_execute(circuits)
+
+        # group the circuits by their structure, preserving their order of appearance
+        groups = {}
+        for idx, circuit in enumerate(circuits):
+            key = self._broadcast_key(circuit)
+            groups.setdefault(key if key is not None else ("unsupported", idx), []).append(idx)
+
+        results = [None] * len(circuits)
+
+        for indices in groups.values():
+            if len(indices) == 1:
+                # we need to reset the device here, else it will
+                # not start the next computation in the zero state
+                self.reset()
+                results[indices[0]] = self.execute(circuits[indices[0]])
+                continue
+
+            res = self._execute_broadcast([circuits[idx] for idx in indices])
+
+            for idx, r in zip(indices, res):
+                results[idx] = r
+
+        if self.tracker.active:
+            self.tracker.update(batches=1, batch_len=len(circuits))
+            self.tracker.record()
+
+        return results
+
+    def _broadcast_key(self, circuit):
+        """Returns a hashable key describing the structure of a circuit, if the circuit can be
+        executed as part of a broadcasted batch.
+
+        Args:
+            circuit (~.tape.QuantumTape): circuit to describe
+
+        Returns:
+            tuple or None: the structure of the circuit, or ``None`` if the circuit
+            cannot be executed as part of a broadcasted batch
+        """
+        for op in circuit.operations:
+            if isinstance(op, (QubitStateVector, BasisState)):
+                return None
+
+        for m in circuit.measurements:
+            if m.return_type not in (Expectation, Variance, Probability):
+                return None
+
+            if m.obs is not None and m.obs.name in (
+                "Projector",
+                "SparseHamiltonian",
+                "Hamiltonian",
+            ):
+                return None
+
+        return self.circuit_structure(circuit)
+
+    def _execute_broadcast(self, circuits):
+        """Executes a batch of structurally identical circuits by simulating them jointly,
+        as a single state with a leading batch dimension.
+
+        Args:
+            circuits (list[~.tape.QuantumTape]): circuits that only differ in their gate
+                parameters
+
+        Returns:
+            list[array[float]]: measured value(s) for each circuit
+        """
+        circuit = circuits[0]
+        batch_size = len(circuits)
+
+        # the broadcasted statistics are always computed from the rotated state, such that
+        # the diagonalizing gates are required even for Pauli words
+        rotations = QubitDevice._validate_and_diagonalize(self, circuit)
+
+        state = np.zeros([batch_size, 2 ** self.num_wires], dtype=self.C_DTYPE)
+        state[:, 0] = 1
+        state = self._reshape(state, [batch_size] + [2] * self.num_wires)
+
+        for ops in zip(*[c.operations for c in circuits]):
+            state = self._apply_operation_broadcast(state, ops)
+
+        self._pre_rotated_state = state[-1]
+
+        # the observables, and hence the diagonalizing gates, are identical for all circuits
+        for op in rotations:
+            state = self._apply_operation_broadcast(state, [op] * batch_size)
+
+        self._state = state[-1]
+
+        prob = self._abs(state) ** 2
+        statistics = []
+
+        for m in circuit.measurements:
+            if m.return_type is Probability:
+                statistics.append(self._marginal_prob_broadcast(prob, m.wires))
+                continue
+
+            eigvals = self._asarray(m.obs.eigvals, dtype=self.R_DTYPE)
+            marginal = self._marginal_prob_broadcast(prob, m.obs.wires)
+            ev = marginal @ eigvals
+
+            if m.return_type is Variance:
+                ev = marginal @ (eigvals ** 2) - ev ** 2
+
+            statistics.append(ev)
+
+        results = [self._asarray([r[i] for r in statistics]) for i in range(batch_size)]
+
+        # increment counter for number of executions of qubit device
+        self._num_executions += batch_size
+
+        if self.tracker.active:
+            for _ in range(batch_size):
+                self.tracker.update(executions=1, shots=self._shots)
+                self.tracker.record()
+
+        return results
+
+    def _apply_operation_broadcast(self, state, operations):
+        """Applies a batch of operations, one per entry of the batch dimension, to a
+        batched state.
+
+        Args:
+            state (array[complex]): input state of shape ``(batch_size, 2, ..., 2)``
+            operations (tuple[~.Operation]): operations with identical names and wires
+
+        Returns:
+            array[complex]: output state of shape ``(batch_size, 2, ..., 2)``
+        """
+        operation = operations[0]
+        device_wires = self.map_wires(operation.wires)
+        batch_size = len(operations)
+
+        matrices = np.stack([self._get_unitary_matrix(op) for op in operations])
+        matrices = self._cast(matrices, dtype=self.C_DTYPE)
+
+        if isinstance(operation, DiagonalOperation):
+            einsum_indices = self._get_diagonal_einsum_indices(tuple(device_wires))
+            matrices = self._reshape(matrices, [batch_size] + [2] * len(device_wires))
+        else:
+            einsum_indices = self._get_einsum_indices(tuple(device_wires))
+            matrices = self._reshape(matrices, [batch_size] + [2] * len(device_wires) * 2)
+
+        # prepend an additional index for the batch dimension to all operands
+        inputs, output = einsum_indices.split("->")
+        mat_indices, state_indices = inputs.split(",")
+        batch_index = ABC[-1]
+
+        einsum_indices = "{b}{m},{b}{s}->{b}{o}".format(
+            b=batch_index, m=mat_indices, s=state_indices, o=output
+        )
+        return self._einsum(einsum_indices, matrices, state)
+
+    def _marginal_prob_broadcast(self, prob, wires):
+        """Returns the marginal probabilities of a batch of probability distributions.
+
+        Args:
+            prob (array[float]): probabilities of shape ``(batch_size, 2, ..., 2)``
+            wires (Wires): wires to return marginal probabilities for, in the
+                order in which the marginal probabilities should be returned
+
+        Returns:
+            array[float]: array of shape ``(batch_size, 2 ** len(wires))``
+        """
+        device_wires = self.map_wires(wires)
+        inactive_axes = [i + 1 for i in range(self.num_wires) if i not in device_wires]
+        prob = np.sum(prob, axis=tuple(inactive_axes))
+
+        # The remaining axes are sorted by device wire; permute them so that they
+        # correspond to the order of the wires passed.
+        ranks = np.argsort(np.argsort(device_wires))
+        prob = np.transpose(prob, [0] + [r + 1 for r in ranks])
+        return self._reshape(prob, [prob.shape[0], -1])
+
+    def _fuse_operations(self, operations):
+        """Fuses adjacent operations acting on at most ``max_fused_wires`` wires into
+        single unitary operations.
+
+        Operations are accumulated into blocks acting on disjoint sets of wires. A block is
+        only closed once a subsequent operation touching its wires would enlarge it beyond the
+        maximum number of wires, or when a state preparation is encountered. Blocks consisting
+        of a single operation are left untouched, so that the specialized gate kernels are
+        still used.
+
+        Args:
+            operations (list[~.Operation]): operations to fuse
+
+        Returns:
+            list[~.Operation]: the fused operations
+        """
+        fused_ops = []
+
+        # open blocks, as lists of [wires, operations, matrices]; the wires of
+        # different open blocks never overlap, so the blocks mutually commute
+        blocks = []
+
+        for operation in operations:
+            if isinstance(operation, (QubitStateVector, BasisState)):
+                # state preparations act as a barrier for all open blocks
+                fused_ops.extend(self._fuse_block(*block) for block in blocks)
+                fused_ops.append(operation)
+                blocks = []
+                continue
+
+            overlapping = [b for b in blocks if any(w in b[0] for w in operation.wires)]
+            blocks = [b for b in blocks if all(w not in b[0] for w in operation.wires)]
+
+            wires = [w for b in overlapping for w in b[0]]
+            wires += [w for w in operation.wires if w not in wires]
+
+            matrix = None
+
+            if len(wires) <= self._max_fused_wires:
+                try:
+                    matrix = self._get_unitary_matrix(operation)
+                except NotImplementedError:
+                    pass
+
+            if matrix is None:
+                # the operation cannot be fused; close all blocks it overlaps with
+                fused_ops.extend(self._fuse_block(*block) for block in overlapping)
+                fused_ops.append(operation)
+                continue
+
+            ops = [op for b in overlapping for op in b[1]] + [operation]
+            matrices = [mat for b in overlapping for mat in b[2]] + [matrix]
+            blocks.append([wires, ops, matrices])
+
+        fused_ops.extend(self._fuse_block(*block) for block in blocks)
+        return fused_ops
+
+    @staticmethod
+    def _fuse_block(wires, operations, matrices):
+        """Combines a block of operations into a single operation.
+
+        Args:
+            wires (list): wire labels the block acts on
+            operations (list[~.Operation]): operations in the block, in order of application
+            matrices (list[array[complex]]): matrices of the operations, or their
+                diagonals in the case of diagonal operations
+
+        Returns:
+            ~.Operation: the fused operation
+        """
+        if len(operations) == 1:
+            return operations[0]
+
+        if all(isinstance(op, DiagonalOperation) for op in operations):
+            phases = np.ones(2 ** len(wires), dtype=np.complex128)
+
+            for op, mat in zip(operations, matrices):
+                phases = phases * expand_vector(mat, op.wires, wires)
+
+            return DiagonalQubitUnitary(phases, wires=wires, do_queue=False)
+
+        unitary = np.eye(2 ** len(wires), dtype=np.complex128)
+
+        for op, mat in zip(operations, matrices):
+            if isinstance(op, DiagonalOperation):
+                mat = np.diag(mat)
+
+            unitary = expand(mat, op.wires, wires) @ unitary
+
+        return QubitUnitary(unitary, wires=wires, do_queue=False)
+
     def _apply_operation(self, state, operation):
         """Applies operations to the input state.
 
@@ -231,18 +596,115 @@ class DefaultQubit(QubitDevice):
         wires = operation.wires
 
         if operation.base_name in self._apply_ops:
-            axes = self.wires.indices(wires)
+            axes = self.map_wires(wires)
             return self._apply_ops[operation.base_name](state, axes, inverse=operation.inverse)
 
         matrix = self._get_unitary_matrix(operation)
 
         if isinstance(operation, DiagonalOperation):
-            return self._apply_diagonal_unitary(state, matrix, wires)
-        if len(wires) <= 2:
+            kernel = self._apply_diagonal_unitary
+        elif len(wires) <= 2:
             # Einsum is faster for small gates
-            return self._apply_unitary_einsum(state, matrix, wires)
+            kernel = self._apply_unitary_einsum
+        else:
+            kernel = self._apply_unitary
+
+        if self._use_threads(state):
+            return self._apply_parallel(kernel, state, matrix, wires)
+
+        return kernel(state, matrix, wires)
+
+    def _use_threads(self, state):
+        """Whether gates should be applied to the input state using multiple threads.
+
+        Args:
+            state (array[complex]): input state
+
+        Returns:
+            bool: ``True`` if multiple threads should be used
+        """
+        return (
+            self._num_threads > 1
+            and self.num_wires >= self._parallel_min_wires
+            and np.ndim(state) == self.num_wires
+        )
+
+    @functools.lru_cache()
+    def _get_chunks(self, device_wires):
+        """Returns the slices splitting the state into chunks that can be processed independently
+        by a gate acting on the given wires.
+
+        The state is split along the highest-order axes not acted on by the gate, such that
+        there is at least one chunk per thread. The sliced axes are kept with length one, so that
+        every chunk has the same number of axes as the state.
+
+        Args:
+            device_wires (tuple[int]): device wires acted on by the gate
+
+        Returns:
+            list[tuple[slice]]: slices selecting each chunk of the state
+        """
+        free_axes = [axis for axis in range(self.num_wires) if axis not in device_wires]
+        num_axes = min(len(free_axes), self._num_chunk_axes())
+
+        chunks = []
+
+        for bits in itertools.product([0, 1], repeat=num_axes):
+            idx = [slice(None)] * self.num_wires
+
+            for axis, bit in zip(free_axes, bits):
+                idx[axis] = slice(bit, bit + 1)
+
+            chunks.append(tuple(idx))
+
+        return chunks
+
+    def _num_chunk_axes(self):
+        """Number of axes along which the state is split into chunks.
 
-        return self._apply_unitary(state, matrix, wires)
+        Returns:
+            int: the number of axes, such that there is at least one chunk per thread
+        """
+        return int(np.ceil(np.log2(self._num_threads)))
+
+    def _map_chunks(self, func, device_wires):
+        """Calls a function on each chunk of the state in parallel.
+
+        Args:
+            func (callable): function accepting the slices of a chunk
+            device_wires (Sequence[int]): device wires that must not be split across chunks
+
+        Returns:
+            list: the results of the function for each chunk
+        """
+        pool = _get_thread_pool(self._num_threads)
+
+        # consume the iterator to wait for completion and propagate exceptions
+        return list(pool.map(func, self._get_chunks(tuple(device_wires))))
+
+    def _apply_parallel(self, kernel, state, matrix, wires):
+        """Applies a matrix kernel to the input state using multiple threads.
+
+        The state is split into chunks along axes not acted on by the gate, and the kernel
+        is applied to each chunk independently. Since NumPy releases the GIL for large array
+        operations, the chunks are processed concurrently.
+
+        Args:
+            kernel (callable): kernel with signature ``kernel(state, matrix, wires)``
+            state (array[complex]): input state
+            matrix (array): matrix, or diagonal of the matrix, to apply
+            wires (Wires): target wires
+
+        Returns:
+            array[complex]: output state
+        """
+        out = np.empty(np.shape(state), dtype=self.C_DTYPE)
+
+        def apply_chunk(idx):
+            out[idx] = kernel(state[idx], matrix, wires)
+
+        self._map_chunks(apply_chunk, self.map_wires(wires))
+        return out
 
     def _apply_x(self, state, axes, **kwargs):
         """Applies a PauliX gate by rolling 1 unit along the axis specified in ``axes``.
@@ -448,10 +910,17 @@ class DefaultQubit(QubitDevice):
         phase = self._conj(parameters) if inverse else parameters
         return self._stack([state[sl_0], phase * state[sl_1]], axis=axes[0])
 
+    def supports_observable(self, observable):
+        # with finite shots, the terms of a Hamiltonian are measured in separate circuits
+        if observable == "Hamiltonian" and self.shots is not None:
+            return False
+
+        return super().supports_observable(observable)
+
     def expval(self, observable, shot_range=None, bin_size=None):
         """Returns the expectation value of a Hamiltonian observable. When the observable is a
-         ``SparseHamiltonian`` object, the expectation value is computed directly for the full
-         Hamiltonian, which leads to faster execution.
+         ``SparseHamiltonian`` or ``Hamiltonian`` object, the expectation value is computed
+         directly for the full Hamiltonian, which leads to faster execution.
 
         Args:
             observable (~.Observable): a PennyLane observable
@@ -469,18 +938,154 @@ class DefaultQubit(QubitDevice):
                 raise DeviceError("SparseHamiltonian must be used with shots=None")
 
         if observable.name == "SparseHamiltonian" and self.shots is None:
+            state = self.state
+            return np.real([np.vdot(state, observable.matrix @ state)])
 
-            ev = coo_matrix.dot(
-                coo_matrix(self._conj(self.state)),
-                coo_matrix.dot(
-                    observable.matrix, coo_matrix(self.state.reshape(len(self.state), 1))
-                ),
-            )
+        if observable.name == "Hamiltonian":
+            return self._expval_hamiltonian(observable)
+
+        if self.shots is None:
+            masks = self._pauli_word_masks(observable)
 
-            return np.real(ev.toarray()[0])
+            if masks is not None:
+                return self._expval_pauli_words([masks])[0]
 
         return super().expval(observable, shot_range=shot_range, bin_size=bin_size)
 
+    def _validate_and_diagonalize(self, circuit):
+        rotations = super()._validate_and_diagonalize(circuit)
+
+        # expectation values of Pauli words and Hamiltonians are computed from the
+        # unrotated state, such that the rotations are only required for other measurements
+        if self.shots is None and all(
+            m.return_type is Expectation
+            and (m.obs.name == "Hamiltonian" or self._pauli_word_masks(m.obs) is not None)
+            for m in circuit.measurements
+        ):
+            return []
+
+        return rotations
+
+    def _pauli_word_masks(self, observable):
+        r"""Returns the bitmasks describing a Pauli word.
+
+        In the computational basis, a Pauli word :math:`P` maps the basis state
+        :math:`|i\rangle` to :math:`i^{n_Y}(-1)^{|i \wedge z|}|i \oplus x\rangle`, where
+        :math:`x` has the bits of the wires acted on by :math:`X` or :math:`Y` set,
+        :math:`z` the bits of the wires acted on by :math:`Z` or :math:`Y`, and
+        :math:`n_Y` is the number of :math:`Y` factors.
+
+        Args:
+            observable (~.Observable): observable to describe
+
+        Returns:
+            tuple[int] or None: the masks ``(x, z)`` and the number of ``PauliY`` factors,
+            or ``None`` if the observable is not a Pauli word
+        """
+        return _pauli_word_masks(observable, self.wires)
+
+    def _expval_pauli_words(self, masks):
+        r"""Returns the exact expectation values of Pauli words.
+
+        The expectation values are computed directly from the flat pre-rotated state
+        :math:`\psi` as :math:`i^{n_Y}\sum_i (-1)^{|i \wedge z|}\psi_i\psi^*_{i \oplus x}`,
+        see :meth:`_pauli_word_masks`. Words sharing the same :math:`x` mask share the
+        products of amplitudes.
+
+        Splitting the index :math:`i` into its high and low bits, the sign factorizes into
+        a sign depending on the high bits and a sign depending on the low bits. The sum is
+        thus evaluated by contracting the products, reshaped into a matrix, with the two
+        sign vectors of each word, which only have :math:`\mathcal{O}(\sqrt{2^n})` entries.
+        The state is processed in blocks of at most ``2 ** _pauli_block_wires`` amplitudes
+        sharing the values of the leading wires, such that no array of the size of the state
+        is allocated. The flipped amplitudes of each block are a permutation of another block.
+
+        Args:
+            masks (list[tuple[int]]): the masks of the Pauli words, as returned by
+                :meth:`_pauli_word_masks`
+
+        Returns:
+            list[float]: the expectation value of each Pauli word
+        """
+        state = self._reshape(self._pre_rotated_state, [2] * self.num_wires)
+
+        # each block holds the amplitudes sharing the values of the leading wires
+        block_wires = min(self.num_wires, self._pauli_block_wires)
+        num_blocks = 2 ** (self.num_wires - block_wires)
+        block_mask = 2 ** block_wires - 1
+
+        num_low = min(self.num_wires // 2, block_wires)
+        block_rows = 2 ** (block_wires - num_low)
+        low_indices = np.arange(2 ** num_low)
+        block_indices = np.arange(2 ** block_wires)
+
+        def get_block(b):
+            bits = [(b >> k) & 1 for k in reversed(range(self.num_wires - block_wires))]
+            return self._reshape(state[tuple(bits)], [-1])
+
+        groups = {}
+        for k, (x_mask, _, _) in enumerate(masks):
+            groups.setdefault(x_mask, []).append(k)
+
+        evs = [None] * len(masks)
+
+        for x_mask, words in groups.items():
+            z_masks = np.array([masks[k][1] for k in words])
+            low_signs = self._cast(1 - 2 * _parity(low_indices[:, None] & z_masks), self.C_DTYPE)
+            sums = None
+
+            for b in range(num_blocks):
+                block = get_block(b)
+
+                # the flipped amplitudes of a block are a permutation of another block
+                flipped = block if x_mask == 0 else get_block(b ^ (x_mask >> block_wires))
+                if x_mask & block_mask:
+                    flipped = self._gather(flipped, block_indices ^ (x_mask & block_mask))
+
+                products = self._reshape(block * self._conj(flipped), [block_rows, -1])
+                high_indices = b * block_rows + np.arange(block_rows)
+                high_signs = 1 - 2 * _parity(high_indices[:, None] & (z_masks >> num_low))
+
+                # contract the low bits, followed by the high bits, of all words at once
+                block_sums = self._dot(products, low_signs)
+                block_sums = self._einsum(
+                    "hk,hk->k", self._cast(high_signs, dtype=self.C_DTYPE), block_sums
+                )
+                sums = block_sums if sums is None else sums + block_sums
+
+            for j, k in enumerate(words):
+                evs[k] = self._real(1j ** masks[k][2] * sums[j])
+
+        return evs
+
+    def _expval_hamiltonian(self, hamiltonian):
+        """Returns the exact expectation value of a Hamiltonian.
+
+        The state is only prepared once for all terms. Terms that are Pauli words are
+        evaluated jointly using :meth:`_expval_pauli_words`, while any other term is applied
+        to the state and its expectation value obtained from the overlap with the state.
+
+        Args:
+            hamiltonian (~.Hamiltonian): the Hamiltonian
+
+        Returns:
+            float: the expectation value
+        """
+        masks = [self._pauli_word_masks(obs) for obs in hamiltonian.ops]
+        pauli_terms = [k for k, m in enumerate(masks) if m is not None]
+        evs = dict(zip(pauli_terms, self._expval_pauli_words([masks[k] for k in pauli_terms])))
+
+        state = self._pre_rotated_state
+        bra = self._conj(self._flatten(state))
+
+        for k, obs in enumerate(hamiltonian.ops):
+            if k not in evs:
+                ket = self._flatten(self._apply_observable(state, obs))
+                evs[k] = self._real(self._dot(bra, ket))
+
+        coeffs = self._asarray(hamiltonian.coeffs, dtype=self.R_DTYPE)
+        return self._dot(coeffs, self._stack([evs[k] for k in range(len(masks))]))
+
     def _get_unitary_matrix(self, unitary):  # pylint: disable=no-self-use
         """Return the matrix representing a unitary operation.
 
@@ -675,6 +1280,43 @@ class DefaultQubit(QubitDevice):
 
         mat = self._cast(self._reshape(mat, [2] * len(device_wires) * 2), dtype=self.C_DTYPE)
 
+        einsum_indices = self._get_einsum_indices(tuple(device_wires))
+
+        return self._einsum(einsum_indices, mat, state)
+
+    def _apply_diagonal_unitary(self, state, phases, wires):
+        r"""Apply multiplication of a phase vector to subsystems of the quantum state.
+
+        This represents the multiplication with diagonal gates in a more efficient manner.
+
+        Args:
+            state (array[complex]): input state
+            phases (array): vector to multiply
+            wires (Wires): target wires
+
+        Returns:
+            array[complex]: output state
+        """
+        # translate to wire labels used by device
+        device_wires = self.map_wires(wires)
+
+        # reshape vectors
+        phases = self._cast(self._reshape(phases, [2] * len(device_wires)), dtype=self.C_DTYPE)
+
+        einsum_indices = self._get_diagonal_einsum_indices(tuple(device_wires))
+
+        return self._einsum(einsum_indices, phases, state)
+
+    @functools.lru_cache()
+    def _get_einsum_indices(self, device_wires):
+        """Returns the einsum subscripts for applying a matrix to subsystems of the quantum state.
+
+        Args:
+            device_wires (tuple[int]): target device wires
+
+        Returns:
+            str: einsum subscripts contracting the matrix with the state
+        """
         # Tensor indices of the quantum state
         state_indices = ABC[: self.num_wires]
 
@@ -693,51 +1335,256 @@ class DefaultQubit(QubitDevice):
         )
 
         # We now put together the indices in the notation numpy's einsum requires
-        einsum_indices = (
-            "{new_indices}{affected_indices},{state_indices}->{new_state_indices}".format(
-                affected_indices=affected_indices,
-                state_indices=state_indices,
-                new_indices=new_indices,
-                new_state_indices=new_state_indices,
-            )
+        return "{new_indices}{affected_indices},{state_indices}->{new_state_indices}".format(
+            affected_indices=affected_indices,
+            state_indices=state_indices,
+            new_indices=new_indices,
+            new_state_indices=new_state_indices,
         )
 
-        return self._einsum(einsum_indices, mat, state)
+    @functools.lru_cache()
+    def _get_diagonal_einsum_indices(self, device_wires):
+        """Returns the einsum subscripts for multiplying a phase vector onto subsystems
+        of the quantum state.
 
-    def _apply_diagonal_unitary(self, state, phases, wires):
-        r"""Apply multiplication of a phase vector to subsystems of the quantum state.
+        Args:
+            device_wires (tuple[int]): target device wires
 
-        This represents the multiplication with diagonal gates in a more efficient manner.
+        Returns:
+            str: einsum subscripts multiplying the phases onto the state
+        """
+        state_indices = ABC[: self.num_wires]
+        affected_indices = "".join(ABC_ARRAY[list(device_wires)].tolist())
+
+        return "{affected_indices},{state_indices}->{state_indices}".format(
+            affected_indices=affected_indices, state_indices=state_indices
+        )
+
+    def _apply_operation_inplace(self, state, operation):
+        """Applies an operation to the input state, writing the result into the
+        preallocated state buffer that does not hold the input state.
+
+        Permutation and phase gates are applied by copying and scaling slices of the state,
+        while diagonal gates and gates acting on at most two wires are applied via ``np.einsum``
+        with an output argument. The input state itself is never modified.
 
         Args:
             state (array[complex]): input state
-            phases (array): vector to multiply
-            wires (Wires): target wires
+            operation (~.Operation): operation to apply on the device
+
+        Returns:
+            array[complex]: output state, stored in one of the state buffers
+        """
+        out = self._buffers[1] if state is self._buffers[0] else self._buffers[0]
+        device_wires = self.map_wires(operation.wires)
+
+        if operation.base_name in self._apply_ops_inplace:
+            return self._apply_ops_inplace[operation.base_name](
+                state, out, device_wires, inverse=operation.inverse
+            )
+
+        matrix = self._asarray(self._get_unitary_matrix(operation), dtype=self.C_DTYPE)
+
+        if isinstance(operation, DiagonalOperation):
+            einsum_indices = self._get_diagonal_einsum_indices(tuple(device_wires))
+            matrix = self._reshape(matrix, [2] * len(device_wires))
+            return self._einsum_inplace(einsum_indices, matrix, state, out, device_wires)
+
+        if len(device_wires) <= 2:
+            einsum_indices = self._get_einsum_indices(tuple(device_wires))
+            matrix = self._reshape(matrix, [2] * len(device_wires) * 2)
+            return self._einsum_inplace(einsum_indices, matrix, state, out, device_wires)
+
+        # For larger gates, the BLAS-backed tensordot is considerably faster than an
+        # unoptimized einsum, at the cost of a temporary copy of the state
+        out[...] = self._apply_unitary(state, matrix, operation.wires)
+        return out
+
+    def _einsum_inplace(self, einsum_indices, matrix, state, out, device_wires):
+        """Contracts a matrix with the input state, writing the result into the output buffer.
+
+        Args:
+            einsum_indices (str): einsum subscripts of the contraction
+            matrix (array[complex]): reshaped matrix, or diagonal of the matrix, to apply
+            state (array[complex]): input state
+            out (array[complex]): output buffer
+            device_wires (list[int]): target device wires
 
         Returns:
             array[complex]: output state
         """
-        # translate to wire labels used by device
-        device_wires = self.map_wires(wires)
+        if not self._use_threads(state):
+            return np.einsum(einsum_indices, matrix, state, out=out)
 
-        # reshape vectors
-        phases = self._cast(self._reshape(phases, [2] * len(device_wires)), dtype=self.C_DTYPE)
+        def apply_chunk(idx):
+            np.einsum(einsum_indices, matrix, state[idx], out=out[idx])
 
-        state_indices = ABC[: self.num_wires]
-        affected_indices = "".join(ABC_ARRAY[list(device_wires)].tolist())
+        self._map_chunks(apply_chunk, device_wires)
+        return out
 
-        einsum_indices = "{affected_indices},{state_indices}->{state_indices}".format(
-            affected_indices=affected_indices, state_indices=state_indices
-        )
+    @staticmethod
+    def _apply_x_inplace(state, out, axes, **kwargs):
+        """Applies a PauliX gate by copying the slices along the axis specified in ``axes``
+        into the opposite slices of the output buffer.
 
-        return self._einsum(einsum_indices, phases, state)
+        Args:
+            state (array[complex]): input state
+            out (array[complex]): output buffer
+            axes (List[int]): target axes to apply transformation
+
+        Returns:
+            array[complex]: output state
+        """
+        sl_0 = _get_slice(0, axes[0], state.ndim)
+        sl_1 = _get_slice(1, axes[0], state.ndim)
+
+        out[sl_0] = state[sl_1]
+        out[sl_1] = state[sl_0]
+        return out
+
+    @staticmethod
+    def _apply_y_inplace(state, out, axes, **kwargs):
+        """Applies a PauliY gate by writing the phased and swapped slices along the axis
+        specified in ``axes`` into the output buffer.
+
+        Args:
+            state (array[complex]): input state
+            out (array[complex]): output buffer
+            axes (List[int]): target axes to apply transformation
+
+        Returns:
+            array[complex]: output state
+        """
+        sl_0 = _get_slice(0, axes[0], state.ndim)
+        sl_1 = _get_slice(1, axes[0], state.ndim)
+
+        np.multiply(state[sl_1], -1j, out=out[sl_0])
+        np.multiply(state[sl_0], 1j, out=out[sl_1])
+        return out
+
+    def _apply_z_inplace(self, state, out, axes, **kwargs):
+        """Applies a PauliZ gate by negating the 1 index along the axis specified in ``axes``.
+
+        Args:
+            state (array[complex]): input state
+            out (array[complex]): output buffer
+            axes (List[int]): target axes to apply transformation
+
+        Returns:
+            array[complex]: output state
+        """
+        return self._apply_phase_inplace(state, out, axes, -1)
+
+    @staticmethod
+    def _apply_hadamard_inplace(state, out, axes, **kwargs):
+        """Applies the Hadamard gate by writing the sum and difference of the slices along
+        the axis specified in ``axes`` into the output buffer.
+
+        Args:
+            state (array[complex]): input state
+            out (array[complex]): output buffer
+            axes (List[int]): target axes to apply transformation
+
+        Returns:
+            array[complex]: output state
+        """
+        sl_0 = _get_slice(0, axes[0], state.ndim)
+        sl_1 = _get_slice(1, axes[0], state.ndim)
+
+        np.add(state[sl_0], state[sl_1], out=out[sl_0])
+        np.subtract(state[sl_0], state[sl_1], out=out[sl_1])
+        out *= SQRT2INV
+        return out
+
+    def _apply_s_inplace(self, state, out, axes, inverse=False):
+        return self._apply_phase_inplace(state, out, axes, 1j, inverse)
+
+    def _apply_t_inplace(self, state, out, axes, inverse=False):
+        return self._apply_phase_inplace(state, out, axes, TPHASE, inverse)
+
+    @staticmethod
+    def _apply_phase_inplace(state, out, axes, parameters, inverse=False):
+        """Applies a phase onto the 1 index along the axis specified in ``axes``,
+        writing the result into the output buffer.
+
+        Args:
+            state (array[complex]): input state
+            out (array[complex]): output buffer
+            axes (List[int]): target axes to apply transformation
+            parameters (float): phase to apply
+            inverse (bool): whether to apply the inverse phase
+
+        Returns:
+            array[complex]: output state
+        """
+        sl_0 = _get_slice(0, axes[0], state.ndim)
+        sl_1 = _get_slice(1, axes[0], state.ndim)
+
+        phase = np.conj(parameters) if inverse else parameters
+
+        out[sl_0] = state[sl_0]
+        np.multiply(state[sl_1], phase, out=out[sl_1])
+        return out
+
+    @staticmethod
+    def _apply_controlled_inplace(state, out, axes, kernel, **kwargs):
+        """Applies a controlled gate by copying the state into the output buffer, and then
+        applying the target kernel to the slice in which all control qubits are in the
+        :math:`|1\rangle` state.
+
+        Args:
+            state (array[complex]): input state
+            out (array[complex]): output buffer
+            axes (List[int]): control axes followed by the target axis
+            kernel (callable): in-place kernel of the target operation
+
+        Returns:
+            array[complex]: output state
+        """
+        out[...] = state
+
+        idx = [slice(None)] * state.ndim
+        for axis in axes[:-1]:
+            idx[axis] = 1
+        idx = tuple(idx)
+
+        # slicing removes the control axes, shifting the target axis down
+        # by the number of controls that precede it
+        target = axes[-1] - sum(axis < axes[-1] for axis in axes[:-1])
+        kernel(state[idx], out[idx], [target])
+        return out
+
+    @staticmethod
+    def _apply_swap_inplace(state, out, axes, **kwargs):
+        """Applies a SWAP gate by copying a partial transposition of the state into
+        the output buffer.
+
+        Args:
+            state (array[complex]): input state
+            out (array[complex]): output buffer
+            axes (List[int]): target axes to apply transformation
+
+        Returns:
+            array[complex]: output state
+        """
+        all_axes = list(range(state.ndim))
+        all_axes[axes[0]] = axes[1]
+        all_axes[axes[1]] = axes[0]
+        out[...] = np.transpose(state, all_axes)
+        return out
 
     def reset(self):
         """Reset the device"""
         super().reset()
 
         # init the state vector to |00..0>
-        self._state = self._create_basis_state(0)
+        if self._buffers is not None:
+            self._state = self._buffers[0]
+            self._state.fill(0)
+            self._state.flat[0] = 1
+        else:
+            self._state = self._create_basis_state(0)
+
         self._pre_rotated_state = self._state
 
     def analytic_probability(self, wires=None):
@@ -745,5 +1592,15 @@ class DefaultQubit(QubitDevice):
         if self._state is None:
             return None
 
+        if self._use_threads(self._state):
+            prob = np.empty(np.shape(self._state), dtype=self.R_DTYPE)
+
+            def compute_chunk(idx):
+                np.abs(self._state[idx], out=prob[idx])
+                np.square(prob[idx], out=prob[idx])
+
+            self._map_chunks(compute_chunk, [])
+            return self.marginal_prob(self._flatten(prob), wires)
+
         prob = self.marginal_prob(self._abs(self._flatten(self._state)) ** 2, wires)
         return prob
@@ -119,6 +119,7 @@ class DefaultQubitAutograd(DefaultQubit):
     _tensordot = staticmethod(np.tensordot)
     _conj = staticmethod(np.conj)
     _imag = staticmethod(np.imag)
+    _real = staticmethod(np.real)
     _roll = staticmethod(np.roll)
     _stack = staticmethod(np.stack)
 
@@ -176,6 +176,7 @@ class DefaultQubitJax(DefaultQubit):
     )
     _conj = staticmethod(jnp.conj)
     _imag = staticmethod(jnp.imag)
+    _real = staticmethod(jnp.real)
     _roll = staticmethod(jnp.roll)
     _stack = staticmethod(jnp.stack)
 
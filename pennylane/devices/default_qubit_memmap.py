@@ -0,0 +1,222 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""This module contains a disk-backed version of the :class:`~.DefaultQubit`
+reference plugin, for simulating states that do not fit into memory.
+"""
+import functools
+import tempfile
+
+import numpy as np
+
+from pennylane.devices import DefaultQubit
+from pennylane.wires import Wires
+
+
+class DefaultQubitMemmap(DefaultQubit):
+    """Simulator plugin based on ``"default.qubit"``, storing the state in memory-mapped files.
+
+    **Short name:** ``default.qubit.memmap``
+
+    The statevector of a circuit with :math:`n` qubits requires :math:`2^{n+4}` bytes of memory,
+    which exceeds the memory of most machines beyond 30 qubits. This device stores the state
+    in a :class:`numpy.memmap` backed by a temporary file on disk, such that only a chunk of the
+    state is held in memory at any time.
+
+    Gates are applied chunk by chunk: the state is split along the highest-order axes not acted
+    on by the gate, so that every chunk can be updated independently and is streamed
+    sequentially from and to disk. The result is written into a second file, and the two files
+    alternate roles between gates. A third file is created if the circuit requires basis
+    rotations before measurement, in order to preserve the pre-rotated state.
+
+    **Example**
+
+    >>> dev = qml.device("default.qubit.memmap", wires=32, directory="/scratch")
+    >>> @qml.qnode(dev)
+    ... def circuit(x):
+    ...     qml.RX(x, wires=0)
+    ...     qml.CNOT(wires=[0, 31])
+    ...     return qml.expval(qml.PauliZ(31))
+
+    Expectation values are computed from the chunked marginal probabilities after rotating the
+    state into the eigenbasis of the observables, including for Pauli words. Hamiltonians are
+    not supported natively, such that QNodes measure their terms in separate circuits.
+
+    .. note::
+
+        Only the gate application and the computation of marginal probabilities are chunked.
+        Accessing the full state, sampling, ``SparseHamiltonian`` observables, and other
+        operations requiring the probabilities of all wires still allocate arrays of size
+        :math:`2^n` in memory.
+
+    Args:
+        wires (int, Iterable[Number, str]): Number of subsystems represented by the device,
+            or iterable that contains unique labels for the subsystems as numbers (i.e., ``[-1, 0, 2]``)
+            or strings (``['ancilla', 'q1', 'q2']``). Default 1 if not specified.
+        shots (None, int): How many times the circuit should be evaluated (or sampled) to estimate
+            the expectation values. Defaults to ``None`` if not specified, which means that the device
+            returns analytical results.
+        cache (int): Number of device executions to store in a cache to speed up subsequent
+            executions. A value of ``0`` indicates that no caching will take place. Once filled,
+            older elements of the cache are removed and replaced with the most recent device
+            executions to keep the cache up to date.
+        analytic (bool): Indicates if the device should calculate expectations
+            and variances analytically. In non-analytic mode, the ``diff_method="backprop"``
+            QNode differentiation method is not supported.
+        max_fused_wires (int): Maximum number of wires a fused gate may act on.
+            See :class:`~.DefaultQubit`.
+        num_threads (int): Number of threads used to process chunks concurrently.
+            Each thread holds one chunk in memory.
+        chunk_wires (int): Base-2 logarithm of the maximum number of amplitudes in a chunk.
+            Defaults to ``24``, i.e., chunks of 256 MB.
+        directory (str): Directory in which the temporary files are created. Defaults to the
+            system temporary directory.
+    """
+
+    name = "Default qubit (memory-mapped) PennyLane plugin"
+    short_name = "default.qubit.memmap"
+
+    def __init__(
+        self,
+        wires,
+        *,
+        shots=None,
+        cache=0,
+        analytic=None,
+        max_fused_wires=0,
+        num_threads=1,
+        chunk_wires=24,
+        directory=None,
+    ):
+        if chunk_wires < 1:
+            raise ValueError("The number of chunk wires must be a positive integer.")
+
+        self._chunk_wires = chunk_wires
+        self._directory = directory
+
+        # memory-mapped state buffers, created when first needed
+        self._memmaps = []
+
+        super().__init__(
+            wires,
+            shots=shots,
+            cache=cache,
+            analytic=analytic,
+            max_fused_wires=max_fused_wires,
+            num_threads=num_threads,
+        )
+
+    @classmethod
+    def capabilities(cls):
+        capabilities = super().capabilities().copy()
+
+        # backpropagation would require the full state in memory
+        capabilities.pop("passthru_devices", None)
+        return capabilities
+
+    def supports_observable(self, observable):
+        # the native expectation value of Hamiltonians applies the terms to the full state
+        if observable == "Hamiltonian":
+            return False
+
+        return super().supports_observable(observable)
+
+    def _pauli_word_masks(self, observable):
+        # measure Pauli words in their eigenbasis using the chunked probabilities, rather
+        # than evaluating them from the pre-rotated state
+        return None
+
+    def _output_buffer(self, *exclude):
+        """Returns a memory-mapped buffer that does not hold any of the given states.
+
+        Args:
+            *exclude (array[complex]): states that must not be overwritten
+
+        Returns:
+            numpy.memmap: the buffer
+        """
+        for buffer in self._memmaps:
+            if not any(s is not None and np.may_share_memory(buffer, s) for s in exclude):
+                return buffer
+
+        file = tempfile.TemporaryFile(dir=self._directory)
+        buffer = np.memmap(file, dtype=self.C_DTYPE, mode="w+", shape=(2,) * self.num_wires)
+        self._memmaps.append(buffer)
+        return buffer
+
+    def _create_basis_state(self, index):
+        state = self._output_buffer()
+        state.fill(0)
+        state.flat[index] = 1
+        return state
+
+    def _scatter(self, indices, array, new_dimensions):
+        state = self._output_buffer()
+        state.fill(0)
+        state.reshape(new_dimensions)[indices] = array
+        return state
+
+    def apply(self, operations, rotations=None, **kwargs):
+        # the pre-rotated state of the previous execution can be overwritten
+        self._pre_rotated_state = None
+        super().apply(operations, rotations=rotations, **kwargs)
+
+    def _use_threads(self, state):
+        # chunks are already processed concurrently by _apply_operation
+        return False
+
+    def _num_chunk_axes(self):
+        return max(self.num_wires - self._chunk_wires, super()._num_chunk_axes())
+
+    def _apply_operation(self, state, operation):
+        """Applies operations to the input state chunk by chunk.
+
+        Args:
+            state (array[complex]): input state
+            operation (~.Operation): operation to apply on the device
+
+        Returns:
+            numpy.memmap: output state
+        """
+        if operation.base_name == "Identity":
+            return state
+
+        out = self._output_buffer(state, self._pre_rotated_state)
+        apply_operation = functools.partial(DefaultQubit._apply_operation, self)
+
+        def apply_chunk(idx):
+            out[idx] = apply_operation(np.asarray(state[idx]), operation)
+
+        self._map_chunks(apply_chunk, self.map_wires(operation.wires))
+        return out
+
+    def analytic_probability(self, wires=None):
+        if self._state is None:
+            return None
+
+        wires = self.wires if wires is None else Wires(wires)
+        device_wires = self.map_wires(wires)
+        inactive_axes = tuple(a for a in range(self.num_wires) if a not in device_wires)
+        state = self._state
+
+        def compute_chunk(idx):
+            return np.sum(np.abs(np.asarray(state[idx])) ** 2, axis=inactive_axes)
+
+        # the remaining axes correspond to the device wires in ascending order
+        prob = np.ravel(sum(self._map_chunks(compute_chunk, device_wires)))
+
+        # permute the probabilities in the same way as marginal_prob
+        basis_states = self.generate_basis_states(len(device_wires))
+        basis_states = basis_states[:, np.argsort(np.argsort(device_wires))]
+        perm = basis_states @ 2 ** np.arange(len(device_wires))[::-1]
+        return prob[perm]
@@ -167,6 +167,7 @@ class DefaultQubitTF(DefaultQubit):
     _tensordot = staticmethod(tf.tensordot)
     _conj = staticmethod(tf.math.conj)
     _imag = staticmethod(tf.math.imag)
+    _real = staticmethod(tf.math.real)
     _roll = staticmethod(tf.roll)
     _stack = staticmethod(tf.stack)
 
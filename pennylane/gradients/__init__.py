@@ -17,7 +17,16 @@ import pennylane as qml
 from . import finite_difference
 from . import parameter_shift
 from . import parameter_shift_cv
+from . import parameter_shift_hessian
+from . import spsa
 
-from .finite_difference import finite_diff, finite_diff_coeffs, generate_shifted_tapes
+from .finite_difference import (
+    deduplicate_tapes,
+    finite_diff,
+    finite_diff_coeffs,
+    generate_shifted_tapes,
+)
 from .parameter_shift import param_shift
 from .parameter_shift_cv import param_shift_cv
+from .parameter_shift_hessian import param_shift_hessian
+from .spsa import spsa_grad
@@ -179,6 +179,48 @@ def generate_shifted_tapes(tape, idx, shifts, multipliers=None):
     return tapes
 
 
+def deduplicate_tapes(tapes):
+    r"""Removes duplicate tapes from a list of tapes.
+
+    Two tapes are duplicates if they have the same :attr:`~.QuantumTape.hash`, that is,
+    if they apply the same operations with the same parameters, and perform the same
+    measurements. Gradient recipes frequently generate such tapes, for instance when the
+    unshifted tape is required by several recipes, or when shifted parameters coincide.
+
+    Args:
+        tapes (Sequence[.QuantumTape]): quantum tapes
+
+    Returns:
+        tuple[list[QuantumTape], list[int]]: The distinct tapes, in the order of their first
+        occurrence, and for each input tape the index of the corresponding distinct tape.
+        The results of the input tapes can be recovered from the results of the distinct tapes
+        via ``[results[i] for i in indices]``.
+
+    **Example**
+
+    >>> with qml.tape.QuantumTape() as tape:
+    ...     qml.RX(0.5, wires=0)
+    ...     qml.expval(qml.PauliZ(0))
+    >>> tapes = [tape, tape.copy(copy_operations=True), tape]
+    >>> unique_tapes, indices = deduplicate_tapes(tapes)
+    >>> len(unique_tapes), indices
+    (1, [0, 0, 0])
+    """
+    unique_tapes = []
+    indices = []
+    tape_indices = {}
+
+    for tape in tapes:
+        idx = tape_indices.setdefault(tape.hash, len(unique_tapes))
+
+        if idx == len(unique_tapes):
+            unique_tapes.append(tape)
+
+        indices.append(idx)
+
+    return unique_tapes, indices
+
+
 def finite_diff(tape, argnum=None, h=1e-7, approx_order=1, n=1, strategy="forward", f0=None):
     r"""Generate the finite-difference tapes and postprocessing methods required
     to compute the gradient of a gate parameter with respect to its outputs.
@@ -20,7 +20,7 @@ import numpy as np
 
 import pennylane as qml
 
-from .finite_difference import finite_diff, generate_shifted_tapes
+from .finite_difference import deduplicate_tapes, finite_diff, generate_shifted_tapes
 
 
 NONINVOLUTORY_OBS = {
@@ -505,12 +505,21 @@ def param_shift(
         # If there are unsupported parameters, we must process
         # the quantum results separately, once for the fallback
         # function and once for the parameter-shift rule, and recombine.
+        shift_fn = fn
 
-        def processing_fn(results):
+        def fn(results):
             unsupported_grads = fallback_proc_fn(results[:fallback_len])
-            supported_grads = fn(results[fallback_len:])
+            supported_grads = shift_fn(results[fallback_len:])
             return unsupported_grads + supported_grads
 
-        return gradient_tapes, processing_fn
+    # Execute each distinct circuit only once; for instance, the unshifted
+    # tape may be required by both the fallback function and the variance rule
+    unique_tapes, indices = deduplicate_tapes(gradient_tapes)
 
-    return gradient_tapes, fn
+    if len(unique_tapes) == len(gradient_tapes):
+        return gradient_tapes, fn
+
+    def processing_fn(results):
+        return fn([results[i] for i in indices])
+
+    return unique_tapes, processing_fn
@@ -0,0 +1,204 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+This module contains functions for computing the parameter-shift Hessian
+of a qubit-based quantum tape.
+"""
+# pylint: disable=protected-access
+import itertools
+
+import numpy as np
+
+import pennylane as qml
+
+from .parameter_shift import _get_operation_recipe, _gradient_analysis, _process_gradient_recipe
+
+
+def _is_two_term_recipe(recipe):
+    """Returns whether a processed gradient recipe is the two-term parameter-shift
+    rule of a parameter with frequency one, such as the parameter of a Pauli rotation.
+    The expectation values are :math:`2\\pi`-periodic in such a parameter."""
+    coeffs, multipliers, shifts = recipe
+
+    if len(coeffs) != 2 or not np.allclose(multipliers, 1) or shifts[0] != -shifts[1]:
+        return False
+
+    return np.allclose(coeffs * np.sign(shifts), 0.5 / np.sin(np.abs(shifts[0])))
+
+
+def _flatten_result(result):
+    """Flattens the result of an evaluated tape into a vector."""
+    # The following is for backwards compatibility; currently,
+    # the device stacks multiple measurement arrays, even if not the same
+    # size, resulting in a ragged array.
+    if hasattr(result, "dtype") and result.dtype is np.dtype("object"):
+        return qml.math.hstack(result)
+
+    return qml.math.reshape(result, [-1])
+
+
+def param_shift_hessian(tape, argnum=None, shift=np.pi / 2, f0=None):
+    r"""Generate the parameter-shift tapes and postprocessing method required to
+    compute the Hessian of a qubit-based tape with respect to its trainable parameters.
+
+    The second derivative with respect to the parameters :math:`i` and :math:`j` is
+    obtained by applying the parameter-shift rules of both parameters in succession,
+
+    .. math::
+
+        \frac{\partial^2 f}{\partial x_i \partial x_j}
+        = \sum_{k, l} c_k c_l f(x + s_k e_i + s_l e_j).
+
+    All shifted tapes required by the entries of the Hessian are generated as a
+    single batch, and each distinct tape is only generated once:
+
+    * Due to the symmetry of the Hessian, only the entries :math:`i\leq j` are computed.
+
+    * The unshifted tape arising in all diagonal entries is shared, and is not
+      generated if ``f0`` is provided.
+
+    * For parameters with the two-term parameter-shift rule, such as the parameters of
+      Pauli rotations, the expectation values are :math:`2\pi`-periodic, and the shifts
+      :math:`\pm\pi` of the diagonal entries coincide.
+
+    For :math:`p` parameters with the two-term rule, :math:`2p(p-1)+p+1` tapes
+    are generated, compared to :math:`2p(p-1)+2p` tapes when computing each entry
+    separately.
+
+    Args:
+        tape (.QuantumTape): quantum tape to differentiate
+        argnum (int or list[int] or None): Trainable parameter indices to differentiate
+            with respect to. If not provided, the derivatives with respect to all
+            trainable indices are returned.
+        shift (float): The shift value to use for the two-term parameter-shift formula.
+        f0 (tensor_like[float] or None): Output of the evaluated input tape. If provided,
+            this value is used for the unshifted term, saving a quantum evaluation.
+
+    Returns:
+        tuple[list[QuantumTape], function]: A tuple containing a
+        list of generated tapes, in addition to a post-processing
+        function to be applied to the results of the evaluated tapes.
+
+    **Example**
+
+    >>> with qml.tape.JacobianTape() as tape:
+    ...     qml.RX(0.1, wires=0)
+    ...     qml.RY(0.2, wires=0)
+    ...     qml.RX(0.3, wires=0)
+    ...     qml.expval(qml.PauliZ(0))
+    >>> hessian_tapes, fn = qml.gradients.param_shift_hessian(tape)
+    >>> len(hessian_tapes)
+    16
+    >>> fn(dev.batch_execute(hessian_tapes))
+    [[[-0.902113    0.01894799 -0.92164909]
+      [ 0.01894799 -0.9316158   0.05841749]
+      [-0.92164909  0.05841749 -0.902113  ]]]
+
+    The output Hessian is of size ``(number_outputs, number_parameters, number_parameters)``.
+    """
+    if any(m.return_type is qml.operation.State for m in tape.measurements):
+        raise ValueError(
+            "Computing the Hessian of circuits that return the state is not supported."
+        )
+
+    if any(m.return_type is qml.operation.Variance for m in tape.measurements):
+        raise ValueError(
+            "Computing the Hessian of circuits that return variances is not supported."
+        )
+
+    _gradient_analysis(tape)
+
+    # TODO: replace the JacobianTape._grad_method_validation
+    # functionality before deprecation.
+    diff_methods = tape._grad_method_validation("analytic")
+    num_params = len(tape.trainable_params)
+
+    if not tape.trainable_params or all(g == "0" for g in diff_methods):
+        # Either all parameters have grad method 0, or there are no trainable
+        # parameters.
+        return [], lambda x: np.zeros([tape.output_dim, num_params, num_params])
+
+    # TODO: replace the JacobianTape._choose_params_with_methods
+    # functionality before deprecation.
+    method_map = dict(tape._choose_params_with_methods(diff_methods, argnum))
+    indices = [i for i in range(num_params) if method_map.get(i, "0") != "0"]
+
+    recipes = {}
+    periodic = set()
+
+    for i in indices:
+        recipe = _process_gradient_recipe(_get_operation_recipe(tape, i, shift=shift))
+
+        if not np.allclose(recipe[1], 1):
+            raise ValueError(
+                "The parameter-shift Hessian does not support gradient recipes with multipliers."
+            )
+
+        recipes[i] = list(zip(recipe[0], recipe[2]))
+
+        if _is_two_term_recipe(recipe):
+            periodic.add(i)
+
+    params = list(tape.get_parameters())
+    gradient_tapes = []
+
+    # map from the shifts of a tape to its index in gradient_tapes; the index
+    # of the unshifted tape is None if f0 is provided
+    tape_indices = {(): None} if f0 is not None else {}
+
+    # linear combinations of tape indices for each computed entry of the Hessian
+    entries = {}
+
+    for i, j in itertools.combinations_with_replacement(indices, 2):
+        terms = []
+
+        for (c1, s1), (c2, s2) in itertools.product(recipes[i], recipes[j]):
+            shifts = {i: s1 + s2} if i == j else {i: s1, j: s2}
+
+            for k in periodic.intersection(shifts):
+                # map the shifts of periodic parameters to the interval [-pi, pi)
+                shifts[k] = (shifts[k] + np.pi) % (2 * np.pi) - np.pi
+
+            key = tuple((k, np.round(s, 10)) for k, s in sorted(shifts.items()) if np.round(s, 10))
+
+            if key not in tape_indices:
+                new_params = params.copy()
+
+                for k, s in shifts.items():
+                    new_params[k] = new_params[k] + qml.math.convert_like(s, new_params[k])
+
+                shifted_tape = tape.copy(copy_operations=True)
+                shifted_tape.set_parameters(new_params)
+
+                tape_indices[key] = len(gradient_tapes)
+                gradient_tapes.append(shifted_tape)
+
+            terms.append((c1 * c2, tape_indices[key]))
+
+        entries[(i, j)] = terms
+
+    def processing_fn(results):
+        results = [_flatten_result(r) for r in results]
+        r0 = _flatten_result(qml.math.convert_like(f0, results[0])) if f0 is not None else None
+        zero = qml.math.zeros_like(results[0])
+        hessian = [[zero] * num_params for _ in range(num_params)]
+
+        for (i, j), terms in entries.items():
+            h = sum([c * (r0 if k is None else results[k]) for c, k in terms])
+            hessian[i][j] = hessian[j][i] = h
+
+        hessian = qml.math.stack([qml.math.stack(row) for row in hessian])
+        return qml.math.transpose(hessian, [2, 0, 1])
+
+    return gradient_tapes, processing_fn
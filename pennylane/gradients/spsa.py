@@ -0,0 +1,205 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+This module contains functions for computing the simultaneous perturbation
+stochastic approximation (SPSA) of the gradient of a quantum tape.
+"""
+# pylint: disable=protected-access,too-many-arguments
+import numpy as np
+
+import pennylane as qml
+
+from .finite_difference import finite_diff_coeffs
+
+
+def rademacher_directions(num_directions, num_params, rng=None):
+    r"""Sample random perturbation directions with independent entries
+    :math:`\pm 1`, each with probability :math:`1/2`.
+
+    Args:
+        num_directions (int): number of directions to sample
+        num_params (int): number of parameters perturbed by each direction
+        rng (None or int or numpy.random.Generator): random number generator,
+            or seed used to create one
+
+    Returns:
+        array[int]: array of shape ``(num_directions, num_params)``
+
+    **Example**
+
+    >>> qml.gradients.spsa.rademacher_directions(2, 3, rng=42)
+    array([[-1,  1,  1],
+           [-1, -1,  1]])
+    """
+    rng = np.random.default_rng(rng)
+    return 2 * rng.integers(2, size=(num_directions, num_params)) - 1
+
+
+def spsa_grad(
+    tape,
+    argnum=None,
+    h=1e-2,
+    approx_order=2,
+    strategy="center",
+    num_directions=1,
+    sampler_rng=None,
+    f0=None,
+):
+    r"""Generate the simultaneous perturbation stochastic approximation (SPSA) tapes
+    and postprocessing methods required to estimate the gradient of a gate parameter
+    with respect to its outputs.
+
+    Rather than shifting one parameter at a time, SPSA shifts all trainable parameters
+    simultaneously along a random direction :math:`\Delta` with entries :math:`\pm 1`,
+    and estimates the gradient from the finite-difference derivative along this direction:
+
+    .. math::
+
+        \widehat{\nabla f}(x) = \frac{f(x+h\Delta)-f(x-h\Delta)}{2h} \Delta^{-1},
+
+    where :math:`\Delta^{-1}` is the element-wise inverse of :math:`\Delta`. The estimate is
+    unbiased up to the finite-difference error, and its variance is reduced by averaging
+    over ``num_directions`` independent directions. The number of generated tapes is
+    independent of the number of parameters.
+
+    Args:
+        tape (.QuantumTape): quantum tape to differentiate
+        argnum (int or list[int] or None): Trainable parameter indices to differentiate
+            with respect to. If not provided, the derivatives with respect to all
+            trainable indices are returned. Only these parameters are perturbed.
+        h (float): finite difference step size along each direction. Larger than the
+            default step size of :func:`~.finite_diff`, since SPSA is mostly used
+            with a finite number of shots.
+        approx_order (int): The approximation order of the finite-difference method
+            used along each direction.
+        strategy (str): The strategy of the finite difference method. Must be one of
+            ``"forward"``, ``"center"``, or ``"backward"``. See :func:`~.finite_diff`
+            for details.
+        num_directions (int): number of random directions averaged over
+        sampler_rng (None or int or numpy.random.Generator): random number generator
+            used to sample the directions, or seed used to create one. Note that passing
+            the same seed for every gradient evaluation results in the same directions.
+        f0 (tensor_like[float] or None): Output of the evaluated input tape. If provided,
+            and the gradient recipe contains an unshifted term, this value is used,
+            saving a quantum evaluation.
+
+    Returns:
+        tuple[list[QuantumTape], function]: A tuple containing a
+        list of generated tapes, in addition to a post-processing
+        function to be applied to the evaluated tapes.
+
+    **Example**
+
+    >>> with qml.tape.JacobianTape() as tape:
+    ...     qml.RX(params[0], wires=0)
+    ...     qml.RY(params[1], wires=0)
+    ...     qml.RX(params[2], wires=0)
+    ...     qml.expval(qml.PauliZ(0))
+    ...     qml.var(qml.PauliZ(0))
+    >>> tape.trainable_params = {0, 1, 2}
+    >>> gradient_tapes, fn = qml.gradients.spsa_grad(tape, num_directions=3, sampler_rng=42)
+    >>> len(gradient_tapes)
+    6
+    >>> res = dev.batch_execute(gradient_tapes)
+    >>> fn(res)
+    [[-0.19670553  0.06817561 -0.19141269]
+     [ 0.35480815 -0.1229236   0.34526112]]
+
+    The output Jacobian matrix is of size ``(number_outputs, number_parameters)``.
+    Its expectation value over the random directions is the gradient computed by
+    :func:`~.finite_diff`.
+    """
+    # TODO: replace the JacobianTape._grad_method_validation
+    # functionality before deprecation.
+    diff_methods = tape._grad_method_validation("numeric")
+
+    if not tape.trainable_params or all(g == "0" for g in diff_methods):
+        # Either all parameters have grad method 0, or there are no trainable
+        # parameters.
+        return [], lambda x: np.zeros([tape.output_dim, len(tape.trainable_params)])
+
+    # TODO: replace the JacobianTape._choose_params_with_methods
+    # functionality before deprecation.
+    method_map = dict(tape._choose_params_with_methods(diff_methods, argnum))
+    indices = [i for i, _ in enumerate(tape.trainable_params) if method_map.get(i, "0") != "0"]
+
+    gradient_tapes = []
+    c0 = None
+
+    coeffs, shifts = finite_diff_coeffs(n=1, approx_order=approx_order, strategy=strategy)
+
+    if 0 in shifts:
+        # Finite difference formula includes a term with zero shift, which
+        # is shared by all directions.
+
+        if f0 is None:
+            gradient_tapes.append(tape)
+
+        c0 = coeffs[0]
+        shifts = shifts[1:]
+        coeffs = coeffs[1:]
+
+    directions = rademacher_directions(num_directions, len(indices), rng=sampler_rng)
+    params = list(tape.get_parameters())
+
+    for direction in directions:
+        for s in shifts:
+            new_params = params.copy()
+
+            for i, d in zip(indices, direction):
+                new_params[i] = new_params[i] + qml.math.convert_like(s * h * d, new_params[i])
+
+            shifted_tape = tape.copy(copy_operations=True)
+            shifted_tape.set_parameters(new_params)
+            gradient_tapes.append(shifted_tape)
+
+    def processing_fn(results):
+        start = 1 if c0 is not None and f0 is None else 0
+        r0 = results[0] if f0 is None else f0
+        grads = [None] * len(tape.trainable_params)
+
+        for direction in directions:
+            res = results[start : start + len(shifts)]
+            start = start + len(shifts)
+
+            # compute the derivative along the direction
+            res = qml.math.stack(res)
+            g = sum([c * r for c, r in zip(coeffs, res)])
+
+            if c0 is not None:
+                # add on the unshifted term
+                g = g + c0 * r0
+
+            g = g / (h * num_directions)
+
+            # the inverse of each entry of a Rademacher direction is the entry itself
+            for i, d in zip(indices, direction):
+                grads[i] = g * d if grads[i] is None else grads[i] + g * d
+
+        for i, g in enumerate(grads):
+            if g is None:
+                # parameter has zero gradient
+                grads[i] = qml.math.zeros_like(results[0])
+
+        # The following is for backwards compatibility; currently,
+        # the device stacks multiple measurement arrays, even if not the same
+        # size, resulting in a ragged array.
+        for i, g in enumerate(grads):
+            g = qml.math.convert_like(g, results[0])
+            if hasattr(g, "dtype") and g.dtype is np.dtype("object"):
+                grads[i] = qml.math.hstack(g)
+
+        return qml.math.T(qml.math.stack(grads))
+
+    return gradient_tapes, processing_fn
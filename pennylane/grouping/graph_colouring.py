@@ -28,8 +28,10 @@ corresponding Pauli words. The graph-colouring problem is to assign a colour to
 each vertex such that no vertices of the same colour are connected, using the
 fewest number of colours (lowest "chromatic number") as possible.
 """
-
 import numpy as np
+import scipy.sparse
+
+from pennylane.grouping.utils import _complement_adj_packed, _pack_binary
 
 
 def largest_first(binary_observables, adj):
@@ -144,3 +146,119 @@ def recursive_largest_first(binary_observables, adj):  # pylint:disable=too-many
         coloured |= set(indices)
         uncoloured = set(np.arange(n_terms)) - coloured
     return colours
+
+
+def dsatur(binary_observables, adj):
+    """Performs graph-colouring using the DSATUR heuristic, which colours the vertex with the
+    largest number of distinct colours among its neighbours (saturation degree) first, breaking
+    ties by the degree. The graph is traversed through its adjacency lists, and the colours of
+    the neighbours of each vertex are tracked in a boolean matrix, such that runtime is
+    :math:`O(V^2 + E)` for :math:`V` vertices and :math:`E` edges with vectorized operations.
+
+    Args:
+        binary_observables (array[int]): the set of Pauli words represented by a column matrix
+            of the Pauli words in binary vector represenation
+        adj (array[int] or scipy.sparse.spmatrix): the adjacency matrix of the Pauli graph,
+            preferably in a sparse format
+
+    Returns:
+        dict(int, list[array[int]]): keys correspond to colours (labelled by integers) and values
+        are lists of Pauli words of the same colour in binary vector representation.
+
+    **Example**
+
+    >>> binary_observables = np.array([[1., 1., 0.],
+    ... [1., 0., 0.],
+    ... [0., 0., 1.],
+    ... [1., 0., 1.]])
+    >>> adj = np.array([[0., 0., 1.],
+    ... [0., 0., 1.],
+    ... [1., 1., 0.]])
+    >>> dsatur(binary_observables, adj)
+    {1: [array([0., 0., 1.])], 2: [array([1., 1., 0.]), array([1., 0., 0.])]}
+    """
+    adj = scipy.sparse.csr_matrix(adj)
+    n_terms = adj.shape[0]
+    degrees = np.diff(adj.indptr)
+
+    # entry (i, c) is True if vertex i has a neighbour of colour c + 1, and additional
+    # columns are allocated as the number of colours grows
+    neighbour_colours = np.zeros((n_terms, 8), dtype=bool)
+    saturation = np.zeros(n_terms, dtype=np.int64)
+    c_vec = np.zeros(n_terms, dtype=int)
+    colours = dict()
+
+    for _ in range(n_terms):
+        # uncoloured vertex of largest saturation degree, ties broken by the degree
+        priority = saturation * (n_terms + 1) + degrees
+        priority[c_vec > 0] = -1
+        i = np.argmax(priority)
+
+        if len(colours) == neighbour_colours.shape[1]:
+            neighbour_colours = np.hstack([neighbour_colours, np.zeros_like(neighbour_colours)])
+
+        colour = np.argmin(neighbour_colours[i, : len(colours) + 1]) + 1
+        c_vec[i] = colour
+        colours.setdefault(colour, []).append(binary_observables[i])
+
+        neighbours = adj.indices[adj.indptr[i] : adj.indptr[i + 1]]
+        neighbours = neighbours[~neighbour_colours[neighbours, colour - 1]]
+        neighbour_colours[neighbours, colour - 1] = True
+        saturation[neighbours] += 1
+
+    return colours
+
+
+def sorted_insertion(binary_observables, grouping_type="qwc", coefficients=None):
+    """Partitions Pauli words using the sorted insertion heuristic.
+
+    The Pauli words are sorted by the magnitude of their coefficients in descending order, and
+    each word is inserted into the first partition whose words all satisfy the binary relation
+    with it; a new partition is opened if there is none. The relation of a word is evaluated
+    against all previously inserted words at once, such that the graph of the relation is never
+    constructed, and the memory required is linear in the number of words.
+
+    Args:
+        binary_observables (array[int]): the set of Pauli words represented by a column matrix
+            of the Pauli words in binary vector represenation
+        grouping_type (str): the binary relation used to define partitions of the Pauli words,
+            can be ``'qwc'``, ``'commuting'``, or ``'anticommuting'``
+        coefficients (array[float]): the coefficients of the Pauli words. If not specified,
+            the words are inserted in the given order.
+
+    Returns:
+        dict(int, list[array[int]]): keys correspond to partitions (labelled by integers) and
+        values are lists of Pauli words of the same partition in binary vector representation.
+
+    **Example**
+
+    >>> binary_observables = np.array([[1., 0., 1., 0.],
+    ... [0., 1., 0., 1.],
+    ... [1., 0., 0., 0.]])
+    >>> sorted_insertion(binary_observables, "qwc", coefficients=[0.1, -0.7, 0.4])
+    {1: [array([0., 1., 0., 1.]), array([1., 0., 0., 0.])], 2: [array([1., 0., 1., 0.])]}
+    """
+    x, z = _pack_binary(binary_observables)
+    n_terms = len(x)
+
+    if coefficients is None:
+        order = np.arange(n_terms)
+    else:
+        order = np.argsort(-np.abs(np.asarray(coefficients)), kind="stable")
+
+    x, z = x[order], z[order]
+    c_vec = np.zeros(n_terms, dtype=int)
+    colours = dict()
+
+    for k, i in enumerate(order):
+        # the partitions containing a word that does not satisfy the relation with word i
+        conflicts = _complement_adj_packed(x[k : k + 1], z[k : k + 1], x[:k], z[:k], grouping_type)
+
+        blocked = np.zeros(len(colours) + 2, dtype=bool)
+        blocked[0] = True
+        blocked[c_vec[:k][conflicts[0]]] = True
+
+        c_vec[k] = np.argmin(blocked)
+        colours.setdefault(int(c_vec[k]), []).append(binary_observables[i])
+
+    return colours
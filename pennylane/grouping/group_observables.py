@@ -15,21 +15,27 @@
 This module contains the high-level Pauli-word-partitioning functionality used in measurement optimization.
 """
 
-from copy import copy
-
-import numpy as np
-
-from pennylane.grouping.graph_colouring import largest_first, recursive_largest_first
+import pennylane as qml
+from pennylane.grouping.graph_colouring import (
+    dsatur,
+    largest_first,
+    recursive_largest_first,
+    sorted_insertion,
+)
 from pennylane.grouping.utils import (
-    are_identical_pauli_words,
+    _complement_adj_matrix,
     binary_to_pauli,
     observables_to_binary_matrix,
-    qwc_complement_adj_matrix,
 )
 from pennylane.wires import Wires
 
 GROUPING_TYPES = frozenset(["qwc", "commuting", "anticommuting"])
-GRAPH_COLOURING_METHODS = {"lf": largest_first, "rlf": recursive_largest_first}
+GRAPH_COLOURING_METHODS = {
+    "lf": largest_first,
+    "rlf": recursive_largest_first,
+    "dsatur": dsatur,
+}
+INSERTION_METHODS = {"si": sorted_insertion}
 
 
 class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
@@ -50,21 +56,25 @@ class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
     find approximate solutions in polynomial time.
 
     Args:
-        observables (list[Observable]): a list of Pauli words to be partitioned according to a
-            grouping strategy
+        observables (list[Observable] or ~.PauliSum): a list of Pauli words to be partitioned
+            according to a grouping strategy
         grouping_type (str): the binary relation used to define partitions of
             the Pauli words, can be ``'qwc'`` (qubit-wise commuting), ``'commuting'``, or
             ``'anticommuting'``.
         graph_colourer (str): the heuristic algorithm to employ for graph
-            colouring, can be ``'lf'`` (Largest First) or ``'rlf'`` (Recursive
-            Largest First)
+            colouring, can be ``'lf'`` (Largest First), ``'rlf'`` (Recursive
+            Largest First) or ``'dsatur'`` (DSATUR on a sparse adjacency matrix). Alternatively,
+            ``'si'`` inserts the Pauli words into partitions by sorted insertion, which does not
+            construct the graph.
+        coefficients (array[float]): the coefficients of the Pauli words, defining the order
+            in which they are inserted by the ``'si'`` heuristic
 
     Raises:
         ValueError: if arguments specified for ``grouping_type`` or
             ``graph_colourer`` are not recognized
     """
 
-    def __init__(self, observables, grouping_type="qwc", graph_colourer="rlf"):
+    def __init__(self, observables, grouping_type="qwc", graph_colourer="rlf", coefficients=None):
 
         if grouping_type.lower() not in GROUPING_TYPES:
             raise ValueError(
@@ -75,20 +85,24 @@ class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
 
         self.grouping_type = grouping_type.lower()
 
-        if graph_colourer.lower() not in GRAPH_COLOURING_METHODS.keys():
+        methods = list(GRAPH_COLOURING_METHODS) + list(INSERTION_METHODS)
+        if graph_colourer.lower() not in methods:
             raise ValueError(
                 "Graph colouring method must be one of: {}, instead got {}.".format(
-                    list(GRAPH_COLOURING_METHODS.keys()), graph_colourer
+                    methods, graph_colourer
                 )
             )
 
-        self.graph_colourer = GRAPH_COLOURING_METHODS[graph_colourer.lower()]
+        self.graph_colourer = GRAPH_COLOURING_METHODS.get(graph_colourer.lower(), None)
+        self.inserter = INSERTION_METHODS.get(graph_colourer.lower(), None)
         self.observables = observables
+        self.coefficients = coefficients
         self._wire_map = None
         self._n_qubits = None
         self.binary_observables = None
         self.adj_matrix = None
         self.grouped_paulis = None
+        self.grouped_indices = None
 
     def binary_repr(self, n_qubits=None, wire_map=None):
         """Converts the list of Pauli words to a binary matrix.
@@ -102,6 +116,12 @@ class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
             array[int]: a column matrix of the Pauli words in binary vector representation
         """
 
+        if isinstance(self.observables, qml.vqe.PauliSum):
+            # the binary representation is stored by the Pauli sum
+            self._wire_map = {wire: c for c, wire in enumerate(self.observables.wires.tolist())}
+            self._n_qubits = len(self._wire_map)
+            return self.observables.binary
+
         if wire_map is None:
             self._wire_map = {
                 wire: c
@@ -124,52 +144,55 @@ class PauliGroupingStrategy:  # pylint: disable=too-many-instance-attributes
         matrix, where matrix elements of 1 denote an edge, and matrix elements of 0 denote no edge.
 
         Returns:
-            array[int]: the square and symmetric adjacency matrix
+            array[bool] or scipy.sparse.csr_matrix: the square and symmetric adjacency matrix,
+            which is sparse for the ``'dsatur'`` heuristic
         """
 
         if self.binary_observables is None:
             self.binary_observables = self.binary_repr()
 
-        n_qubits = int(np.shape(self.binary_observables)[1] / 2)
-
-        if self.grouping_type == "qwc":
-            adj = qwc_complement_adj_matrix(self.binary_observables)
-
-        elif self.grouping_type in frozenset(["commuting", "anticommuting"]):
-            symplectic_form = np.block(
-                [
-                    [np.zeros((n_qubits, n_qubits)), np.eye(n_qubits)],
-                    [np.eye(n_qubits), np.zeros((n_qubits, n_qubits))],
-                ]
-            )
-            mat_prod = (
-                self.binary_observables @ symplectic_form @ np.transpose(self.binary_observables)
-            )
-
-            if self.grouping_type == "commuting":
-
-                adj = mat_prod % 2
-
-            elif self.grouping_type == "anticommuting":
-
-                adj = (mat_prod + 1) % 2
-                np.fill_diagonal(adj, 0)
-
-        return adj
+        return _complement_adj_matrix(
+            self.binary_observables, self.grouping_type, sparse=self.graph_colourer is dsatur
+        )
 
     def colour_pauli_graph(self):
         """
         Runs the graph colouring heuristic algorithm to obtain the partitioned Pauli words.
 
         Returns:
-            list[list[Observable]]: a list of the obtained groupings. Each grouping is itself a
-            list of Pauli word ``Observable`` instances
+            list[list[Observable]] or list[~.PauliSum]: a list of the obtained groupings. Each
+            grouping is itself a list of Pauli word ``Observable`` instances, or a
+            :class:`~.PauliSum` if the observables are given as a ``PauliSum``
         """
 
-        if self.adj_matrix is None:
-            self.adj_matrix = self.complement_adj_matrix_for_operator()
+        if self.binary_observables is None:
+            self.binary_observables = self.binary_repr()
 
-        coloured_binary_paulis = self.graph_colourer(self.binary_observables, self.adj_matrix)
+        if self.inserter is not None:
+            coloured_binary_paulis = self.inserter(
+                self.binary_observables, self.grouping_type, self.coefficients
+            )
+
+        else:
+            if self.adj_matrix is None:
+                self.adj_matrix = self.complement_adj_matrix_for_operator()
+
+            coloured_binary_paulis = self.graph_colourer(self.binary_observables, self.adj_matrix)
+
+        # recover the indices of the coloured binary vectors, assigning the indices
+        # of identical Pauli words in ascending order
+        indices = {}
+        for i in reversed(range(len(self.binary_observables))):
+            indices.setdefault(self.binary_observables[i].tobytes(), []).append(i)
+
+        self.grouped_indices = [
+            [indices[pauli_word.tobytes()].pop() for pauli_word in grouping]
+            for grouping in coloured_binary_paulis.values()
+        ]
+
+        if isinstance(self.observables, qml.vqe.PauliSum):
+            self.grouped_paulis = [self.observables[g] for g in self.grouped_indices]
+            return self.grouped_paulis
 
         self.grouped_paulis = [
             [binary_to_pauli(pauli_word, wire_map=self._wire_map) for pauli_word in grouping]
@@ -189,14 +212,20 @@ def group_observables(observables, coefficients=None, grouping_type="qwc", metho
     graph using graph-colouring heuristic algorithms.
 
     Args:
-        observables (list[Observable]): a list of Pauli word ``Observable`` instances (Pauli
-            operation instances and :class:`~.Tensor` instances thereof)
+        observables (list[Observable] or ~.PauliSum): a list of Pauli word ``Observable``
+            instances (Pauli operation instances and :class:`~.Tensor` instances thereof),
+            or a :class:`~.PauliSum`
         coefficients (list[float]): A list of float coefficients. If not specified,
-            output ``partitioned_coeffs`` is not returned.
+            output ``partitioned_coeffs`` is not returned. Must not be specified if the
+            observables are given as a ``PauliSum``, which contains its coefficients.
         grouping_type (str): The type of binary relation between Pauli words.
             Can be ``'qwc'``, ``'commuting'``, or ``'anticommuting'``.
         method (str): the graph coloring heuristic to use in solving minimum clique cover, which
-            can be ``'lf'`` (Largest First) or ``'rlf'`` (Recursive Largest First)
+            can be ``'lf'`` (Largest First), ``'rlf'`` (Recursive Largest First), ``'dsatur'``
+            (DSATUR), or ``'si'`` (sorted insertion). The ``'dsatur'`` heuristic colours a sparse
+            representation of the graph, while ``'si'`` inserts the Pauli words in the order of
+            decreasing coefficient magnitude without constructing the graph, and scale to
+            Hamiltonians with many more terms.
 
     Returns:
        tuple:
@@ -207,9 +236,13 @@ def group_observables(observables, coefficients=None, grouping_type="qwc", metho
              grouping is itself a list of the grouping's corresponding coefficients. This is only
              output if coefficients are specified.
 
+           If the observables are given as a :class:`~.PauliSum`, a list of ``PauliSum``
+           instances containing the terms of each grouping is returned instead.
+
     Raises:
         IndexError: if the input list of coefficients is not of the same length as the input list
             of Pauli words
+        ValueError: if coefficients are specified for a ``PauliSum``
 
     **Example**
 
@@ -221,8 +254,28 @@ def group_observables(observables, coefficients=None, grouping_type="qwc", metho
      [PauliY(wires=[0])]]
     >>> coeffs_groupings
     [[0.97, 4.21], [1.43]]
+
+    Grouping a :class:`~.PauliSum` avoids creating observable instances for the terms, and
+    keeps the coefficients with their Pauli words:
+
+    >>> psum = qml.PauliSum.from_hamiltonian(qml.Hamiltonian(coeffs, obs))
+    >>> groupings = group_observables(psum, grouping_type='anticommuting', method='lf')
+    >>> [g.coeffs for g in groupings]
+    [array([0.97, 4.21]), array([1.43])]
     """
 
+    if isinstance(observables, qml.vqe.PauliSum):
+        if coefficients is not None:
+            raise ValueError("The coefficients of a PauliSum are contained in the PauliSum.")
+
+        pauli_grouping = PauliGroupingStrategy(
+            observables,
+            grouping_type=grouping_type,
+            graph_colourer=method,
+            coefficients=observables.coeffs,
+        )
+        return pauli_grouping.colour_pauli_graph()
+
     if coefficients is not None:
         if len(coefficients) != len(observables):
             raise IndexError(
@@ -230,25 +283,13 @@ def group_observables(observables, coefficients=None, grouping_type="qwc", metho
             )
 
     pauli_grouping = PauliGroupingStrategy(
-        observables, grouping_type=grouping_type, graph_colourer=method
+        observables, grouping_type=grouping_type, graph_colourer=method, coefficients=coefficients
     )
     partitioned_paulis = pauli_grouping.colour_pauli_graph()
 
     if coefficients is None:
         return partitioned_paulis
 
-    partitioned_coeffs = [[0] * len(g) for g in partitioned_paulis]
-
-    observables = copy(observables)
-    coefficients = copy(coefficients)
-    for i, partition in enumerate(partitioned_paulis):
-        for j, pauli_word in enumerate(partition):
-            for observable in observables:
-                if are_identical_pauli_words(pauli_word, observable):
-                    ind = observables.index(observable)
-                    partitioned_coeffs[i][j] = coefficients[ind]
-                    observables.pop(ind)
-                    coefficients.pop(ind)
-                    break
+    partitioned_coeffs = [[coefficients[i] for i in g] for g in pauli_grouping.grouped_indices]
 
     return partitioned_paulis, partitioned_coeffs
@@ -27,6 +27,7 @@ from pennylane import PauliX, PauliY, PauliZ, Identity
 from pennylane.operation import Observable, Tensor
 from pennylane.wires import Wires
 import numpy as np
+import scipy.sparse
 
 # To make this quicker later on
 ID_MAT = np.eye(2)
@@ -730,7 +731,8 @@ def qwc_complement_adj_matrix(binary_observables):
             binary vector representation
 
     Returns:
-        array[array[int]]: the adjacency matrix for the complement of the qubit-wise commutativity graph
+        array[array[float]]: the adjacency matrix for the complement of the qubit-wise
+        commutativity graph
 
     Raises:
         ValueError: if input binary observables contain components which are not strictly binary
@@ -754,12 +756,130 @@ def qwc_complement_adj_matrix(binary_observables):
     if not np.array_equal(binary_observables, binary_observables.astype(bool)):
         raise ValueError("Expected a binary array, instead got {}".format(binary_observables))
 
+    return _complement_adj_matrix(binary_observables, "qwc").astype(float)
+
+
+def _pack_binary(binary_observables):
+    """Packs the :math:`X` and :math:`Z` components of Pauli words in the binary vector
+    representation into unsigned 64-bit integers.
+
+    Args:
+        binary_observables (array[array[int]]): a matrix whose rows are the Pauli words in the
+            binary vector representation
+
+    Returns:
+        tuple[array[uint64]]: the packed :math:`X` and :math:`Z` components, each of shape
+        ``(m, ceil(n / 64))`` for ``m`` Pauli words on ``n`` qubits
+    """
+    binary_observables = np.asarray(binary_observables, dtype=bool)
+    m_terms, n_qubits = binary_observables.shape[0], binary_observables.shape[1] // 2
+    n_bytes = 8 * max(1, -(-n_qubits // 64))
+
+    packed = []
+    for bits in (binary_observables[:, :n_qubits], binary_observables[:, n_qubits:]):
+        words = np.zeros((m_terms, n_bytes), dtype=np.uint8)
+        words[:, : -(-n_qubits // 8)] = np.packbits(bits, axis=1)
+        packed.append(words.view(np.uint64))
+
+    return tuple(packed)
+
+
+def _complement_adj_blocks(binary_observables, grouping_type, block_size=None):
+    """Computes the adjacency matrix of the complement of the graph of a binary relation
+    between Pauli words in blocks of rows.
+
+    The Pauli words are packed into 64-bit integers, such that the relation is evaluated for all
+    pairs of words in a block using vectorized bit operations. The number of rows per block is
+    chosen to bound the size of the intermediate arrays.
+
+    Args:
+        binary_observables (array[array[int]]): a matrix whose rows are the Pauli words in the
+            binary vector representation
+        grouping_type (str): the binary relation, can be ``'qwc'``, ``'commuting'`` or
+            ``'anticommuting'``
+        block_size (int): the number of rows per block
+
+    Yields:
+        tuple[int, array[bool]]: the index of the first row of the block, and the rows of
+        the adjacency matrix
+    """
+    x, z = _pack_binary(binary_observables)
+    m_terms, n_words = x.shape
+
+    if block_size is None:
+        block_size = max(1, 2 ** 22 // max(1, m_terms * n_words))
+
+    for start in range(0, m_terms, block_size):
+        stop = min(start + block_size, m_terms)
+        block = _complement_adj_packed(x[start:stop], z[start:stop], x, z, grouping_type)
+
+        if grouping_type == "anticommuting":
+            # a Pauli word is not connected to itself
+            block[np.arange(stop - start), np.arange(start, stop)] = False
+
+        yield start, block
+
+
+def _complement_adj_packed(x_rows, z_rows, x, z, grouping_type):
+    """Evaluates the complement of a binary relation between two sets of Pauli words
+    in the packed representation returned by :func:`_pack_binary`.
+
+    Args:
+        x_rows (array[uint64]): packed :math:`X` components of the first set of words
+        z_rows (array[uint64]): packed :math:`Z` components of the first set of words
+        x (array[uint64]): packed :math:`X` components of the second set of words
+        z (array[uint64]): packed :math:`Z` components of the second set of words
+        grouping_type (str): the binary relation, can be ``'qwc'``, ``'commuting'`` or
+            ``'anticommuting'``
+
+    Returns:
+        array[bool]: matrix whose entry ``(i, j)`` is ``True`` if the ``i``-th word of the first
+        set and the ``j``-th word of the second set do not satisfy the relation
+    """
+    x_rows, z_rows = x_rows[:, None, :], z_rows[:, None, :]
+
+    if grouping_type == "qwc":
+        # two words do not commute qubit-wise if they act on a common wire with different Paulis
+        conflicts = (x_rows | z_rows) & (x | z) & ((x_rows ^ x) | (z_rows ^ z))
+        return np.any(conflicts, axis=2)
+
+    # the parity of the symplectic inner product is one for anticommuting words
+    product = np.bitwise_xor.reduce((x_rows & z) ^ (z_rows & x), axis=2)
+    anticommuting = qml.utils._parity(product.view(np.int64)).astype(bool)
+
+    return anticommuting if grouping_type == "commuting" else ~anticommuting
+
+
+def _complement_adj_matrix(binary_observables, grouping_type, sparse=False):
+    """Returns the adjacency matrix of the complement of the graph of a binary relation between
+    Pauli words.
+
+    Args:
+        binary_observables (array[array[int]]): a matrix whose rows are the Pauli words in the
+            binary vector representation
+        grouping_type (str): the binary relation, can be ``'qwc'``, ``'commuting'`` or
+            ``'anticommuting'``
+        sparse (bool): whether to return the adjacency matrix as a sparse matrix
+
+    Returns:
+        array[array[bool]] or scipy.sparse.csr_matrix: the adjacency matrix
+    """
     m_terms = np.shape(binary_observables)[0]
-    adj = np.zeros((m_terms, m_terms))
 
-    for i in range(m_terms):
-        for j in range(i + 1, m_terms):
-            adj[i, j] = int(not is_qwc(binary_observables[i], binary_observables[j]))
-            adj[j, i] = adj[i, j]
+    if sparse:
+        blocks = [
+            scipy.sparse.csr_matrix(block)
+            for _, block in _complement_adj_blocks(binary_observables, grouping_type)
+        ]
+        return (
+            scipy.sparse.vstack(blocks, format="csr")
+            if blocks
+            else scipy.sparse.csr_matrix((m_terms, m_terms), dtype=bool)
+        )
+
+    adj = np.zeros((m_terms, m_terms), dtype=bool)
+
+    for start, block in _complement_adj_blocks(binary_observables, grouping_type):
+        adj[start : start + len(block)] = block
 
     return adj
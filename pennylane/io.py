@@ -15,10 +15,10 @@
 This module contains functions to load circuits from other frameworks as
 PennyLane templates.
 """
-from pkg_resources import iter_entry_points
+from pennylane._entry_points import EntryPointTable
 
-# get list of installed plugin converters
-plugin_converters = {entry.name: entry for entry in iter_entry_points("pennylane.io")}
+# list of installed plugin converters, which are discovered when first accessed
+plugin_converters = EntryPointTable("pennylane.io")
 
 
 def load(quantum_circuit_object, format: str):
@@ -13,8 +13,6 @@
 # limitations under the License.
 """Shot adaptive optimizer"""
 # pylint: disable=too-many-instance-attributes,too-many-arguments,too-many-branches
-from scipy.stats import multinomial
-
 import pennylane as qml
 from pennylane import numpy as np
 
@@ -230,6 +228,8 @@ class ShotAdaptiveOptimizer(GradientDescentOptimizer):
 
         # construct the multinomial distribution, and sample
         # from it to determine how many shots to apply per term
+        from scipy.stats import multinomial  # pylint: disable=import-outside-toplevel
+
         si = multinomial(n=shots, p=prob_shots)
         shots_per_term = si.rvs()[0]
 
@@ -16,6 +16,7 @@ This module contains the QNode class and qnode decorator.
 """
 # pylint: disable=import-outside-toplevel
 # pylint:disable=too-many-branches
+from collections import OrderedDict
 from collections.abc import Sequence
 from functools import lru_cache, update_wrapper
 import warnings
@@ -36,6 +37,63 @@ from pennylane.tape import (
     ReversibleTape,
 )
 
+# maximum number of argument signatures remembered by a compiled QNode
+_COMPILED_CACHE_SIZE = 32
+
+
+def _is_trainable_argument(arg):
+    """Returns whether a QNode argument is trainable, and is rebound by compiled QNodes."""
+    if not hasattr(arg, "shape"):
+        return False
+
+    try:
+        return qml.math.requires_grad(arg) and np.issubdtype(
+            np.asarray(qml.math.to_numpy(arg)).dtype, np.floating
+        )
+    except (TypeError, ValueError):
+        return False
+
+
+def _value_key(value):
+    """Returns a hashable key of the value of a non-trainable QNode argument."""
+    if hasattr(value, "shape"):
+        value = np.asarray(qml.math.to_numpy(value))
+        return ("array", value.shape, value.dtype.str, value.tobytes())
+
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_value_key(v) for v in value))
+
+    if isinstance(value, dict):
+        return ("dict", tuple((k, _value_key(v)) for k, v in sorted(value.items())))
+
+    try:
+        hash(value)
+    except TypeError:
+        # objects that can not be compared by value are only equal to themselves
+        return ("id", id(value))
+
+    return value
+
+
+def _tape_parameters(tape):
+    """Returns all parameters of a tape, bypassing the parameter containers
+    of the interface tape classes."""
+    return JacobianTape.get_parameters(tape, trainable_only=False)
+
+
+def _tape_structure(tape):
+    """Returns the operations, measurements, and numbers of parameters of a tape,
+    and the coefficients of Hamiltonian observables, which are not tape parameters."""
+    structure = [(op.name, op.wires.tolist(), len(op.data)) for op in tape.operations]
+
+    for m in tape.measurements:
+        obs = getattr(m, "obs", None)
+        coeffs = getattr(obs, "coeffs", None)
+        coeffs = None if coeffs is None else [float(qml.math.to_numpy(c)) for c in coeffs]
+        structure.append((m.return_type, getattr(obs, "name", None), m.wires.tolist(), coeffs))
+
+    return structure
+
 
 class QNode:
     """Represents a quantum node in the hybrid computational graph.
@@ -106,6 +164,11 @@ class QNode:
             * ``"finite-diff"``: Uses numerical finite-differences for all quantum operation
               arguments.
 
+            * ``"spsa"``: Uses the simultaneous perturbation stochastic approximation,
+              which estimates the gradient by perturbing all quantum operation arguments
+              simultaneously along random directions. The number of circuit evaluations
+              is independent of the number of arguments.
+
         mutable (bool): If True, the underlying quantum circuit is re-constructed with
             every evaluation. This is the recommended approach, as it allows the underlying
             quantum structure to depend on (potentially trainable) QNode input arguments,
@@ -119,6 +182,21 @@ class QNode:
             supported, and results in a gate decomposition. If any operations in the decomposition
             remain unsupported by the device, another expansion occurs.
 
+        compiled (bool): If True, the quantum function is only traced on the first evaluation,
+            and the constructed (and expanded) tape is stored together with a map from
+            the trainable QNode arguments to the tape parameters. Further evaluations only
+            rebind the tape parameters to the new argument values. The tape is traced again if
+            the shapes of the trainable arguments, or the values of any other arguments,
+            change. Takes precedence over ``mutable``. Only set this to True if the quantum
+            structure only depends on the non-trainable QNode input. Since compiling a tape
+            requires a second trace of the quantum function, the tape is only compiled once
+            a signature of the arguments is encountered for the second time, and only the
+            most recently used signatures are remembered. Evaluations with non-trainable
+            arguments that change with every call, such as data samples, hence behave like
+            ``mutable=True``. If the tape parameters
+            are not simply the trainable arguments or their elements, for example
+            ``qml.RX(2 * x, wires=0)``, the tape is constructed on every evaluation instead.
+
     Keyword Args:
         h=1e-7 (float): step size for the finite difference method
         order=1 (int): The order of the finite difference method to use. ``1`` corresponds
@@ -131,7 +209,13 @@ class QNode:
             with respect to. When there are fewer parameters specified than the
             total number of trainable parameters, the jacobian is being estimated. Note
             that this option is only applicable for the following differentiation methods:
-            ``"parameter-shift"``, ``"finite-diff"`` and ``"reversible"``.
+            ``"parameter-shift"``, ``"finite-diff"``, ``"spsa"`` and ``"reversible"``.
+        num_directions=1 (int): for SPSA differentiation, the number of random directions
+            averaged over. The step size ``h`` and ``order`` default to ``1e-2`` and ``2``
+            for SPSA differentiation.
+        sampler_rng=None (None or int or numpy.random.Generator): for SPSA differentiation,
+            the random number generator used to sample the directions, or a seed used to
+            create a new generator for every gradient evaluation
 
     **Example**
 
@@ -152,6 +236,7 @@ class QNode:
         diff_method="best",
         mutable=True,
         max_expansion=10,
+        compiled=False,
         **diff_options,
     ):
 
@@ -178,6 +263,8 @@ class QNode:
             self._qfunc_uses_shots_arg = False
 
         self.mutable = mutable
+        self.compiled = compiled
+        self._compiled_tapes = OrderedDict()
         self.func = func
         self._original_device = device
         self.qtape = None
@@ -217,7 +304,7 @@ class QNode:
             interface (str): name of the requested interface
             diff_method (str): The requested method of differentiation. One of
                 ``"best"``, ``"backprop"``, ``"reversible"``, ``"adjoint"``, ``"device"``,
-                ``"parameter-shift"``, or ``"finite-diff"``.
+                ``"parameter-shift"``, ``"finite-diff"``, or ``"spsa"``.
 
         Returns:
             tuple[.JacobianTape, str, .Device, dict[str, str]]: Tuple containing the compatible
@@ -251,9 +338,12 @@ class QNode:
         if diff_method == "finite-diff":
             return JacobianTape, interface, device, {"method": "numeric"}
 
+        if diff_method == "spsa":
+            return JacobianTape, interface, device, {"method": "spsa"}
+
         raise qml.QuantumFunctionError(
             f"Differentiation method {diff_method} not recognized. Allowed "
-            "options are ('best', 'parameter-shift', 'backprop', 'finite-diff', 'device', 'reversible', 'adjoint')."
+            "options are ('best', 'parameter-shift', 'backprop', 'finite-diff', 'spsa', 'device', 'reversible', 'adjoint')."
         )
 
     @staticmethod
@@ -590,6 +680,136 @@ class QNode:
         # provide the jacobian options
         self.qtape.jacobian_options = self.diff_options
 
+    def _construct_compiled(self, args, kwargs):
+        """Rebind the parameters of the tape compiled for the signature of the arguments,
+        or compile the tape if the signature has not been encountered before."""
+        if self.interface == "autograd":
+            # HOTFIX: consistent with QNode.construct, treat all inputs that do not
+            # explicitly specify `requires_grad=False` as trainable
+            args = [
+                anp.array(a, requires_grad=True) if not hasattr(a, "requires_grad") else a
+                for a in args
+            ]
+
+        trainable = [_is_trainable_argument(a) for a in args]
+        signature = (
+            self.interface,
+            self.diff_options["method"],
+            tuple(
+                ("trainable", qml.math.get_interface(a), qml.math.shape(a)) if t else _value_key(a)
+                for a, t in zip(args, trainable)
+            ),
+            tuple((k, _value_key(v)) for k, v in sorted(kwargs.items())),
+        )
+
+        if signature not in self._compiled_tapes:
+            # signatures encountered only once are not compiled, to avoid the additional
+            # trace of the quantum function
+            self._compiled_tapes[signature] = False
+
+            if len(self._compiled_tapes) > _COMPILED_CACHE_SIZE:
+                self._compiled_tapes.popitem(last=False)
+
+            self.construct(args, kwargs)
+            return
+
+        self._compiled_tapes.move_to_end(signature)
+        entry = self._compiled_tapes[signature]
+
+        if entry is False:
+            self._compiled_tapes[signature] = self._compile(args, kwargs, trainable)
+            return
+
+        if entry is None:
+            # the tape parameters could not be bound to the arguments
+            self.construct(args, kwargs)
+            return
+
+        self.qtape, self.qfunc_output, bindings, constants = entry
+
+        params = [c if b is None else args[b[0]][b[1]] for c, b in zip(constants, bindings)]
+
+        # pylint: disable=protected-access
+        self.qtape.set_parameters(params, trainable_only=False)
+        self.qtape._update_trainable_params()
+
+    def _compile(self, args, kwargs, trainable):
+        """Construct the tape, and determine the tape parameters bound to the
+        trainable arguments.
+
+        The quantum function is traced a second time, with distinct probe values
+        for all elements of the trainable arguments, to identify the tape parameters
+        that are elements of the trainable arguments, and those that are constant.
+
+        Returns:
+            tuple or None: the constructed tape, the output of the quantum function,
+            for each tape parameter the index of the argument and the index of the
+            element it is bound to, or ``None`` if the parameter is constant, and the
+            values of the tape parameters. ``None`` is returned if some tape parameter
+            is neither bound nor constant.
+        """
+        values = {i: np.asarray(qml.math.to_numpy(a)) for i, a in enumerate(args) if trainable[i]}
+        num_elements = sum(v.size for v in values.values())
+
+        # distinct irrational offsets from the argument values
+        offsets = 1e-2 * (1 + (np.arange(1, num_elements + 1) * np.sqrt(2)) % 1)
+        probe_args = list(args)
+        probes = {}
+        start = 0
+
+        for i, value in values.items():
+            probe = value + offsets[start : start + value.size].reshape(value.shape)
+            start += value.size
+
+            for idx in np.ndindex(value.shape):
+                probes[float(probe[idx])] = (i, idx)
+
+            values[i] = probe
+
+            if qml.math.get_interface(args[i]) == "autograd":
+                probe_args[i] = anp.array(probe, requires_grad=True)
+            else:
+                probe_args[i] = qml.math.convert_like(probe, args[i])
+
+        self.construct(probe_args, kwargs)
+        probe_tape = self.qtape
+        self.construct(args, kwargs)
+
+        bindings = []
+        entry = None
+
+        if len(probes) == num_elements and _tape_structure(probe_tape) == _tape_structure(
+            self.qtape
+        ):
+            params = zip(_tape_parameters(probe_tape), _tape_parameters(self.qtape))
+
+            for probe, param in params:
+                probe = np.asarray(qml.math.to_numpy(probe))
+
+                if probe.ndim == 0 and probe.dtype.kind == "f" and float(probe) in probes:
+                    bindings.append(probes[float(probe)])
+                    continue
+
+                arg = [i for i, v in values.items() if np.array_equal(v, probe)]
+
+                if arg:
+                    bindings.append((arg[0], ...))
+                elif np.array_equal(probe, np.asarray(qml.math.to_numpy(param))):
+                    bindings.append(None)
+                else:
+                    break
+            else:
+                entry = (self.qtape, self.qfunc_output, bindings, _tape_parameters(self.qtape))
+
+        if entry is None:
+            warnings.warn(
+                "The tape parameters of the compiled QNode could not be bound to its trainable "
+                "arguments. The tape is constructed on every evaluation with these arguments.",
+                UserWarning,
+            )
+
+        return entry
+
     def __call__(self, *args, **kwargs):
 
         # If shots specified in call but not in qfunc signature,
@@ -601,7 +821,10 @@ class QNode:
             # remove shots from kwargs and temporarily change on device
             self.device.shots = kwargs.pop("shots", None)
 
-        if self.mutable or self.qtape is None:
+        if self.compiled:
+            # rebind the parameters of the compiled tape, or construct it
+            self._construct_compiled(args, kwargs)
+        elif self.mutable or self.qtape is None:
             # construct the tape
             self.construct(args, kwargs)
 
@@ -612,6 +835,21 @@ class QNode:
         # to allow for more efficient batch execution.
         supports_hamiltonian = self.device.supports_observable("Hamiltonian")
         hamiltonian_in_obs = "Hamiltonian" in [obs.name for obs in self.qtape.observables]
+
+        if (
+            hamiltonian_in_obs
+            and supports_hamiltonian
+            and self.diff_options["method"] != "backprop"
+        ):
+            # Hamiltonian coefficients are not tape parameters, and can only be
+            # differentiated if the terms are recombined outside of the device
+            supports_hamiltonian = not any(
+                qml.math.requires_grad(c)
+                for obs in self.qtape.observables
+                if obs.name == "Hamiltonian"
+                for c in obs.coeffs
+            )
+
         if hamiltonian_in_obs and not supports_hamiltonian:
             try:
                 tapes, fn = qml.transforms.hamiltonian_expand(self.qtape, group=False)
@@ -970,6 +1208,7 @@ def qnode(
     diff_method="best",
     mutable=True,
     max_expansion=10,
+    compiled=False,
     **diff_options,
 ):
     """Decorator for creating QNodes.
@@ -1040,6 +1279,11 @@ def qnode(
             * ``"finite-diff"``: Uses numerical finite-differences for all quantum
               operation arguments.
 
+            * ``"spsa"``: Uses the simultaneous perturbation stochastic approximation,
+              which estimates the gradient by perturbing all quantum operation arguments
+              simultaneously along random directions. The number of circuit evaluations
+              is independent of the number of arguments.
+
         mutable (bool): If True, the underlying quantum circuit is re-constructed with
             every evaluation. This is the recommended approach, as it allows the underlying
             quantum structure to depend on (potentially trainable) QNode input arguments,
@@ -1053,6 +1297,21 @@ def qnode(
             supported, and results in a gate decomposition. If any operations in the decomposition
             remain unsupported by the device, another expansion occurs.
 
+        compiled (bool): If True, the quantum function is only traced on the first evaluation,
+            and the constructed (and expanded) tape is stored together with a map from
+            the trainable QNode arguments to the tape parameters. Further evaluations only
+            rebind the tape parameters to the new argument values. The tape is traced again if
+            the shapes of the trainable arguments, or the values of any other arguments,
+            change. Takes precedence over ``mutable``. Only set this to True if the quantum
+            structure only depends on the non-trainable QNode input. Since compiling a tape
+            requires a second trace of the quantum function, the tape is only compiled once
+            a signature of the arguments is encountered for the second time, and only the
+            most recently used signatures are remembered. Evaluations with non-trainable
+            arguments that change with every call, such as data samples, hence behave like
+            ``mutable=True``. If the tape parameters
+            are not simply the trainable arguments or their elements, for example
+            ``qml.RX(2 * x, wires=0)``, the tape is constructed on every evaluation instead.
+
     Keyword Args:
         h=1e-7 (float): Step size for the finite difference method.
         order=1 (int): The order of the finite difference method to use. ``1`` corresponds
@@ -1064,7 +1323,13 @@ def qnode(
             with respect to. When there are fewer parameters specified than the
             total number of trainable parameters, the jacobian is being estimated. Note
             that this option is only applicable for the following differentiation methods:
-            ``"parameter-shift"``, ``"finite-diff"`` and ``"reversible"``.
+            ``"parameter-shift"``, ``"finite-diff"``, ``"spsa"`` and ``"reversible"``.
+        num_directions=1 (int): for SPSA differentiation, the number of random directions
+            averaged over. The step size ``h`` and ``order`` default to ``1e-2`` and ``2``
+            for SPSA differentiation.
+        sampler_rng=None (None or int or numpy.random.Generator): for SPSA differentiation,
+            the random number generator used to sample the directions, or a seed used to
+            create a new generator for every gradient evaluation
 
     **Example**
 
@@ -1085,6 +1350,7 @@ def qnode(
             diff_method=diff_method,
             mutable=mutable,
             max_expansion=max_expansion,
+            compiled=compiled,
             **diff_options,
         )
         return update_wrapper(qn, func)
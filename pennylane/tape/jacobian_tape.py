@@ -23,7 +23,7 @@ import warnings
 import numpy as np
 
 import pennylane as qml
-from pennylane.operation import State
+from pennylane.operation import State, Variance
 from pennylane.tape import QuantumTape
 
 # CV ops still need to support state preparation operations prior to any
@@ -366,6 +366,52 @@ class JacobianTape(QuantumTape):
         self.set_parameters(saved_parameters)
         return jac
 
+    def spsa_jacobian(self, device, params=None, **options):
+        """Estimate the Jacobian of the tape with respect to all trainable tape
+        parameters using the simultaneous perturbation stochastic approximation.
+
+        Args:
+            device (.Device, .QubitDevice): a PennyLane device
+                that can execute quantum operations and return measurement statistics
+            params (list[Any]): The quantum tape operation parameters. If not provided,
+                the current tape parameter values are used (via :meth:`~.get_parameters`).
+
+        Keyword Args:
+            h=1e-2 (float): finite difference step size along each direction
+            order=2 (int): The order of the finite difference method to use. ``1`` corresponds
+                to forward finite differences, ``2`` to centered finite differences.
+            num_directions=1 (int): number of random directions averaged over
+            sampler_rng=None (None or int or numpy.random.Generator): random number generator
+                used to sample the directions, or seed used to create one
+            argnum=None (int, list(int), None): Which argument(s) to compute the Jacobian
+                with respect to.
+
+        Returns:
+            array[float]: 2-dimensional array of shape ``(tape.output_dim, tape.num_params)``
+        """
+        if params is None:
+            params = np.array(self.get_parameters())
+
+        order = options.get("order", 2)
+
+        if order not in (1, 2):
+            raise ValueError("Order must be 1 or 2.")
+
+        tape = self.copy(copy_operations=True)
+        tape.set_parameters(params)
+
+        tapes, processing_fn = qml.gradients.spsa_grad(
+            tape,
+            argnum=options.get("argnum", None),
+            h=options.get("h", 1e-2),
+            approx_order=order,
+            strategy="forward" if order == 1 else "center",
+            num_directions=options.get("num_directions", 1),
+            sampler_rng=options.get("sampler_rng", None),
+        )
+
+        return processing_fn(device.batch_execute(tapes))
+
     def analytic_pd(self, idx, params, **options):
         """Generate the quantum tapes and classical post-processing function required to compute the
         gradient of the tape with respect to a single trainable tape parameter using an analytic
@@ -457,6 +503,12 @@ class JacobianTape(QuantumTape):
         * Best known method for each parameter (``'best'``): uses the analytic method if
           possible, otherwise finite difference.
 
+        * Simultaneous perturbation stochastic approximation (``'spsa'``). Estimates the
+          Jacobian by perturbing all parameters simultaneously along random directions.
+          The number of circuit evaluations, ``2 * num_directions`` for the default
+          centered finite difference, is independent of ``tape.num_params``. See
+          :func:`~.spsa_grad` for details.
+
         * Device method (``'device'``): Delegates the computation of the Jacobian to the
           device executing the circuit. Only supported by devices that provide their
           own method for computing derivatives; support can be checked by
@@ -479,7 +531,7 @@ class JacobianTape(QuantumTape):
 
         Keyword Args:
             method="best" (str): The differentiation method. Must be one of ``"numeric"``,
-                ``"analytic"``, ``"best"``, or ``"device"``.
+                ``"analytic"``, ``"best"``, ``"spsa"``, or ``"device"``.
             h=1e-7 (float): finite difference method step size
             order=1 (int): The order of the finite difference method to use. ``1`` corresponds
                 to forward finite differences, ``2`` to centered finite differences.
@@ -552,7 +604,7 @@ class JacobianTape(QuantumTape):
 
         method = options.get("method", "best")
 
-        if method not in ("best", "numeric", "analytic", "device"):
+        if method not in ("best", "numeric", "analytic", "device", "spsa"):
             raise ValueError(f"Unknown gradient method '{method}'")
 
         if params is None:
@@ -564,6 +616,11 @@ class JacobianTape(QuantumTape):
             # Using device mode; simply query the device for the Jacobian
             return self.device_pd(device, params=params, **options)
 
+        if method == "spsa":
+            # Simultaneous perturbation; the number of circuits is independent
+            # of the number of parameters
+            return self.spsa_jacobian(device, params=params, **options)
+
         # perform gradient method validation
         diff_methods = self._grad_method_validation(method)
 
@@ -662,7 +719,9 @@ class JacobianTape(QuantumTape):
         By default, the Hessian will be computed with respect to all parameters on the quantum tape.
         This can be modified by setting the :attr:`~.trainable_params` attribute of the tape.
 
-        The Hessian can be currently computed using only the ``'analytic'`` method.
+        The Hessian can be currently computed using only the ``'analytic'`` method. For the
+        default shifts, and circuits that do not return variances, all entries are computed
+        from a single batch of shifted tapes generated by :func:`~.param_shift_hessian`.
 
         Args:
             device (.Device, .QubitDevice): a PennyLane device
@@ -779,6 +838,22 @@ class JacobianTape(QuantumTape):
                     f"QNode by replacing it with '{op.__str__().replace('(', '.decomposition(')}'"
                 )
 
+        default_shifts = options.get("s1", np.pi / 2) == options.get("s2", np.pi / 2) == np.pi / 2
+
+        if default_shifts and not any(m.return_type is Variance for m in self.measurements):
+            # generate the minimal set of shifted tapes for all entries as a single batch
+            tape = self.copy(copy_operations=True)
+            tape.set_parameters(params)
+
+            tapes, processing_fn = qml.gradients.param_shift_hessian(tape)
+            hessian = processing_fn(device.batch_execute(tapes))
+            hessian = np.moveaxis(hessian, 0, -1)
+
+            if self.output_dim == 1:
+                hessian = np.squeeze(hessian, axis=-1)
+
+            return hessian
+
         # some gradient methods need the device or the device wires
         options["device"] = device
         options["dev_wires"] = device.wires
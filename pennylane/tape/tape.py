@@ -26,6 +26,7 @@ import numpy as np
 import pennylane as qml
 from pennylane.queuing import AnnotatedQueue, QueuingContext, QueuingError
 from pennylane.operation import Sample
+from pennylane.utils import _observable_fingerprint, _parameter_fingerprint
 
 from .unwrap import UnwrapTape
 
@@ -1006,6 +1007,38 @@ class QuantumTape(AnnotatedQueue):
 
         return self._graph
 
+    @property
+    def hash(self):
+        """int: an integer hash uniquely representing the recorded quantum circuit.
+
+        The hash is computed directly from the names, wires and parameter values of the
+        operations, and the return types and observables of the measurements. Unlike
+        :attr:`.CircuitGraph.hash`, neither the circuit graph nor a string serialization
+        of the circuit is constructed.
+
+        Tapes recording the same circuit have equal hashes. Since Python randomizes the hashes
+        of strings, the values themselves differ between interpreter sessions.
+
+        >>> def circuit(x):
+        ...     with qml.tape.QuantumTape() as tape:
+        ...         qml.RX(x, wires=0)
+        ...         qml.expval(qml.PauliZ(0))
+        ...     return tape
+        >>> circuit(0.1).hash == circuit(0.1).hash
+        True
+        >>> circuit(0.1).hash == circuit(0.2).hash
+        False
+        """
+        fingerprint = [
+            (op.name, op.wires.labels, tuple(_parameter_fingerprint(p) for p in op.data))
+            for op in self.operations
+        ]
+        fingerprint.extend(
+            (m.return_type, m.wires.labels, _observable_fingerprint(m.obs))
+            for m in self.measurements
+        )
+        return hash(tuple(fingerprint))
+
     def get_resources(self):
         """Resource requirements of a quantum circuit.
 
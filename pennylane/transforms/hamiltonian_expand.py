@@ -103,7 +103,9 @@ def hamiltonian_expand(tape, group=True):
         )
     if group:
         hamiltonian.simplify()
-        return qml.transforms.measurement_grouping(tape, hamiltonian.ops, hamiltonian.coeffs)
+        # group the terms in the compact array representation
+        pauli_sum = qml.vqe.PauliSum.from_hamiltonian(hamiltonian)
+        return qml.transforms.measurement_grouping(tape, pauli_sum)
 
     # create tapes that measure the Pauli-words in the Hamiltonian
     tapes = []
@@ -17,16 +17,19 @@ Contains the measurement grouping transform
 import pennylane as qml
 
 
-def measurement_grouping(tape, obs_list, coeffs_list):
+def measurement_grouping(tape, obs_list, coeffs_list=None):
     """Returns a list of measurement optimized tapes, and a classical processing function, for
     evaluating the expectation value of a provided Hamiltonian.
 
     Args:
         tape (.QuantumTape): input tape
-        obs_list (Sequence[.Observable]): The list of observables to measure
-            the expectation values of after executing the tape.
+        obs_list (Sequence[.Observable] or .PauliSum): The list of observables to measure
+            the expectation values of after executing the tape, or a :class:`~.PauliSum`
+            containing both the Pauli words and their coefficients.
         coeffs_list (Sequence[float]): Coefficients of the Hamiltonian expression.
-            Must be of the same length as ``obs_list``.
+            Must be of the same length as ``obs_list``, and not specified if ``obs_list``
+            is a ``PauliSum``. If not specified for a list of observables, all
+            coefficients are one.
 
     Returns:
         tuple[list[.QuantumTape], func]: Returns a tuple containing a list of
@@ -73,7 +76,15 @@ def measurement_grouping(tape, obs_list, coeffs_list):
     >>> print(res)
     2.0007186031172046
     """
-    obs_groupings, coeffs_groupings = qml.grouping.group_observables(obs_list, coeffs_list)
+    if isinstance(obs_list, qml.vqe.PauliSum):
+        groupings = qml.grouping.group_observables(obs_list, coeffs_list)
+        obs_groupings = [g.ops for g in groupings]
+        coeffs_groupings = [g.coeffs for g in groupings]
+    else:
+        if coeffs_list is None:
+            coeffs_list = [1.0] * len(obs_list)
+
+        obs_groupings, coeffs_groupings = qml.grouping.group_observables(obs_list, coeffs_list)
     tapes = []
 
     for obs in obs_groupings:
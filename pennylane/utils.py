@@ -19,7 +19,6 @@ across the PennyLane submodules.
 from collections.abc import Iterable
 import functools
 import inspect
-import itertools
 import numbers
 from operator import matmul
 import warnings
@@ -30,17 +29,32 @@ import scipy
 import pennylane as qml
 
 
-def decompose_hamiltonian(H, hide_identity=False):
+def decompose_hamiltonian(H, hide_identity=False, tol=1e-8, return_hamiltonian=False):
     r"""Decomposes a Hermitian matrix into a linear combination of Pauli operators.
 
+    The coefficient of a Pauli word :math:`P` is :math:`\operatorname{Tr}(PH)/2^n`. A Pauli
+    word maps each basis state :math:`|i\rangle` to :math:`\pm i^{n_Y}|i \oplus x\rangle`,
+    where the bitmask :math:`x` marks the wires acted on by :math:`X` or :math:`Y`, and the sign
+    is the parity of the bits of :math:`i` on the wires acted on by :math:`Z` or :math:`Y`.
+    For each mask :math:`x`, the coefficients of all Pauli words with this mask are therefore
+    given by the Walsh-Hadamard transform of the entries :math:`H_{i \oplus x, i}`, such that
+    all coefficients are computed in :math:`O(n 4^n)` operations. For sparse matrices, only the
+    masks of the nonzero entries are transformed.
+
     Args:
-        H (array[complex]): a Hermitian matrix of dimension :math:`2^n\times 2^n`
+        H (array[complex] or scipy.sparse.spmatrix): a Hermitian matrix of dimension
+            :math:`2^n\times 2^n`
         hide_identity (bool): does not include the :class:`~.Identity` observable within
             the tensor products of the decomposition if ``True``
+        tol (float): Pauli words with coefficients of magnitude smaller than or equal to
+            ``tol`` are discarded
+        return_hamiltonian (bool): whether to return the decomposition as a
+            :class:`~.Hamiltonian`
 
     Returns:
-        tuple[list[float], list[~.Observable]]: a list of coefficients and a list
-        of corresponding tensor products of Pauli observables that decompose the Hamiltonian.
+        tuple[list[float], list[~.Observable]] or ~.Hamiltonian: a list of coefficients and a list
+        of corresponding tensor products of Pauli observables that decompose the Hamiltonian,
+        or the corresponding Hamiltonian if ``return_hamiltonian=True``
 
     **Example:**
 
@@ -69,8 +83,16 @@ def decompose_hamiltonian(H, hide_identity=False):
     + (-0.5) [Z0 Y1]
 
     This Hamiltonian can then be used in defining VQE problems using :class:`~.ExpvalCost`.
+    The Hamiltonian can also be returned directly, for instance to decompose a diagonal cost
+    matrix given in a sparse format:
+
+    >>> costs = scipy.sparse.diags([0.0, 1.0, 1.0, 2.0])
+    >>> print(decompose_hamiltonian(costs, hide_identity=True, return_hamiltonian=True))
+      (-0.5) [Z1]
+    + (-0.5) [Z0]
+    + (1.0) [I0 I1]
     """
-    n = int(np.log2(len(H)))
+    n = int(np.log2(H.shape[0]))
     N = 2 ** n
 
     if H.shape != (N, N):
@@ -78,44 +100,89 @@ def decompose_hamiltonian(H, hide_identity=False):
             "The Hamiltonian should have shape (2**n, 2**n), for any qubit number n>=1"
         )
 
-    if not np.allclose(H, H.conj().T):
-        raise ValueError("The Hamiltonian is not Hermitian")
+    if scipy.sparse.issparse(H):
+        H = scipy.sparse.coo_matrix(H)
+        H.sum_duplicates()
+
+        if abs(H - H.getH()).max() > 1e-8:
+            raise ValueError("The Hamiltonian is not Hermitian")
+
+        # the flipped bits and column indices of the nonzero entries
+        x_masks, index = np.unique(H.row ^ H.col, return_inverse=True)
+        entries = np.zeros((len(x_masks), N), dtype=np.complex128)
+        entries[index, H.col] = H.data
+
+    else:
+        if not np.allclose(H, H.conj().T):
+            raise ValueError("The Hamiltonian is not Hermitian")
+
+        x_masks = np.arange(N)
+        entries = np.asarray(H)[x_masks[:, None] ^ x_masks, x_masks]
 
-    paulis = [qml.Identity, qml.PauliX, qml.PauliY, qml.PauliZ]
+    # Walsh-Hadamard transform over the bits of the column index
+    entries = np.reshape(entries, (len(x_masks),) + (2,) * n)
+    for axis in range(1, n + 1):
+        first, second = np.split(entries, 2, axis=axis)
+        entries = np.concatenate([first + second, first - second], axis=axis)
+
+    entries = np.reshape(entries, (len(x_masks), N))
+
+    rows, z = np.nonzero(np.abs(entries) > tol * N)
+    x = x_masks[rows]
+
+    # Tr(PH) = (-i)^{n_Y} times the transformed entry, with n_Y the number of Y operators
+    num_y = sum((x & z) >> k & 1 for k in range(n))
+    coeffs = np.real(np.array([1, -1j, -1, 1j])[num_y % 4] * entries[rows, z]) / N
+
+    # order the Pauli words lexicographically, with I < X < Y < Z on each wire
+    paulis = [(3 * (z >> k & 1)) ^ (x >> k & 1) for k in reversed(range(n))]
+    order = np.argsort(sum(p << 2 * (n - 1 - k) for k, p in enumerate(paulis)), kind="stable")
+
+    pauli_ops = [qml.Identity, qml.PauliX, qml.PauliY, qml.PauliZ]
     obs = []
-    coeffs = []
-
-    for term in itertools.product(paulis, repeat=n):
-        matrices = [i._matrix() for i in term]
-        coeff = np.trace(functools.reduce(np.kron, matrices) @ H) / N
-        coeff = np.real_if_close(coeff).item()
-
-        if not np.allclose(coeff, 0):
-            coeffs.append(coeff)
-
-            if not all(t is qml.Identity for t in term) and hide_identity:
-                obs.append(
-                    functools.reduce(
-                        matmul,
-                        [t(i) for i, t in enumerate(term) if t is not qml.Identity],
-                    )
+
+    for idx in order:
+        term = [pauli_ops[p[idx]] for p in paulis]
+
+        if not all(t is qml.Identity for t in term) and hide_identity:
+            obs.append(
+                functools.reduce(
+                    matmul,
+                    [t(i) for i, t in enumerate(term) if t is not qml.Identity],
                 )
-            else:
-                obs.append(functools.reduce(matmul, [t(i) for i, t in enumerate(term)]))
+            )
+        else:
+            obs.append(functools.reduce(matmul, [t(i) for i, t in enumerate(term)]))
+
+    coeffs = coeffs[order].tolist()
+
+    if return_hamiltonian:
+        return qml.Hamiltonian(coeffs, obs)
 
     return coeffs, obs
 
 
-def sparse_hamiltonian(H):
+def sparse_hamiltonian(H, cache=False, format="coo"):
     r"""Computes the sparse matrix representation a Hamiltonian in the computational basis.
 
+    Terms that are Pauli words are assembled jointly: a Pauli word maps each basis state
+    :math:`|i\rangle` to :math:`\pm i^{n_Y}|i \oplus x\rangle`, where the bitmask :math:`x`
+    marks the wires acted on by :math:`X` or :math:`Y`, and the sign is the parity of the bits
+    of :math:`i` on the wires acted on by :math:`Z` or :math:`Y`. The nonzero entries of all
+    Pauli words are therefore computed for all rows at once, and stored in a single CSR matrix.
+    Any other terms are added as Kronecker products.
+
     Args:
-        H (~.Hamiltonian): Hamiltonian operator for which the matrix representation should be
-         computed
+        H (~.Hamiltonian or ~.PauliSum): Hamiltonian operator for which the matrix
+            representation should be computed
+        cache (bool): If ``True``, the matrix is stored on the Hamiltonian, and reused in
+            subsequent calls as long as the terms of the Hamiltonian are unchanged.
+        format (str): the sparse format of the returned matrix, such as ``"coo"`` or ``"csr"``
 
     Returns:
-        coo_matrix: a sparse matrix in scipy coordinate list (COO) format with dimension
-        :math:`(2^n, 2^n)`, where :math:`n` is the number of wires
+        scipy.sparse.spmatrix: a sparse matrix in scipy coordinate list (COO) format, or the
+        requested format, with dimension :math:`(2^n, 2^n)`, where :math:`n` is the number
+        of wires
 
     **Example:**
 
@@ -127,7 +194,7 @@ def sparse_hamiltonian(H):
     >>> H_sparse = sparse_hamiltonian(H)
     >>> H_sparse
     <4x4 sparse matrix of type '<class 'numpy.complex128'>'
-        with 2 stored elements in COOrdinate format>
+        with 8 stored elements in COOrdinate format>
 
     The resulting sparse matrix can be either used directly or transformed into a numpy array:
 
@@ -137,23 +204,170 @@ def sparse_hamiltonian(H):
            [ 0.-0.45j,  0.+0.j  , -1.+0.j  ,  0.+0.j  ],
            [ 0.+0.j  ,  0.+0.45j,  0.+0.j  ,  1.+0.j  ]])
     """
-    if not isinstance(H, qml.Hamiltonian):
-        raise TypeError("Passed Hamiltonian must be of type `qml.Hamiltonian`")
+    if not isinstance(H, (qml.Hamiltonian, qml.vqe.PauliSum)):
+        raise TypeError("Passed Hamiltonian must be of type `qml.Hamiltonian` or `qml.PauliSum`")
+
+    if cache:
+        # Pauli sums are immutable
+        key = None if isinstance(H, qml.vqe.PauliSum) else _observable_fingerprint(H)
+        cached = getattr(H, "_sparse_matrix", None)
+
+        if cached is None or cached[0] != key:
+            H._sparse_matrix = (key, sparse_hamiltonian(H).tocsr())
+
+        return H._sparse_matrix[1].asformat(format, copy=True)
+
+    wires = H.wires
+    n = len(wires)
+
+    if isinstance(H, qml.vqe.PauliSum):
+        binary = H.binary.astype(np.int64)
+        weights = 2 ** np.arange(n - 1, -1, -1, dtype=np.int64)
+        x_masks, z_masks = binary[:, :n] @ weights, binary[:, n:] @ weights
+        num_y = np.sum(binary[:, :n] & binary[:, n:], axis=1)
+
+        return _sparse_pauli_sum(H.coeffs, x_masks, z_masks, num_y, n).asformat(format)
+
+    pauli_coeffs = []
+    pauli_masks = []
+    other_terms = []
 
-    n = len(H.wires)
-    matrix = scipy.sparse.coo_matrix((2 ** n, 2 ** n), dtype="complex128")
+    for coeff, op in zip(H.coeffs, H.ops):
+        masks = _pauli_word_masks(op, wires)
 
-    for coeffs, ops in zip(H.coeffs, H.ops):
+        if masks is None:
+            other_terms.append((coeff, op))
+        else:
+            pauli_coeffs.append(coeff)
+            pauli_masks.append(masks)
 
-        obs = [scipy.sparse.coo_matrix(o.matrix) for o in qml.operation.Tensor(ops).obs]
+    matrix = _sparse_pauli_sum(pauli_coeffs, *np.reshape(pauli_masks, (-1, 3)).T, n)
+
+    for coeff, op in other_terms:
+        obs = [scipy.sparse.coo_matrix(o.matrix) for o in qml.operation.Tensor(op).obs]
         mat = [scipy.sparse.eye(2, format="coo")] * n
 
-        for i, j in enumerate(ops.wires):
-            mat[j] = obs[i]
+        for i, j in enumerate(op.wires):
+            mat[wires.index(j)] = obs[i]
+
+        matrix += functools.reduce(lambda i, j: scipy.sparse.kron(i, j, format="csr"), mat) * coeff
+
+    return matrix.asformat(format)
+
+
+def _pauli_word_masks(observable, wires):
+    """Returns the bitmasks of a Pauli word acting on the given wires.
+
+    The wire at position ``k`` in ``wires`` corresponds to the bit ``n - 1 - k`` of the
+    basis state index, where ``n`` is the number of wires.
+
+    Args:
+        observable (~.Observable): observable to describe
+        wires (~.wires.Wires): wires defining the order of the bits
+
+    Returns:
+        tuple[int] or None: the masks of the wires acted on by :math:`X` or :math:`Y`,
+        and by :math:`Z` or :math:`Y`, as well as the number of :math:`Y` factors,
+        or ``None`` if the observable is not a Pauli word
+    """
+    factors = observable.obs if isinstance(observable, qml.operation.Tensor) else [observable]
+    x_mask = z_mask = num_y = 0
+
+    for obs in factors:
+        if obs.name == "Identity":
+            continue
+
+        if obs.name not in ("PauliX", "PauliY", "PauliZ"):
+            return None
+
+        bit = 1 << (len(wires) - 1 - wires.index(obs.wires[0]))
+
+        if (x_mask | z_mask) & bit:
+            # several factors acting on the same wire
+            return None
+
+        if obs.name != "PauliZ":
+            x_mask |= bit
+
+        if obs.name != "PauliX":
+            z_mask |= bit
 
-        matrix += functools.reduce(lambda i, j: scipy.sparse.kron(i, j, format="coo"), mat) * coeffs
+        num_y += obs.name == "PauliY"
 
-    return matrix.tocoo()
+    return x_mask, z_mask, num_y
+
+
+def _sparse_pauli_sum(coeffs, x_masks, z_masks, num_y, num_wires):
+    """Returns the sparse matrix of a linear combination of Pauli words.
+
+    The words are grouped by the mask of their flipped wires, such that every group
+    contributes exactly one entry to each row of the matrix. The entries of a group
+    are obtained by splitting the row index into its high and low bits, as the sign of each
+    word factorizes into a sign depending on the high bits and one depending on the low bits.
+
+    Args:
+        coeffs (array[float]): coefficients of the Pauli words
+        x_masks (array[int]): masks of the wires acted on by :math:`X` or :math:`Y`,
+            as returned by :func:`_pauli_word_masks`
+        z_masks (array[int]): masks of the wires acted on by :math:`Z` or :math:`Y`
+        num_y (array[int]): number of :math:`Y` factors of the Pauli words
+        num_wires (int): number of wires
+
+    Returns:
+        csr_matrix: the sparse matrix
+    """
+    dim = 2 ** num_wires
+
+    x_masks, groups = np.unique(np.asarray(x_masks, dtype=np.int64), return_inverse=True)
+    z_masks = np.asarray(z_masks, dtype=np.int64)
+    phases = np.asarray(coeffs, dtype=np.complex128) * 1j ** np.asarray(num_y, dtype=np.int64)
+    rows = np.arange(dim, dtype=np.int64)
+
+    num_low = num_wires // 2
+    low_rows = np.arange(2 ** num_low)
+    high_rows = np.arange(2 ** (num_wires - num_low))
+
+    data = np.empty((dim, len(x_masks)), dtype=np.complex128)
+
+    for g, x_mask in enumerate(x_masks):
+        words = groups == g
+
+        # the sign is determined by the column index, i.e., the row index with flipped bits
+        group_phases = phases[words] * (1 - 2 * _parity(x_mask & z_masks[words]))
+
+        low_signs = 1 - 2 * _parity(low_rows[:, None] & z_masks[words])
+        high_signs = 1 - 2 * _parity(high_rows[:, None] & (z_masks[words] >> num_low))
+
+        data[:, g] = np.ravel((high_signs * group_phases) @ low_signs.T)
+
+    # the column of each entry is the row index with the flipped bits
+    indices = rows[:, None] ^ x_masks
+    order = np.argsort(indices, axis=1)
+
+    matrix = scipy.sparse.csr_matrix(
+        (
+            np.take_along_axis(data, order, axis=1).ravel(),
+            np.take_along_axis(indices, order, axis=1).ravel(),
+            np.arange(0, dim * len(x_masks) + 1, len(x_masks)),
+        ),
+        shape=(dim, dim),
+    )
+    matrix.eliminate_zeros()
+    return matrix
+
+
+def _parity(x):
+    """Returns the parity of the number of set bits of non-negative 64-bit integers.
+
+    Args:
+        x (array[int]): input integers
+
+    Returns:
+        array[int]: ``1`` for integers with an odd number of set bits, ``0`` otherwise
+    """
+    for shift in (32, 16, 8, 4, 2, 1):
+        x = x ^ (x >> shift)
+    return x & 1
 
 
 def _flatten(x):
@@ -250,6 +464,74 @@ def _inv_dict(d):
     return ret
 
 
+def _parameter_fingerprint(parameter):
+    """Returns a hashable representation of the value of a parameter.
+
+    Args:
+        parameter (Any): the parameter
+
+    Returns:
+        Any: a hashable object that is equal for equal parameter values
+    """
+    if isinstance(parameter, (int, float, complex)):
+        return parameter
+
+    if scipy.sparse.issparse(parameter):
+        parameter = parameter.tocoo()
+        return (
+            parameter.shape,
+            parameter.data.tobytes(),
+            parameter.row.tobytes(),
+            parameter.col.tobytes(),
+        )
+
+    # unwrap interface tensors, such as autograd ArrayBoxes, to hash their values
+    array = np.asarray(qml.math.to_numpy(parameter))
+
+    if array.dtype == np.dtype("O"):
+        if isinstance(parameter, (list, tuple)):
+            return tuple(_parameter_fingerprint(p) for p in parameter)
+
+        return type(parameter).__name__, str(parameter)
+
+    if array.ndim == 0:
+        # scalars are represented consistently, whether they
+        # are passed as Python numbers or as zero-dimensional arrays
+        return array.item()
+
+    return array.shape, array.dtype.str, array.tobytes()
+
+
+def _observable_fingerprint(obs):
+    """Returns a hashable representation of an observable, including its parameter values.
+
+    Args:
+        obs (~.Observable or None): the observable
+
+    Returns:
+        tuple or None: a hashable object that is equal for equal observables
+    """
+    if obs is None:
+        return None
+
+    if isinstance(obs, qml.Hamiltonian):
+        return (
+            obs.name,
+            tuple(_parameter_fingerprint(c) for c in obs.coeffs),
+            tuple(_observable_fingerprint(o) for o in obs.ops),
+        )
+
+    if isinstance(obs, qml.operation.Tensor):
+        return tuple(_observable_fingerprint(o) for o in obs.obs)
+
+    return (
+        obs.name,
+        obs.wires.labels,
+        getattr(obs, "inverse", False),
+        tuple(_parameter_fingerprint(p) for p in obs.data),
+    )
+
+
 def _get_default_args(func):
     """Get the default arguments of a function.
 
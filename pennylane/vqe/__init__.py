@@ -16,3 +16,4 @@ This package contains functionality for running Variational Quantum Eigensolver
 computations using PennyLane.
 """
 from .vqe import Hamiltonian, ExpvalCost, VQECost
+from .pauli_sum import PauliSum
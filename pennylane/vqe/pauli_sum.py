@@ -0,0 +1,231 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+This submodule contains a compact, array-based representation of linear combinations
+of Pauli words.
+"""
+import numpy as np
+
+import pennylane as qml
+from pennylane.operation import Tensor
+from pennylane.wires import Wires
+
+PAULI_NAMES = frozenset(["PauliX", "PauliY", "PauliZ"])
+
+
+class PauliSum:
+    r"""Compact representation of a linear combination of Pauli words
+    :math:`\sum_{k=0}^{N-1} c_k P_k`.
+
+    Instead of storing an observable instance per term like :class:`~.Hamiltonian`, the terms
+    are stored column-wise in arrays: an array of coefficients, and two arrays of packed
+    bitmasks encoding the wires acted on by :math:`X` or :math:`Y`, and by :math:`Z` or
+    :math:`Y`, respectively. A term of a Hamiltonian on :math:`n` wires therefore requires only
+    :math:`2\lceil n/8\rceil` bytes in addition to its coefficient, and algorithms acting on all
+    terms can be vectorized.
+
+    Instances are immutable; methods such as :meth:`simplify` return a new ``PauliSum``.
+
+    Args:
+        coeffs (tensor_like): coefficients of the Pauli words
+        x (array[uint8]): array of shape ``(N, ceil(n / 8))``, where row ``k`` contains
+            the bits of the wires acted on by :math:`X` or :math:`Y` in the ``k``-th word,
+            packed with :func:`numpy.packbits`
+        z (array[uint8]): array of the same shape as ``x``, containing the packed
+            bits of the wires acted on by :math:`Z` or :math:`Y`
+        wires (Iterable[Number, str]): the wires, where the wire at position ``i`` corresponds
+            to the bit at position ``i`` of the unpacked rows
+
+    Raises:
+        ValueError: if the shapes of the arrays do not match the number of terms and wires
+
+    **Example**
+
+    A ``PauliSum`` is usually created from a Hamiltonian consisting of Pauli words:
+
+    >>> H = qml.Hamiltonian([0.5, -0.2], [qml.PauliX(0) @ qml.PauliY(2), qml.PauliZ(1)])
+    >>> psum = qml.PauliSum.from_hamiltonian(H)
+    >>> psum
+    <PauliSum: terms=2, wires=[0, 1, 2]>
+    >>> psum.binary
+    array([[1, 0, 1, 0, 0, 1],
+           [0, 0, 0, 0, 1, 0]], dtype=uint8)
+
+    It is supported by :func:`~.grouping.group_observables`, :func:`~.sparse_hamiltonian`,
+    :func:`~.transforms.measurement_grouping` and :class:`~.ExpvalCost`, and can be converted
+    back into a Hamiltonian:
+
+    >>> print(psum.to_hamiltonian())
+      (-0.2) [Z1]
+    + (0.5) [X0 Y2]
+    """
+
+    def __init__(self, coeffs, x, z, wires):
+        self._coeffs = np.asarray(coeffs)
+        self._x = np.asarray(x, dtype=np.uint8)
+        self._z = np.asarray(z, dtype=np.uint8)
+        self._wires = Wires(wires)
+
+        shape = (len(self._coeffs), -(-len(self._wires) // 8))
+
+        if self._coeffs.ndim != 1 or self._x.shape != shape or self._z.shape != shape:
+            raise ValueError(
+                f"Expected coefficients of shape {shape[:1]} and bitmasks of shape {shape}, "
+                f"instead got {self._coeffs.shape}, {self._x.shape} and {self._z.shape}."
+            )
+
+        for array in (self._coeffs, self._x, self._z):
+            array.flags.writeable = False
+
+    @classmethod
+    def from_hamiltonian(cls, H, wires=None):
+        """Creates a ``PauliSum`` from a Hamiltonian consisting of Pauli words.
+
+        Args:
+            H (~.Hamiltonian): the Hamiltonian
+            wires (Iterable[Number, str]): The wires defining the order of the bits. Must
+                contain the wires of the Hamiltonian. Defaults to the wires of ``H``.
+
+        Returns:
+            PauliSum: the Pauli sum with the same terms as ``H``
+
+        Raises:
+            TypeError: if a term of ``H`` is not a Pauli word
+            ValueError: if a Pauli word acts more than once on the same wire
+        """
+        wires = H.wires if wires is None else Wires(wires)
+        wire_map = {w: i for i, w in enumerate(wires.labels)}
+
+        x = np.zeros((len(H.ops), len(wires)), dtype=bool)
+        z = np.zeros_like(x)
+
+        for k, op in enumerate(H.ops):
+            for obs in op.obs if isinstance(op, Tensor) else [op]:
+                if obs.name == "Identity":
+                    continue
+
+                if obs.name not in PAULI_NAMES:
+                    raise TypeError(f"Expected a Hamiltonian of Pauli words, instead got {op}.")
+
+                i = wire_map[obs.wires.labels[0]]
+
+                if x[k, i] or z[k, i]:
+                    raise ValueError(f"The Pauli word {op} acts more than once on the same wire.")
+
+                x[k, i] = obs.name != "PauliZ"
+                z[k, i] = obs.name != "PauliX"
+
+        return cls(H.coeffs, np.packbits(x, axis=1), np.packbits(z, axis=1), wires)
+
+    @property
+    def coeffs(self):
+        """array: the coefficients of the Pauli words"""
+        return self._coeffs
+
+    @property
+    def x(self):
+        """array[uint8]: the packed bitmasks of the wires acted on by :math:`X` or :math:`Y`"""
+        return self._x
+
+    @property
+    def z(self):
+        """array[uint8]: the packed bitmasks of the wires acted on by :math:`Z` or :math:`Y`"""
+        return self._z
+
+    @property
+    def wires(self):
+        """Wires: the wires defining the order of the bits"""
+        return self._wires
+
+    @property
+    def binary(self):
+        """array[uint8]: The Pauli words in the binary vector representation used by the
+        :mod:`~.grouping` module, i.e., a matrix with a row per word, where the first half
+        of the columns specifies the :math:`X` placements and the second half specifies the
+        :math:`Z` placements."""
+        n = len(self._wires)
+        return np.hstack(
+            [np.unpackbits(self._x, axis=1, count=n), np.unpackbits(self._z, axis=1, count=n)]
+        )
+
+    @property
+    def ops(self):
+        """list[~.Observable]: the Pauli words as observable instances"""
+        paulis = {(1, 0): qml.PauliX, (1, 1): qml.PauliY, (0, 1): qml.PauliZ}
+        binary = self.binary
+        n = len(self._wires)
+        ops = []
+
+        for x, z in zip(binary[:, :n], binary[:, n:]):
+            factors = [paulis[x[i], z[i]](self._wires[i]) for i in np.flatnonzero(x | z)]
+
+            if not factors:
+                ops.append(qml.Identity(self._wires[:1]))
+            else:
+                ops.append(factors[0] if len(factors) == 1 else Tensor(*factors))
+
+        return ops
+
+    @property
+    def terms(self):
+        """tuple[list[float], list[~.Observable]]: the coefficients and Pauli words"""
+        return list(self._coeffs), self.ops
+
+    def simplify(self):
+        """Combines the coefficients of identical Pauli words, and removes the words with a
+        vanishing coefficient.
+
+        The words are kept in the order of their first occurrence.
+
+        Returns:
+            PauliSum: the simplified Pauli sum
+        """
+        _, first, inverse = np.unique(
+            np.hstack([self._x, self._z]), axis=0, return_index=True, return_inverse=True
+        )
+
+        coeffs = np.zeros(len(first), dtype=np.result_type(self._coeffs, float))
+        np.add.at(coeffs, inverse.ravel(), self._coeffs)
+
+        order = np.argsort(first)
+        order = order[~np.isclose(coeffs[order], 0)]
+        indices = first[order]
+
+        return PauliSum(coeffs[order], self._x[indices], self._z[indices], self._wires)
+
+    def to_hamiltonian(self):
+        """Converts the Pauli sum into a Hamiltonian.
+
+        Returns:
+            ~.Hamiltonian: the Hamiltonian with the same terms
+        """
+        return qml.Hamiltonian(*self.terms)
+
+    def __len__(self):
+        return len(self._coeffs)
+
+    def __getitem__(self, index):
+        """Returns the Pauli sum of a subset of the terms.
+
+        Args:
+            index (int, slice or array[int]): the terms to select
+
+        Returns:
+            PauliSum: the selected terms
+        """
+        index = np.atleast_1d(np.arange(len(self))[index])
+        return PauliSum(self._coeffs[index], self._x[index], self._z[index], self._wires)
+
+    def __repr__(self):
+        return f"<PauliSum: terms={len(self)}, wires={self._wires.tolist()}>"
@@ -29,6 +29,24 @@ from pennylane.wires import Wires
 OBS_MAP = {"PauliX": "X", "PauliY": "Y", "PauliZ": "Z", "Hadamard": "H", "Identity": "I"}
 
 
+def _term_key(op):
+    """Returns a hashable key of a Hamiltonian term, independent of the order of its factors.
+
+    Two terms have the same key if and only if they are equivalent according to
+    :meth:`~.Observable.compare`.
+
+    Args:
+        op (~.Tensor): the term
+
+    Returns:
+        frozenset: the names, wires and serialized parameters of the non-identity factors
+    """
+    return frozenset(
+        (ob.name, ob.wires, tuple(np.asarray(p).tobytes() for p in ob.parameters))
+        for ob in op.non_identity_obs
+    )
+
+
 class Hamiltonian:
     r"""Lightweight class for representing Hamiltonians for Variational Quantum
     Eigensolver problems.
@@ -162,6 +180,15 @@ class Hamiltonian:
     def name(self):
         return "Hamiltonian"
 
+    def diagonalizing_gates(self):
+        """Returns an empty list, as devices supporting Hamiltonians compute their
+        expectation values from the unrotated state.
+
+        Returns:
+            list: empty list
+        """
+        return []
+
     def simplify(self):
         r"""Simplifies the Hamiltonian by combining like-terms.
 
@@ -174,26 +201,23 @@ class Hamiltonian:
           (-1) [X0]
         + (1) [Y2]
         """
-        coeffs = []
-        ops = []
+        # like-terms are merged in a dictionary keyed by their order-independent
+        # serialization, which preserves the order of first occurrence
+        terms = {}
 
         for c, op in zip(self.coeffs, self.ops):
             op = op if isinstance(op, Tensor) else Tensor(op)
+            key = _term_key(op)
 
-            ind = None
-            for i, other in enumerate(ops):
-                if op.compare(other):
-                    ind = i
-                    break
-
-            if ind is not None:
-                coeffs[ind] += c
-                if np.allclose([coeffs[ind]], [0]):
-                    del coeffs[ind]
-                    del ops[ind]
+            if key in terms:
+                terms[key][0] += c
+                if np.allclose([terms[key][0]], [0]):
+                    del terms[key]
             else:
-                ops.append(op.prune())
-                coeffs.append(c)
+                terms[key] = [c, op.prune()]
+
+        coeffs = [term[0] for term in terms.values()]
+        ops = [term[1] for term in terms.values()]
 
         self._coeffs = coeffs
         self._ops = ops
@@ -437,7 +461,8 @@ class ExpvalCost:
             where ``params`` are the trainable weights of the variational circuit, and
             ``kwargs`` are any additional keyword arguments that need to be passed
             to the template.
-        hamiltonian (~.Hamiltonian): Hamiltonian operator whose expectation value should be measured
+        hamiltonian (~.Hamiltonian or ~.PauliSum): Hamiltonian operator whose expectation value
+            should be measured
         device (Device, Sequence[Device]): Corresponding device(s) where the resulting
             cost function should be executed. This can either be a single device, or a list
             of devices of length matching the number of terms in the Hamiltonian.
@@ -538,7 +563,7 @@ class ExpvalCost:
         coeffs, observables = hamiltonian.terms
 
         self.hamiltonian = hamiltonian
-        """Hamiltonian: the input Hamiltonian."""
+        """Hamiltonian or PauliSum: the input Hamiltonian."""
 
         self.qnodes = None
         """QNodeCollection: The QNodes to be evaluated. Each QNode corresponds to the expectation
@@ -562,7 +587,14 @@ class ExpvalCost:
             if self._multiple_devices:
                 raise ValueError("Using multiple devices is not supported when optimize=True")
 
-            obs_groupings, coeffs_groupings = qml.grouping.group_observables(observables, coeffs)
+            if isinstance(hamiltonian, qml.vqe.PauliSum):
+                groupings = qml.grouping.group_observables(hamiltonian)
+                obs_groupings = [g.ops for g in groupings]
+                coeffs_groupings = [g.coeffs for g in groupings]
+            else:
+                obs_groupings, coeffs_groupings = qml.grouping.group_observables(
+                    observables, coeffs
+                )
             d = device[0] if self._multiple_devices else device
             w = d.wires.tolist()
 
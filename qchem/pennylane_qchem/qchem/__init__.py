@@ -23,6 +23,7 @@ __all__ = [
     "decompose",
     "convert_observable",
     "molecular_hamiltonian",
+    "molecular_hamiltonians",
     "hf_state",
     "excitations",
     "excitations_to_wires",
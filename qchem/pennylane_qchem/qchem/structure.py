@@ -13,8 +13,12 @@
 # limitations under the License.
 """This module contains the core functions for electronic structure calculations,
 and converting the resulting data structures to forms understood by PennyLane."""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import hashlib
+import json
 import os
 import subprocess
+import tempfile
 from shutil import copyfile
 
 import numpy as np
@@ -723,6 +727,138 @@ def convert_observable(qubit_observable, wires=None, tol=1e08):
     return Hamiltonian(*_qubit_operator_to_terms(qubit_observable, wires=wires))
 
 
+# distributions whose versions determine the Hamiltonians computed with each package
+_CACHE_DISTRIBUTIONS = {
+    "pyscf": ("openfermion", "openfermionpyscf", "pyscf"),
+    "psi4": ("openfermion", "openfermionpsi4", "psi4"),
+}
+
+
+def _distribution_versions(package):
+    r"""Returns the installed versions of the distributions used to compute molecular
+    Hamiltonians with the given quantum chemistry package.
+
+    Args:
+        package (str): quantum chemistry package, ``'pyscf'`` or ``'psi4'``
+
+    Returns:
+        dict[str, str]: the version of each distribution, or ``None`` if it is not installed
+        as a Python distribution
+    """
+    try:
+        from importlib import metadata  # pylint: disable=import-outside-toplevel
+    except ImportError:  # pragma: no cover
+        import importlib_metadata as metadata  # pylint: disable=import-outside-toplevel
+
+    versions = {}
+
+    for name in _CACHE_DISTRIBUTIONS.get(package, ("openfermion",)):
+        try:
+            versions[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            versions[name] = None
+
+    return versions
+
+
+def _hamiltonian_cache_key(
+    symbols, coordinates, charge, mult, basis, package, active_electrons, active_orbitals, mapping
+):  # pylint: disable=too-many-arguments
+    r"""Computes the key identifying a molecular Hamiltonian in the on-disk cache.
+
+    The key is the SHA-256 digest of all arguments of :func:`~.molecular_hamiltonian` that
+    determine the coefficients and Pauli words of the qubit Hamiltonian, and of the versions
+    of OpenFermion and the quantum chemistry package, such that Hamiltonians cached with a
+    different software stack are not reused. The coordinates enter with their exact binary
+    representation.
+
+    Returns:
+        str: hexadecimal digest of the arguments
+    """
+    package = package.strip().lower()
+    arguments = {
+        "symbols": [symbol.strip() for symbol in symbols],
+        "coordinates": np.asarray(coordinates, dtype=np.float64).tobytes().hex(),
+        "charge": int(charge),
+        "mult": int(mult),
+        "basis": basis.strip().lower(),
+        "package": package,
+        "active_electrons": None if active_electrons is None else int(active_electrons),
+        "active_orbitals": None if active_orbitals is None else int(active_orbitals),
+        "mapping": mapping.strip().lower(),
+        "versions": _distribution_versions(package),
+    }
+    return hashlib.sha256(json.dumps(arguments, sort_keys=True).encode()).hexdigest()
+
+
+def _save_qubit_operator(path, qubit_operator, qubits):
+    r"""Stores the terms of a qubit operator in a compressed ``.npz`` file.
+
+    The real parts of the coefficients are stored in an array of floats, and each Pauli word
+    is stored as two rows of packed bits, marking the qubits acted on by :math:`X` or
+    :math:`Y`, and by :math:`Z` or :math:`Y`, respectively. The file is written to a
+    temporary location and then moved to ``path``, such that concurrent jobs never read
+    partially written entries.
+
+    Args:
+        path (str): path of the cache entry
+        qubit_operator (QubitOperator): the qubit operator
+        qubits (int): number of qubits the operator acts on
+    """
+    terms = list(qubit_operator.terms.items())
+
+    coeffs = np.real(np.array([coef for _, coef in terms], dtype=np.complex128))
+    x = np.zeros((len(terms), qubits), dtype=bool)
+    z = np.zeros((len(terms), qubits), dtype=bool)
+
+    for k, (term, _) in enumerate(terms):
+        for i, pauli in term:
+            x[k, i] = pauli != "Z"
+            z[k, i] = pauli != "X"
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".npz")
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez_compressed(
+                f,
+                coeffs=coeffs,
+                x=np.packbits(x, axis=1),
+                z=np.packbits(z, axis=1),
+                qubits=qubits,
+            )
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _load_qubit_operator(path):
+    r"""Loads a qubit operator stored by :func:`~._save_qubit_operator`.
+
+    Args:
+        path (str): path of the cache entry
+
+    Returns:
+        tuple[QubitOperator, int]: the qubit operator and the number of qubits
+    """
+    with np.load(path) as data:
+        qubits = int(data["qubits"])
+        coeffs = data["coeffs"]
+        x = np.unpackbits(data["x"], axis=1, count=qubits).astype(bool)
+        z = np.unpackbits(data["z"], axis=1, count=qubits).astype(bool)
+
+    paulis = {(True, False): "X", (True, True): "Y", (False, True): "Z"}
+    qubit_operator = openfermion.QubitOperator()
+
+    # the terms are assigned directly, since adding operators discards small coefficients
+    for coef, x_row, z_row in zip(coeffs, x, z):
+        term = tuple((int(i), paulis[x_row[i], z_row[i]]) for i in np.flatnonzero(x_row | z_row))
+        qubit_operator.terms[term] = coef
+
+    return qubit_operator, qubits
+
+
 def molecular_hamiltonian(
     symbols,
     coordinates,
@@ -736,6 +872,7 @@ def molecular_hamiltonian(
     mapping="jordan_wigner",
     outpath=".",
     wires=None,
+    cache_dir=None,
 ):  # pylint:disable=too-many-arguments
     r"""Generates the qubit Hamiltonian of a molecule.
 
@@ -799,6 +936,12 @@ def molecular_hamiltonian(
             corresponding to the qubit number equal to its index.
             For type dict, only int-keyed dict (for qubit-to-wire conversion) is accepted for
             partial mapping. If None, will use identity map.
+        cache_dir (str): Path to a directory used to cache the qubit Hamiltonians across calls
+            and processes. Entries are keyed on the symbols, coordinates, charge, multiplicity,
+            basis set, quantum chemistry package, active space and mapping, and on the
+            installed versions of OpenFermion and the quantum chemistry package. If a Hamiltonian
+            with the same key was computed before, it is loaded without running the
+            mean field calculation. If None, no cache is used.
 
     Returns:
         tuple[pennylane.Hamiltonian, int]: the fermionic-to-qubit transformed Hamiltonian
@@ -826,8 +969,32 @@ def molecular_hamiltonian(
     + (0.1676831945771896) [Z1 Z2]
     + (0.12293305056183801) [Z1 Z3]
     + (0.176276408043196) [Z2 Z3]
+
+    Scans of a potential energy surface can share a cache directory, such that repeated
+    geometries are only computed once:
+
+    >>> H, qubits = molecular_hamiltonian(symbols, coordinates, cache_dir="./h2_cache")
+    >>> H, qubits = molecular_hamiltonian(symbols, coordinates, cache_dir="./h2_cache")  # cached
     """
 
+    if cache_dir is not None:
+        key = _hamiltonian_cache_key(
+            symbols,
+            coordinates,
+            charge,
+            mult,
+            basis,
+            package,
+            active_electrons,
+            active_orbitals,
+            mapping,
+        )
+        cache_file = os.path.join(cache_dir, key + ".npz")
+
+        if os.path.isfile(cache_file):
+            h_of, qubits = _load_qubit_operator(cache_file)
+            return convert_observable(h_of, wires=wires), qubits
+
     hf_file = meanfield(symbols, coordinates, name, charge, mult, basis, package, outpath)
 
     molecule = openfermion.MolecularData(filename=hf_file)
@@ -837,8 +1004,118 @@ def molecular_hamiltonian(
     )
 
     h_of, qubits = (decompose(hf_file, mapping, core, active), 2 * len(active))
+    hamiltonian = convert_observable(h_of, wires=wires)
+
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        _save_qubit_operator(cache_file, h_of, qubits)
+
+    return hamiltonian, qubits
+
+
+def molecular_hamiltonians(
+    symbols,
+    coordinates,
+    name="molecule",
+    charge=0,
+    mult=1,
+    basis="sto-3g",
+    package="pyscf",
+    active_electrons=None,
+    active_orbitals=None,
+    mapping="jordan_wigner",
+    outpath=".",
+    wires=None,
+    cache_dir=None,
+    max_workers=None,
+):  # pylint:disable=too-many-arguments
+    r"""Generates the qubit Hamiltonians of a molecule for a batch of geometries.
+
+    Each Hamiltonian is built by :func:`~.molecular_hamiltonian` in a separate process of a
+    process pool, such that the mean field calculations and the fermionic-to-qubit
+    transformations of different geometries run in parallel. This is useful to prepare the
+    Hamiltonians along a potential energy surface.
+
+    The Hamiltonians are yielded as soon as they are computed, which is not necessarily
+    the order of the geometries.
+
+    Args:
+        symbols (list[str]): symbols of the atomic species in the molecule
+        coordinates (Iterable[array[float]]): The geometries of the molecule. Each geometry
+            is a 1D array with the atomic positions in Cartesian coordinates, given in atomic
+            units, of size ``3*N`` where ``N`` is the number of atoms.
+        name (str): name of the molecule. The mean field electronic structure of the ``i``-th
+            geometry is saved under the name ``f"{name}_{i}"``.
+        charge (int): net charge of the molecule
+        mult (int): spin multiplicity of the molecule
+        basis (str): atomic basis set used to represent the molecular orbitals
+        package (str): quantum chemistry package (pyscf or psi4) used to solve the
+            mean field electronic structure problem
+        active_electrons (int): Number of active electrons. If not specified, all electrons
+            are considered to be active.
+        active_orbitals (int): Number of active orbitals. If not specified, all orbitals
+            are considered to be active.
+        mapping (str): transformation (``'jordan_wigner'`` or ``'bravyi_kitaev'``) used to
+            map the fermionic Hamiltonian to the qubit Hamiltonian
+        outpath (str): path to the directory containing output files
+        wires (Wires, list, tuple, dict): custom wire mapping for connecting to Pennylane ansatz
+        cache_dir (str): Path to a directory used to cache the qubit Hamiltonians. See
+            :func:`~.molecular_hamiltonian`.
+        max_workers (int): Maximum number of processes. If not specified, the number of
+            processors of the machine is used.
+
+    Returns:
+        generator[tuple[int, pennylane.Hamiltonian, int]]: the index of the geometry, the
+        qubit Hamiltonian and the number of qubits, for each geometry
+
+    **Example**
+
+    >>> symbols = ["H", "H"]
+    >>> coordinates = [np.array([0.0, 0.0, -d / 2, 0.0, 0.0, d / 2]) for d in [1.0, 1.4, 1.8]]
+    >>> for i, H, qubits in molecular_hamiltonians(symbols, coordinates, name="h2"):
+    ...     print(i, len(H.ops), qubits)
+    1 15 4
+    0 15 4
+    2 15 4
+    """
+    coordinates = [np.asarray(c) for c in coordinates]
+
+    for c in coordinates:
+        if c.size != 3 * len(symbols):
+            raise ValueError(
+                "The size of the array 'coordinates' has to be 3*len(symbols) = {};"
+                " got 'coordinates.size' = {}".format(3 * len(symbols), c.size)
+            )
+
+    # the output directories are shared by all processes, and are created only once
+    os.makedirs(
+        os.path.join(outpath.strip(), package.strip().lower(), basis.strip()), exist_ok=True
+    )
+
+    kwargs = dict(
+        charge=charge,
+        mult=mult,
+        basis=basis,
+        package=package,
+        active_electrons=active_electrons,
+        active_orbitals=active_orbitals,
+        mapping=mapping,
+        outpath=outpath,
+        wires=wires,
+        cache_dir=cache_dir,
+    )
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                molecular_hamiltonian, symbols, c, name="{}_{}".format(name.strip(), i), **kwargs
+            ): i
+            for i, c in enumerate(coordinates)
+        }
 
-    return convert_observable(h_of, wires=wires), qubits
+        for future in as_completed(futures):
+            hamiltonian, qubits = future.result()
+            yield futures[future], hamiltonian, qubits
 
 
 def excitations(electrons, orbitals, delta_sz=0):
@@ -1081,6 +1358,7 @@ __all__ = [
     "decompose",
     "convert_observable",
     "molecular_hamiltonian",
+    "molecular_hamiltonians",
     "hf_state",
     "excitations",
     "excitations_to_wires",
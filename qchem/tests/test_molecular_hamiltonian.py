@@ -89,3 +89,99 @@ def test_building_hamiltonian(
 
     assert isinstance(built_hamiltonian, Hamiltonian)
     assert qubits == 2 * nact_orbs
+
+
+def test_hamiltonian_cache(tmpdir, monkeypatch):
+    r"""Test that a cached Hamiltonian is loaded without running the mean field calculation,
+    and that it is identical to the Hamiltonian built from scratch"""
+    h2_symbols = ["H", "H"]
+    h2_coordinates = np.array([0.0, 0.0, -0.66140414, 0.0, 0.0, 0.66140414])
+    cache_dir = os.path.join(tmpdir.strpath, "cache")
+    wires = ["a", "b", 2, 3]
+
+    built_hamiltonian, qubits = qchem.molecular_hamiltonian(
+        h2_symbols, h2_coordinates, outpath=tmpdir.strpath, wires=wires, cache_dir=cache_dir
+    )
+    assert len(os.listdir(cache_dir)) == 1
+
+    def meanfield(*args, **kwargs):
+        raise RuntimeError("The mean field calculation should not run")
+
+    with monkeypatch.context() as m:
+        m.setattr(qchem.structure, "meanfield", meanfield)
+        cached_hamiltonian, cached_qubits = qchem.molecular_hamiltonian(
+            h2_symbols, h2_coordinates, outpath=tmpdir.strpath, wires=wires, cache_dir=cache_dir
+        )
+
+        with pytest.raises(RuntimeError, match="should not run"):
+            qchem.molecular_hamiltonian(
+                h2_symbols, 1.01 * h2_coordinates, outpath=tmpdir.strpath, cache_dir=cache_dir
+            )
+
+    assert cached_qubits == qubits
+    assert np.allclose(cached_hamiltonian.coeffs, built_hamiltonian.coeffs)
+    assert all(
+        built.compare(cached)
+        for built, cached in zip(built_hamiltonian.ops, cached_hamiltonian.ops)
+    )
+
+
+def test_hamiltonian_cache_key():
+    r"""Test that the cache key depends on the arguments defining the Hamiltonian, and
+    that it is insensitive to the case of the mapping and basis"""
+    args = (["H", "H"], np.array([0.0, 0.0, -0.66, 0.0, 0.0, 0.66]), 0, 1, "sto-3g", "pyscf")
+    key = qchem.structure._hamiltonian_cache_key(*args, None, None, "jordan_wigner")
+
+    assert key == qchem.structure._hamiltonian_cache_key(*args, None, None, "JORDAN_wigner")
+    assert key != qchem.structure._hamiltonian_cache_key(*args, 2, 2, "jordan_wigner")
+    assert key != qchem.structure._hamiltonian_cache_key(*args, None, None, "bravyi_kitaev")
+
+    key = qchem.structure._hamiltonian_cache_key(*args, 2, 2, "jordan_wigner")
+    assert key == qchem.structure._hamiltonian_cache_key(
+        *args, np.int64(2), np.int64(2), "jordan_wigner"
+    )
+
+
+def test_hamiltonian_cache_key_versions(monkeypatch):
+    r"""Test that the cache key depends on the installed versions of OpenFermion and the
+    quantum chemistry package"""
+    args = (["H", "H"], np.array([0.0, 0.0, -0.66, 0.0, 0.0, 0.66]), 0, 1, "sto-3g", "pyscf")
+    key = qchem.structure._hamiltonian_cache_key(*args, None, None, "jordan_wigner")
+
+    versions = qchem.structure._distribution_versions("pyscf")
+    assert set(versions) == {"openfermion", "openfermionpyscf", "pyscf"}
+
+    versions["openfermion"] = "0.0.1"
+    monkeypatch.setattr(qchem.structure, "_distribution_versions", lambda package: versions)
+    assert key != qchem.structure._hamiltonian_cache_key(*args, None, None, "jordan_wigner")
+
+
+def test_molecular_hamiltonians(tmpdir):
+    r"""Test that the Hamiltonians built in a process pool agree with the Hamiltonians built
+    one at a time, and that every geometry is returned once"""
+    h2_symbols = ["H", "H"]
+    h2_coordinates = [np.array([0.0, 0.0, -d / 2, 0.0, 0.0, d / 2]) for d in [1.0, 1.4, 1.8]]
+
+    results = list(
+        qchem.molecular_hamiltonians(
+            h2_symbols, h2_coordinates, name="h2", outpath=tmpdir.strpath, max_workers=2
+        )
+    )
+    assert sorted(i for i, _, _ in results) == [0, 1, 2]
+
+    for i, hamiltonian, qubits in results:
+        expected_hamiltonian, expected_qubits = qchem.molecular_hamiltonian(
+            h2_symbols, h2_coordinates[i], name="h2_{}".format(i), outpath=tmpdir.strpath
+        )
+
+        assert qubits == expected_qubits
+        assert np.allclose(hamiltonian.coeffs, expected_hamiltonian.coeffs)
+        assert all(op.compare(exp) for op, exp in zip(hamiltonian.ops, expected_hamiltonian.ops))
+
+
+def test_molecular_hamiltonians_error():
+    r"""Test that an error is raised if a geometry does not match the number of atoms"""
+    coordinates = [np.zeros(6), np.zeros(5)]
+
+    with pytest.raises(ValueError, match="The size of the array 'coordinates' has to be"):
+        list(qchem.molecular_hamiltonians(["H", "H"], coordinates))
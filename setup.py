@@ -25,7 +25,8 @@ requirements = [
     "toml",
     "appdirs",
     "semantic_version==2.6",
-    "autoray"
+    "autoray",
+    "importlib-metadata; python_version < '3.8'"
 ]
 
 info = {
@@ -45,6 +46,7 @@ info = {
             'default.qubit.tf = pennylane.devices.default_qubit_tf:DefaultQubitTF',
             'default.qubit.autograd = pennylane.devices.default_qubit_autograd:DefaultQubitAutograd',
             'default.qubit.jax = pennylane.devices.default_qubit_jax:DefaultQubitJax',
+            'default.qubit.memmap = pennylane.devices.default_qubit_memmap:DefaultQubitMemmap',
             'default.tensor = pennylane.beta.devices.default_tensor:DefaultTensor',
             'default.tensor.tf = pennylane.beta.devices.default_tensor_tf:DefaultTensorTF',
             'default.mixed = pennylane.devices.default_mixed:DefaultMixed'
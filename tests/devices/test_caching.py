@@ -71,7 +71,7 @@ class TestCaching:
 
         result = qn(0.1, 0.2)
         cache_execute = dev._cache_execute
-        hashed = qn.qtape.graph.hash
+        hashed = qn.qtape.hash
 
         assert len(cache_execute) == 1
         assert hashed in cache_execute
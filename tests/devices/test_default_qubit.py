@@ -15,14 +15,19 @@
 Unit tests for the :mod:`pennylane.plugin.DefaultQubit` device.
 """
 import cmath
+import copy
 
 # pylint: disable=protected-access,cell-var-from-loop
 import math
+import threading
+import tracemalloc
 
 import pytest
 import pennylane as qml
 from pennylane import numpy as np, DeviceError
+from pennylane.devices import default_qubit
 from pennylane.devices.default_qubit import _get_slice, DefaultQubit
+from pennylane.utils import _parity
 from pennylane.wires import Wires, WireError
 
 U = np.array(
@@ -2302,3 +2307,688 @@ class TestApplyOperationUnit:
             assert np.allclose(res_state, test_state)
             assert np.allclose(res_mat, op.matrix)
             assert np.allclose(res_wires, wires)
+
+
+class TestGateFusion:
+    """Tests for the fused execution mode of default.qubit."""
+
+    @staticmethod
+    def circuit(weights, wires=4):
+        """Hardware-efficient circuit containing diagonal, non-diagonal and
+        specialized gates."""
+        qml.Hadamard(wires=0)
+        qml.S(wires=1).inv()
+
+        for layer in weights:
+            for i, params in enumerate(layer):
+                qml.Rot(*params, wires=i)
+
+            for i in range(wires - 1):
+                qml.CNOT(wires=[i, i + 1])
+
+            qml.RZ(0.3, wires=2)
+            qml.CZ(wires=[0, 3])
+            qml.Toffoli(wires=[1, 2, 3])
+            qml.MultiRZ(0.2, wires=[0, 1, 2, 3])
+            qml.PhaseShift(0.2, wires=1)
+            qml.CRZ(0.3, wires=[0, 1])
+
+        return qml.state()
+
+    @pytest.mark.parametrize("max_fused_wires", [1, 2, 3, 4])
+    def test_state_matches_unfused(self, max_fused_wires, tol):
+        """Test that the final state is independent of gate fusion"""
+        weights = np.random.random([2, 4, 3])
+
+        dev = qml.device("default.qubit", wires=4)
+        expected = qml.QNode(self.circuit, dev)(weights)
+
+        dev = qml.device("default.qubit", wires=4, max_fused_wires=max_fused_wires)
+        res = qml.QNode(self.circuit, dev)(weights)
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_fewer_operations_applied(self):
+        """Test that fusion reduces the number of operations applied to the state"""
+        weights = np.random.random([2, 4, 3])
+
+        dev = qml.device("default.qubit", wires=4, max_fused_wires=2)
+        circuit = qml.QNode(self.circuit, dev)
+        circuit(weights)
+
+        ops = circuit.qtape.operations
+        fused_ops = dev._fuse_operations(ops)
+        assert len(fused_ops) < len(ops)
+        assert all(len(op.wires) <= 2 or op in ops for op in fused_ops)
+
+    def test_single_operation_blocks_unchanged(self):
+        """Test that blocks containing a single operation are not converted to unitaries,
+        and that operations acting on more wires than allowed are passed through"""
+        dev = qml.device("default.qubit", wires=3, max_fused_wires=2)
+        ops = [qml.PauliX(wires=0), qml.Toffoli(wires=[0, 1, 2]), qml.Hadamard(wires=1)]
+
+        assert dev._fuse_operations(ops) == ops
+
+    def test_diagonal_operations_fused_to_diagonal(self, tol):
+        """Test that blocks of diagonal operations are fused into a diagonal unitary"""
+        dev = qml.device("default.qubit", wires=2, max_fused_wires=2)
+        ops = [qml.RZ(0.4, wires=0), qml.CZ(wires=[0, 1]), qml.PhaseShift(0.1, wires=1)]
+
+        fused_ops = dev._fuse_operations(ops)
+
+        assert len(fused_ops) == 1
+        assert isinstance(fused_ops[0], qml.DiagonalQubitUnitary)
+
+        expected = (
+            np.kron(np.eye(2), ops[2].matrix) @ ops[1].matrix @ np.kron(ops[0].matrix, np.eye(2))
+        )
+        assert np.allclose(np.diag(fused_ops[0].parameters[0]), expected, atol=tol, rtol=0)
+
+    def test_disjoint_blocks_fused_independently(self):
+        """Test that operations on disjoint wires are accumulated into separate blocks"""
+        dev = qml.device("default.qubit", wires=4, max_fused_wires=2)
+        ops = [
+            qml.RX(0.1, wires=0),
+            qml.RX(0.2, wires=2),
+            qml.CNOT(wires=[0, 1]),
+            qml.CNOT(wires=[2, 3]),
+        ]
+
+        fused_ops = dev._fuse_operations(ops)
+
+        assert len(fused_ops) == 2
+        assert [op.wires.tolist() for op in fused_ops] == [[0, 1], [2, 3]]
+
+    def test_state_preparation_after_operations(self):
+        """Test that state preparations are not reordered by fusion and still
+        raise an error when applied after other operations"""
+        dev = qml.device("default.qubit", wires=2, max_fused_wires=2)
+
+        with pytest.raises(DeviceError, match="cannot be used after other Operations"):
+            dev.apply([qml.RX(0.1, wires=0), qml.BasisState(np.array([1]), wires=1)])
+
+    def test_negative_max_fused_wires(self):
+        """Test that an error is raised if the maximum number of fused wires is negative"""
+        with pytest.raises(ValueError, match="must be a non-negative integer"):
+            qml.device("default.qubit", wires=2, max_fused_wires=-1)
+
+
+class TestInplaceBuffers:
+    """Tests for the preallocated double-buffer execution mode of default.qubit."""
+
+    ops = [
+        qml.PauliX(wires=1),
+        qml.PauliY(wires=0),
+        qml.PauliZ(wires=2),
+        qml.Hadamard(wires=1),
+        qml.S(wires=2),
+        qml.T(wires=0),
+        qml.SX(wires=1),
+        qml.CNOT(wires=[2, 0]),
+        qml.CZ(wires=[1, 2]),
+        qml.SWAP(wires=[0, 2]),
+        qml.Toffoli(wires=[2, 0, 1]),
+        qml.RX(0.3, wires=1),
+        qml.Rot(0.1, 0.2, 0.3, wires=2),
+        qml.CRY(0.4, wires=[0, 2]),
+        qml.MultiRZ(0.5, wires=[0, 1, 2]),
+        qml.CSWAP(wires=[1, 0, 2]),
+        qml.QubitUnitary(U2, wires=[2, 1]),
+    ]
+
+    @pytest.mark.parametrize("op", ops)
+    @pytest.mark.parametrize("inverse", [False, True])
+    def test_operation_matches_default(self, op, inverse, tol):
+        """Test that applying an operation in-place gives the same result as the
+        allocating kernels"""
+        dev = qml.device("default.qubit", wires=3, inplace=True)
+
+        state = np.random.random([2] * 3) + 1j * np.random.random([2] * 3)
+        state /= np.linalg.norm(state)
+        original = state.copy()
+
+        op = copy.copy(op)
+        op.inverse = inverse
+
+        res = dev._apply_operation_inplace(state, op)
+        expected = dev._apply_operation(state, op)
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert any(res is buffer for buffer in dev._buffers)
+        assert np.allclose(state, original)
+
+    def test_buffers_alternate(self):
+        """Test that the result of each gate is written into the buffer
+        not holding the input state"""
+        dev = qml.device("default.qubit", wires=2, inplace=True)
+        dev.reset()
+
+        state = dev._state
+        assert state is dev._buffers[0]
+
+        state = dev._apply_operation_inplace(state, qml.Hadamard(wires=0))
+        assert state is dev._buffers[1]
+
+        state = dev._apply_operation_inplace(state, qml.CNOT(wires=[0, 1]))
+        assert state is dev._buffers[0]
+
+    def test_circuit_matches_default(self, tol):
+        """Test that executing a circuit in-place gives the same results as
+        the default execution mode"""
+        weights = np.random.random([2, 3, 3])
+
+        def circuit(weights):
+            qml.templates.StronglyEntanglingLayers(weights, wires=range(3))
+            qml.Toffoli(wires=[0, 1, 2])
+            return qml.expval(qml.PauliX(0)), qml.expval(qml.PauliY(1) @ qml.PauliZ(2))
+
+        expected = qml.QNode(circuit, qml.device("default.qubit", wires=3))(weights)
+
+        dev = qml.device("default.qubit", wires=3, inplace=True)
+        res = qml.QNode(circuit, dev)(weights)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+        # repeated executions reuse the buffers
+        res = qml.QNode(circuit, dev)(weights)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_state_vector_not_modified(self, tol):
+        """Test that an input state vector is never overwritten"""
+        dev = qml.device("default.qubit", wires=2, inplace=True)
+        state = np.array([1, 0, 0, 1j]) / np.sqrt(2)
+        original = state.copy()
+
+        dev.apply([qml.QubitStateVector(state, wires=[0, 1]), qml.PauliX(wires=0)])
+
+        assert np.allclose(state, original)
+        assert np.allclose(dev.state, [0, 1j, 1, 0] / np.sqrt(2), atol=tol, rtol=0)
+
+    def test_rotations_preserve_pre_rotated_state(self, tol):
+        """Test that the diagonalizing rotations do not overwrite the pre-rotated state"""
+        dev = qml.device("default.qubit", wires=1, inplace=True)
+        dev.apply([qml.RY(0.3, wires=0)], rotations=[qml.Hadamard(wires=0)])
+
+        assert np.allclose(dev.state, [np.cos(0.15), np.sin(0.15)], atol=tol, rtol=0)
+        assert np.allclose(
+            dev.analytic_probability(), [0.5 + np.sin(0.3) / 2, 0.5 - np.sin(0.3) / 2]
+        )
+
+
+class TestBroadcastExecution:
+    """Tests for the broadcasted batch execution mode of default.qubit."""
+
+    A = np.array([[1, 2j], [-2j, 0.5]])
+
+    def make_tape(self, x, y, z):
+        """Returns a tape with the given gate parameters"""
+        with qml.tape.JacobianTape() as tape:
+            qml.RX(x, wires=0)
+            qml.RY(y, wires=2)
+            qml.CNOT(wires=[0, 1])
+            qml.CRX(z, wires=[2, 0])
+            qml.RZ(x * y, wires=1)
+            qml.S(wires=2).inv()
+            qml.expval(qml.PauliX(0) @ qml.PauliY(2))
+            qml.var(qml.Hermitian(self.A, wires=1))
+            qml.expval(qml.Identity(2))
+
+        return tape
+
+    def test_results_match_sequential(self, tol):
+        """Test that broadcasted execution gives the same results as
+        executing the tapes sequentially"""
+        tapes = [self.make_tape(*np.random.random(3)) for _ in range(5)]
+
+        dev = qml.device("default.qubit", wires=3)
+        expected = dev.batch_execute(tapes)
+
+        dev = qml.device("default.qubit", wires=3, broadcast=True)
+        res = dev.batch_execute(tapes)
+
+        assert len(res) == len(expected)
+
+        for r, e in zip(res, expected):
+            assert np.allclose(r, e, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize(
+        "obs",
+        [
+            qml.PauliX(0),
+            qml.PauliY(1),
+            qml.PauliX(0) @ qml.PauliY(1),
+            qml.PauliZ(0) @ qml.PauliX(1),
+        ],
+    )
+    def test_pauli_words(self, obs, tol):
+        """Test that expectation values of Pauli words, which are computed from the
+        unrotated state in sequential execution, are correctly broadcasted"""
+        tapes = []
+
+        for x in [0.3, 0.7, 1.1]:
+            with qml.tape.QuantumTape() as tape:
+                qml.RY(x, wires=0)
+                qml.RX(2 * x, wires=1)
+                qml.CNOT(wires=[0, 1])
+                qml.expval(obs)
+
+            tapes.append(tape)
+
+        dev = qml.device("default.qubit", wires=2)
+        expected = dev.batch_execute(tapes)
+
+        dev = qml.device("default.qubit", wires=2, broadcast=True)
+        res = dev.batch_execute(tapes)
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_pauli_x_analytic(self, tol):
+        """Test the broadcasted expectation value of PauliX against the analytic result"""
+        x = np.array([0.3, 0.7])
+        tapes = []
+
+        for theta in x:
+            with qml.tape.QuantumTape() as tape:
+                qml.RY(theta, wires=0)
+                qml.expval(qml.PauliX(0))
+
+            tapes.append(tape)
+
+        dev = qml.device("default.qubit", wires=1, broadcast=True)
+        res = dev.batch_execute(tapes)
+
+        assert np.allclose(np.ravel(res), np.sin(x), atol=tol, rtol=0)
+
+    def test_probs(self, tol):
+        """Test that marginal probabilities are returned in the order of the wires passed"""
+        tapes = []
+
+        for x in [0.1, 0.5, 1.2]:
+            with qml.tape.QuantumTape() as tape:
+                qml.RX(x, wires=0)
+                qml.RY(2 * x, wires=2)
+                qml.CNOT(wires=[0, 1])
+                qml.probs(wires=[2, 0])
+
+            tapes.append(tape)
+
+        dev = qml.device("default.qubit", wires=3)
+        expected = dev.batch_execute(tapes)
+
+        dev = qml.device("default.qubit", wires=3, broadcast=True)
+        res = dev.batch_execute(tapes)
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_param_shift_gradient(self, tol):
+        """Test that parameter-shift gradient tapes are correctly executed"""
+        tape = self.make_tape(0.3, 0.4, 0.2)
+        tapes, fn = qml.gradients.param_shift(tape)
+
+        dev = qml.device("default.qubit", wires=3)
+        expected = fn(dev.batch_execute(tapes))
+
+        dev = qml.device("default.qubit", wires=3, broadcast=True)
+        res = fn(dev.batch_execute(tapes))
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_grouping_and_fallback(self, mocker):
+        """Test that only structurally identical supported tapes are executed jointly,
+        and that the results are returned in the order of the input tapes"""
+        dev = qml.device("default.qubit", wires=3, broadcast=True)
+        spy_broadcast = mocker.spy(dev, "_execute_broadcast")
+        spy_execute = mocker.spy(dev, "execute")
+
+        with qml.tape.QuantumTape() as sampled:
+            qml.RX(0.2, wires=0)
+            qml.sample(qml.PauliZ(0))
+
+        with qml.tape.QuantumTape() as other:
+            qml.RY(0.2, wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        tapes = [self.make_tape(0.1, 0.2, 0.3), other, self.make_tape(0.4, 0.5, 0.6)]
+        res = dev.batch_execute(tapes)
+
+        assert spy_broadcast.call_count == 1
+        assert spy_execute.call_count == 1
+        assert np.allclose(res[1], np.cos(0.2))
+
+        expected = qml.device("default.qubit", wires=3).execute(tapes[2])
+        assert np.allclose(res[2], expected)
+
+        with pytest.warns(UserWarning, match="number of shots has to be explicitly set"):
+            dev.batch_execute([sampled, sampled])
+
+        assert spy_broadcast.call_count == 1
+        assert spy_execute.call_count == 3
+
+    def test_finite_shots_not_broadcast(self, mocker):
+        """Test that broadcasting is not used in non-analytic mode"""
+        dev = qml.device("default.qubit", wires=3, shots=10, broadcast=True)
+        spy = mocker.spy(dev, "_execute_broadcast")
+
+        dev.batch_execute([self.make_tape(0.1, 0.2, 0.3), self.make_tape(0.4, 0.5, 0.6)])
+        spy.assert_not_called()
+
+    def test_tracker(self):
+        """Test that the tracker records one execution per circuit"""
+        dev = qml.device("default.qubit", wires=3, broadcast=True)
+        tapes = [self.make_tape(*np.random.random(3)) for _ in range(4)]
+
+        with qml.Tracker(dev) as tracker:
+            dev.batch_execute(tapes)
+
+        assert tracker.totals == {"executions": 4, "batches": 1, "batch_len": 4}
+        assert dev.num_executions == 4
+
+
+class TestMultiThreading:
+    """Tests for applying gates using multiple threads"""
+
+    def circuit(self, dev):
+        """Returns a QNode on the given device mixing diagonal, small and large gates"""
+        U = qml.Hadamard._matrix()
+        U = np.kron(np.kron(U, qml.RX._matrix(0.3)), qml.RY._matrix(0.2))
+
+        @qml.qnode(dev, diff_method="parameter-shift")
+        def circuit():
+            for i in range(4):
+                qml.Rot(0.1 * i, 0.2, 0.3, wires=i)
+            qml.CNOT(wires=[0, 1])
+            qml.Toffoli(wires=[3, 1, 2])
+            qml.MultiRZ(0.3, wires=[0, 2, 3])
+            qml.CRY(0.2, wires=[3, 0])
+            qml.QubitUnitary(U, wires=[2, 0, 3])
+            qml.SWAP(wires=[1, 3])
+            return qml.probs(wires=[3, 0, 1])
+
+        return circuit
+
+    def test_invalid_num_threads(self):
+        """Test that an error is raised for a non-positive number of threads"""
+        with pytest.raises(ValueError, match="number of threads must be a positive integer"):
+            qml.device("default.qubit", wires=2, num_threads=0)
+
+    @pytest.mark.parametrize("num_threads", [2, 3, 4, 16])
+    @pytest.mark.parametrize("inplace", [False, True])
+    def test_same_result(self, num_threads, inplace, tol, mocker):
+        """Test that applying gates in parallel gives the same result as a single thread"""
+        dev = qml.device("default.qubit", wires=4, num_threads=num_threads, inplace=inplace)
+        dev._parallel_min_wires = 4
+        spy = mocker.spy(dev, "_map_chunks")
+
+        expected = self.circuit(qml.device("default.qubit", wires=4))()
+        res = self.circuit(dev)()
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert spy.call_count > 0
+
+    def test_chunks(self):
+        """Test that the state is split along axes not acted on by the gate"""
+        dev = qml.device("default.qubit", wires=4, num_threads=4)
+        chunks = dev._get_chunks((0, 2))
+
+        assert len(chunks) == 4
+
+        for idx in chunks:
+            assert idx[0] == slice(None)
+            assert idx[2] == slice(None)
+
+        state = np.arange(16).reshape([2] * 4)
+        pieces = np.concatenate([state[idx].ravel() for idx in chunks])
+        assert sorted(pieces) == list(range(16))
+
+    def test_small_states_single_thread(self, mocker):
+        """Test that threads are not used below the minimum number of wires"""
+        dev = qml.device("default.qubit", wires=4, num_threads=4)
+        spy = mocker.spy(dev, "_map_chunks")
+
+        self.circuit(dev)()
+
+        spy.assert_not_called()
+
+    def test_shared_thread_pool(self):
+        """Test that devices using the same number of threads share a thread pool,
+        such that creating devices does not create new worker threads"""
+        num_threads = threading.active_count()
+
+        for _ in range(5):
+            dev = qml.device("default.qubit", wires=4, num_threads=3)
+            dev._parallel_min_wires = 4
+            self.circuit(dev)()
+
+        assert threading.active_count() <= num_threads + 3
+        assert default_qubit._get_thread_pool(3) is default_qubit._get_thread_pool(3)
+
+
+class TestHamiltonianExpval:
+    """Tests for the native expectation value of Hamiltonians"""
+
+    H = qml.Hamiltonian(
+        [0.3, -1.2, 0.5, 0.7],
+        [
+            qml.PauliZ(0) @ qml.PauliX(2),
+            qml.PauliY(1),
+            qml.Identity(0),
+            qml.PauliZ(0) @ qml.Hermitian(np.array([[1, 2j], [-2j, 0]]), 1),
+        ],
+    )
+
+    ops = [
+        qml.RX(0.4, wires=0),
+        qml.RY(0.8, wires=1),
+        qml.CNOT(wires=[0, 1]),
+        qml.RX(-0.3, wires=2),
+        qml.CNOT(wires=[1, 2]),
+    ]
+
+    def test_expval(self, tol):
+        """Test that the expectation value is computed from the state prepared once"""
+        dev = qml.device("default.qubit", wires=3)
+
+        with qml.tape.QuantumTape() as tape:
+            for op in self.ops:
+                op.queue()
+            qml.expval(self.H)
+
+        res = dev.execute(tape)
+
+        Z = np.diag([1, -1])
+        X = qml.PauliX._matrix()
+        Y = qml.PauliY._matrix()
+        I = np.eye(2)
+        H = (
+            0.3 * np.kron(np.kron(Z, I), X)
+            - 1.2 * np.kron(np.kron(I, Y), I)
+            + 0.5 * np.eye(8)
+            + 0.7 * np.kron(np.kron(Z, np.array([[1, 2j], [-2j, 0]])), I)
+        )
+        expected = np.vdot(dev.state, H @ dev.state).real
+
+        assert dev.num_executions == 1
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_state_not_rotated(self):
+        """Test that no diagonalizing gates are applied for a Hamiltonian"""
+        dev = qml.device("default.qubit", wires=3)
+
+        with qml.tape.QuantumTape() as tape:
+            for op in self.ops:
+                op.queue()
+            qml.expval(self.H)
+
+        dev.execute(tape)
+        assert dev._state is dev._pre_rotated_state
+
+    def test_not_supported_with_shots(self):
+        """Test that Hamiltonians are only supported natively in analytic mode"""
+        assert qml.device("default.qubit", wires=1).supports_observable("Hamiltonian")
+        assert not qml.device("default.qubit", wires=1, shots=10).supports_observable("Hamiltonian")
+
+    def test_backprop_gradient(self, tol):
+        """Test that the native expectation value is differentiable using backpropagation"""
+        dev = qml.device("default.qubit.autograd", wires=2)
+        H = qml.Hamiltonian([0.5, -0.2], [qml.PauliX(0) @ qml.PauliZ(1), qml.PauliY(1)])
+
+        @qml.qnode(dev, diff_method="backprop")
+        def circuit(x, y):
+            qml.RY(x, wires=0)
+            qml.RX(y, wires=1)
+            return qml.expval(H)
+
+        x = np.array(0.3, requires_grad=True)
+        y = np.array(-0.6, requires_grad=True)
+
+        res = circuit(x, y)
+        expected = 0.5 * np.sin(x) * np.cos(y) + 0.2 * np.sin(y)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+        grad = qml.grad(circuit)(x, y)
+        expected = [0.5 * np.cos(x) * np.cos(y), -0.5 * np.sin(x) * np.sin(y) + 0.2 * np.cos(y)]
+        assert np.allclose(grad, expected, atol=tol, rtol=0)
+
+
+class TestPauliWordExpval:
+    """Tests for the bitmask kernel evaluating expectation values of Pauli words"""
+
+    ops = [qml.RX(0.1 * i + 0.2, wires=i) for i in range(5)]
+    ops += [qml.CNOT(wires=[i, i + 1]) for i in range(4)]
+    ops += [qml.RY(0.3 * i, wires=i) for i in range(5)]
+
+    def test_parity(self):
+        """Test that the parity of the number of set bits is computed"""
+        x = np.array([0, 1, 2, 3, 7, 2 ** 40 + 1, 2 ** 62 + 2 ** 33 + 5])
+        assert list(_parity(x)) == [bin(i).count("1") % 2 for i in x]
+
+    def test_masks(self):
+        """Test the bitmasks describing a Pauli word"""
+        dev = qml.device("default.qubit", wires=["a", "b", "c", "d"])
+        obs = qml.PauliX("a") @ qml.Identity("b") @ qml.PauliY("c") @ qml.PauliZ("d")
+
+        assert dev._pauli_word_masks(obs) == (0b1010, 0b0011, 1)
+        assert dev._pauli_word_masks(qml.Identity("b")) == (0, 0, 0)
+        assert dev._pauli_word_masks(qml.Hadamard("a")) is None
+        assert dev._pauli_word_masks(qml.PauliX("a") @ qml.Hermitian(np.eye(2), "b")) is None
+
+    @pytest.mark.parametrize(
+        "word",
+        [
+            [qml.PauliZ(2)],
+            [qml.PauliX(0)],
+            [qml.PauliY(4)],
+            [qml.PauliX(1), qml.PauliZ(3)],
+            [qml.PauliY(0), qml.PauliY(2), qml.PauliX(4)],
+            [qml.PauliX(0), qml.PauliY(1), qml.PauliZ(2), qml.PauliY(3), qml.PauliX(4)],
+            [qml.Identity(3), qml.PauliY(1)],
+        ],
+    )
+    def test_expval(self, word, tol):
+        """Test that the expectation values of Pauli words agree with the dense matrices"""
+        dev = qml.device("default.qubit", wires=5)
+        obs = word[0]
+        for factor in word[1:]:
+            obs = obs @ factor
+
+        with qml.tape.QuantumTape() as tape:
+            for op in self.ops:
+                op.queue()
+            qml.expval(obs)
+
+        res = dev.execute(tape)
+
+        matrices = [np.eye(2)] * 5
+        for factor in word:
+            matrices[factor.wires[0]] = factor.matrix
+
+        mat = matrices[0]
+        for m in matrices[1:]:
+            mat = np.kron(mat, m)
+
+        expected = np.vdot(dev.state, mat @ dev.state).real
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_batched(self, tol):
+        """Test that several Pauli words are evaluated jointly"""
+        dev = qml.device("default.qubit", wires=5)
+        dev.apply(self.ops)
+
+        words = [
+            qml.PauliX(0) @ qml.PauliZ(1),
+            qml.PauliX(0) @ qml.PauliY(3),
+            qml.PauliZ(2),
+            qml.PauliX(0),
+            qml.PauliY(4) @ qml.PauliZ(0),
+        ]
+        res = dev._expval_pauli_words([dev._pauli_word_masks(w) for w in words])
+
+        for r, w in zip(res, words):
+            expected = np.vdot(dev.state, dev._apply_observable(dev._state, w).ravel()).real
+            assert np.allclose(r, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("block_wires", [0, 1, 2, 3, 4])
+    def test_blocks(self, block_wires, tol):
+        """Test that evaluating the Pauli words in blocks of amplitudes gives the same
+        expectation values as a single block"""
+        dev = qml.device("default.qubit", wires=5)
+        dev.apply(self.ops)
+
+        words = [
+            qml.PauliX(0) @ qml.PauliZ(1),
+            qml.PauliY(1) @ qml.PauliX(4),
+            qml.PauliZ(2) @ qml.PauliZ(4),
+            qml.PauliY(0) @ qml.PauliY(3),
+        ]
+        masks = [dev._pauli_word_masks(w) for w in words]
+        expected = dev._expval_pauli_words(masks)
+
+        dev._pauli_block_wires = block_wires
+        res = dev._expval_pauli_words(masks)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_memory(self):
+        """Test that the memory allocated while evaluating Pauli words is bounded by
+        the block size, rather than the size of the state"""
+        dev = qml.device("default.qubit", wires=16)
+        dev._pauli_block_wires = 8
+        dev.apply([qml.Hadamard(wires=i) for i in range(16)])
+        masks = [dev._pauli_word_masks(qml.PauliX(3) @ qml.PauliY(12) @ qml.PauliZ(15))]
+
+        tracemalloc.start()
+        dev._expval_pauli_words(masks)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert peak < dev._pre_rotated_state.nbytes / 16
+
+    def test_state_not_rotated(self, mocker):
+        """Test that no rotations are applied if only Pauli words are measured"""
+        dev = qml.device("default.qubit", wires=5)
+        spy = mocker.spy(dev, "_apply_operation")
+
+        with qml.tape.QuantumTape() as tape:
+            for op in self.ops:
+                op.queue()
+            qml.expval(qml.PauliX(0) @ qml.PauliY(1))
+            qml.expval(qml.PauliY(2))
+
+        dev.execute(tape)
+
+        assert spy.call_count == len(self.ops)
+        assert dev._state is dev._pre_rotated_state
+
+    def test_rotations_other_measurements(self, tol):
+        """Test that rotations are applied if other measurements require them"""
+        dev = qml.device("default.qubit", wires=5)
+
+        with qml.tape.QuantumTape() as tape:
+            for op in self.ops:
+                op.queue()
+            qml.expval(qml.PauliX(0) @ qml.PauliY(1))
+            qml.var(qml.PauliY(2))
+
+        res = dev.execute(tape)
+        expval = dev._expval_pauli_words([dev._pauli_word_masks(qml.PauliY(2))])[0]
+
+        assert dev._state is not dev._pre_rotated_state
+        assert np.allclose(res[1], 1 - expval ** 2, atol=tol, rtol=0)
@@ -0,0 +1,222 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Integration tests for the ``default.qubit.memmap`` device.
+"""
+import tracemalloc
+
+import pytest
+
+import pennylane as qml
+from pennylane import numpy as np
+from pennylane.devices.default_qubit_memmap import DefaultQubitMemmap
+
+
+def circuit(dev, diff_method="best"):
+    """Returns a QNode on the given device mixing specialized, diagonal and matrix gates"""
+    U = np.kron(np.kron(qml.Hadamard._matrix(), qml.RX._matrix(0.3)), qml.RY._matrix(0.2))
+    U = np.array(U, requires_grad=False)
+
+    @qml.qnode(dev, diff_method=diff_method)
+    def circuit(x):
+        qml.BasisState(np.array([1, 0, 1], requires_grad=False), wires=[0, 2, 4])
+
+        for i in range(5):
+            qml.Rot(0.1 * i, x, 0.3, wires=i)
+
+        for i in range(4):
+            qml.CNOT(wires=[i, i + 1])
+
+        qml.Toffoli(wires=[0, 4, 3])
+        qml.MultiRZ(0.3, wires=[1, 3, 4])
+        qml.CRY(x, wires=[4, 0])
+        qml.SWAP(wires=[0, 3])
+        qml.QubitUnitary(U, wires=[3, 0, 4])
+        return (
+            qml.expval(qml.PauliX(0) @ qml.PauliY(4)),
+            qml.expval(qml.Hadamard(2)),
+            qml.expval(qml.PauliZ(3)),
+        )
+
+    return circuit
+
+
+class TestMemmapDevice:
+    """Tests for the default.qubit.memmap device"""
+
+    def test_load_device(self):
+        """Test that the device is loaded and stores its state in a memory map"""
+        dev = qml.device("default.qubit.memmap", wires=3)
+
+        assert isinstance(dev, DefaultQubitMemmap)
+        assert isinstance(dev._state, np.memmap)
+        assert np.allclose(dev.state, np.eye(8)[0])
+
+    def test_invalid_chunk_wires(self):
+        """Test that an error is raised for a non-positive number of chunk wires"""
+        with pytest.raises(ValueError, match="number of chunk wires must be a positive integer"):
+            qml.device("default.qubit.memmap", wires=2, chunk_wires=0)
+
+    def test_no_backprop(self):
+        """Test that the device does not offer a backpropagation device"""
+        assert "passthru_devices" not in DefaultQubitMemmap.capabilities()
+
+    def test_directory(self, tmp_path):
+        """Test that the state files are created in the given directory"""
+        dev = qml.device("default.qubit.memmap", wires=3, directory=str(tmp_path))
+        circuit(qml.device("default.qubit.memmap", wires=5, directory=str(tmp_path)))(0.2)
+
+        # temporary files are unlinked on creation
+        assert list(tmp_path.iterdir()) == []
+        assert isinstance(dev._state, np.memmap)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"chunk_wires": 1},
+            {"chunk_wires": 2, "num_threads": 3},
+            {"chunk_wires": 3, "max_fused_wires": 2},
+            {},
+        ],
+    )
+    def test_same_result(self, kwargs, tol):
+        """Test that chunked execution gives the same results as default.qubit"""
+        dev = qml.device("default.qubit.memmap", wires=5, **kwargs)
+        res = circuit(dev)
+        expected = circuit(qml.device("default.qubit", wires=5), diff_method="parameter-shift")
+
+        for x in [0.4, -1.2]:
+            assert np.allclose(res(x), expected(x), atol=tol, rtol=0)
+
+        x = np.array(0.3, requires_grad=True)
+        assert np.allclose(qml.jacobian(res)(x), qml.jacobian(expected)(x), atol=tol, rtol=0)
+
+    def test_chunks(self, mocker):
+        """Test that gates are applied to chunks of the size given by the chunk wires"""
+        dev = qml.device("default.qubit.memmap", wires=5, chunk_wires=2)
+        spy = mocker.spy(qml.devices.DefaultQubit, "_apply_operation")
+
+        dev.apply([qml.CNOT(wires=[1, 3])])
+
+        assert spy.call_count == 8
+        assert all(call[0][1].shape == (1, 2, 1, 2, 1) for call in spy.call_args_list)
+
+    def test_buffers(self):
+        """Test that two buffers are used, and a third one only if rotations are applied"""
+        dev = qml.device("default.qubit.memmap", wires=3, chunk_wires=1)
+
+        dev.apply([qml.Hadamard(wires=0), qml.CNOT(wires=[0, 1]), qml.RY(0.3, wires=2)])
+        assert len(dev._memmaps) == 2
+
+        pre_rotated = np.array(dev.state)
+        dev.reset()
+        dev.apply(
+            [qml.Hadamard(wires=0), qml.CNOT(wires=[0, 1]), qml.RY(0.3, wires=2)],
+            rotations=[qml.Hadamard(wires=1), qml.RX(0.2, wires=2)],
+        )
+
+        assert len(dev._memmaps) == 3
+        assert np.allclose(dev.state, pre_rotated)
+
+    def test_state_vector(self, tol):
+        """Test that a state vector on a subset of wires is prepared in the memory map"""
+        state = np.array([0, 1, 1, 0]) / np.sqrt(2)
+
+        def prepare():
+            qml.QubitStateVector(state, wires=[3, 1])
+            qml.Hadamard(wires=0)
+            return qml.probs(wires=[3, 0, 1])
+
+        dev = qml.device("default.qubit.memmap", wires=4, chunk_wires=1)
+        res = qml.QNode(prepare, dev)()
+        expected = qml.QNode(prepare, qml.device("default.qubit", wires=4))()
+
+        assert isinstance(dev._state, np.memmap)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("wires", [None, [2], [3, 0], [1, 3, 0]])
+    def test_analytic_probability(self, wires, tol):
+        """Test that the chunked marginal probabilities match default.qubit"""
+        ops = [qml.RX(0.1 * i, wires=i) for i in range(4)] + [qml.CNOT(wires=[0, 3])]
+        ops += [qml.RY(0.4, wires=2), qml.CRZ(0.3, wires=[2, 1]), qml.Hadamard(wires=1)]
+
+        dev = qml.device("default.qubit.memmap", wires=4, chunk_wires=1)
+        dev.apply(ops)
+        ref = qml.device("default.qubit", wires=4)
+        ref.apply(ops)
+
+        res = dev.analytic_probability(wires)
+        expected = ref.analytic_probability(wires)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_pauli_words_rotated(self, mocker, tol):
+        """Test that Pauli words are measured from the chunked probabilities after applying
+        the diagonalizing rotations, rather than from the full pre-rotated state"""
+        dev = qml.device("default.qubit.memmap", wires=5, chunk_wires=2)
+        spy_words = mocker.spy(dev, "_expval_pauli_words")
+        spy_probs = mocker.spy(dev, "analytic_probability")
+
+        res = circuit(dev)(0.4)
+        expected = circuit(qml.device("default.qubit", wires=5), diff_method="parameter-shift")
+
+        assert np.allclose(res, expected(0.4), atol=tol, rtol=0)
+        spy_words.assert_not_called()
+        assert spy_probs.call_count > 0
+
+        with qml.tape.QuantumTape() as tape:
+            qml.expval(qml.PauliX(0) @ qml.PauliY(4))
+
+        assert len(dev._validate_and_diagonalize(tape)) > 0
+
+    def test_hamiltonian_split(self, mocker, tol):
+        """Test that Hamiltonians are not supported natively, such that QNodes measure
+        their terms in separate circuits"""
+        dev = qml.device("default.qubit.memmap", wires=3, chunk_wires=1)
+        spy = mocker.spy(dev, "_expval_hamiltonian")
+        H = qml.Hamiltonian([0.5, -0.2], [qml.PauliX(0) @ qml.PauliY(2), qml.PauliZ(1)])
+
+        def ansatz(x):
+            qml.RX(x, wires=0)
+            qml.Hadamard(wires=1)
+            qml.CRY(x, wires=[0, 2])
+            return qml.expval(H)
+
+        assert not dev.supports_observable("Hamiltonian")
+        res = qml.QNode(ansatz, dev)(0.3)
+        expected = qml.QNode(ansatz, qml.device("default.qubit", wires=3))(0.3)
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        spy.assert_not_called()
+
+    def test_memory(self):
+        """Test that measuring Pauli words does not allocate memory of the order of the
+        full state"""
+        num_wires = 16
+        dev = qml.device("default.qubit.memmap", wires=num_wires, chunk_wires=10)
+
+        with qml.tape.QuantumTape() as tape:
+            for i in range(num_wires):
+                qml.Hadamard(wires=i)
+            qml.CNOT(wires=[0, num_wires - 1])
+            qml.expval(qml.PauliX(0) @ qml.PauliY(num_wires - 1))
+            qml.expval(qml.PauliZ(3))
+
+        dev.batch_execute([tape])
+
+        tracemalloc.start()
+        dev.batch_execute([tape])
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert peak < dev._state.nbytes / 4
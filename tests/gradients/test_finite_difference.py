@@ -19,7 +19,12 @@ import pytest
 from pennylane import numpy as np
 
 import pennylane as qml
-from pennylane.gradients import finite_diff, finite_diff_coeffs, generate_shifted_tapes
+from pennylane.gradients import (
+    deduplicate_tapes,
+    finite_diff,
+    finite_diff_coeffs,
+    generate_shifted_tapes,
+)
 
 
 class TestCoeffs:
@@ -128,6 +133,41 @@ class TestShiftedTapes:
         assert res[1].get_parameters(trainable_only=False) == [0.5 * 1.0 + 0.6, 2.0, 3.0, 4.0]
 
 
+class TestDeduplicateTapes:
+    """Tests for the deduplicate_tapes function"""
+
+    def test_behaviour(self):
+        """Test that duplicate tapes are removed in the order of their first occurrence"""
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(1.0, wires=0)
+            qml.Rot(2.0, 3.0, 4.0, wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        tapes = generate_shifted_tapes(tape, 0, shifts=[0.5, 0.0, -0.5, 0.5])
+        tapes.append(tape)
+
+        unique_tapes, indices = deduplicate_tapes(tapes)
+
+        assert len(unique_tapes) == 3
+        assert indices == [0, 1, 2, 0, 1]
+        assert unique_tapes[0] is tapes[0]
+        assert unique_tapes[1] is tapes[1]
+
+    def test_different_measurements(self):
+        """Test that tapes with the same operations but different measurements are distinct"""
+        with qml.tape.QuantumTape() as tape1:
+            qml.RX(1.0, wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        with qml.tape.QuantumTape() as tape2:
+            qml.RX(1.0, wires=0)
+            qml.var(qml.PauliZ(0))
+
+        unique_tapes, indices = deduplicate_tapes([tape1, tape2])
+        assert len(unique_tapes) == 2
+        assert indices == [0, 1]
+
+
 class TestFiniteDiff:
     """Tests for the finite difference gradient transform"""
 
@@ -639,6 +639,47 @@ class TestParameterShiftRule:
         assert gradF == pytest.approx(expected, abs=tol)
         assert gradA == pytest.approx(expected, abs=tol)
 
+    def test_variance_unshifted_term_deduplicated(self, tol):
+        """Tests that the unshifted tape of a gradient recipe with an unshifted term is
+        executed only once when computing the gradient of a variance"""
+        dev = qml.device("default.qubit", wires=1)
+        a = 0.54
+
+        with qml.tape.JacobianTape() as tape:
+            qml.RX(a, wires=0)
+            qml.var(qml.PauliZ(0))
+
+        # the unshifted term cancels against the term shifted by a period
+        recipe = [[0.5, 1, np.pi / 2], [-0.5, 1, -np.pi / 2], [1, 1, 0], [-1, 1, 2 * np.pi]]
+
+        tapes, fn = qml.gradients.param_shift(tape, gradient_recipes=[recipe])
+        gradA = fn(dev.batch_execute(tapes))
+
+        # the unshifted expectation value tape, and three shifted tapes
+        assert len(tapes) == 1 + 3
+        assert len({t.hash for t in tapes}) == len(tapes)
+
+        expected = 2 * np.sin(a) * np.cos(a)
+        assert gradA == pytest.approx(expected, abs=tol)
+
+    def test_identical_shifted_tapes_deduplicated(self, tol):
+        """Tests that shifted tapes that coincide with the unshifted tape are not executed"""
+        dev = qml.device("default.qubit", wires=1)
+
+        with qml.tape.JacobianTape() as tape:
+            qml.RX(0.0, wires=0)
+            qml.RY(0.3, wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        # scaling the vanishing parameter of the RX gate leaves the tape unshifted
+        recipe = [[0.5, 1, np.pi / 2], [-0.5, 1, -np.pi / 2], [1, 2, 0], [-1, 1, 0]]
+
+        tapes, fn = qml.gradients.param_shift(tape, gradient_recipes=[recipe, None])
+        res = fn(dev.batch_execute(tapes))
+
+        assert len(tapes) == 1 + 2 + 2
+        assert np.allclose(res, [[0, -np.sin(0.3)]], atol=tol, rtol=0)
+
     def test_non_involutory_variance(self, tol):
         """Tests a qubit Hermitian observable that is not involutory"""
         dev = qml.device("default.qubit", wires=1)
@@ -0,0 +1,211 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Tests for the gradients.parameter_shift_hessian module.
+"""
+import pytest
+
+from pennylane import numpy as np
+
+import pennylane as qml
+from pennylane.gradients import param_shift_hessian
+
+
+class TestParamShiftHessian:
+    """Unit tests for the param_shift_hessian function"""
+
+    def test_state_error(self):
+        """Test that an error is raised if the tape returns the state"""
+        with qml.tape.JacobianTape() as tape:
+            qml.RX(0.543, wires=[0])
+            qml.state()
+
+        with pytest.raises(ValueError, match="return the state is not supported"):
+            param_shift_hessian(tape)
+
+    def test_variance_error(self):
+        """Test that an error is raised if the tape returns a variance"""
+        with qml.tape.JacobianTape() as tape:
+            qml.RX(0.543, wires=[0])
+            qml.var(qml.PauliZ(0))
+
+        with pytest.raises(ValueError, match="return variances is not supported"):
+            param_shift_hessian(tape)
+
+    def test_no_trainable_parameters(self):
+        """Test that if the tape has no trainable parameters, no tapes are
+        generated and the returned Hessian is empty"""
+        with qml.tape.JacobianTape() as tape:
+            qml.RX(0.543, wires=[0])
+            qml.expval(qml.PauliZ(0))
+
+        tape.trainable_params = {}
+        tapes, fn = param_shift_hessian(tape)
+
+        assert len(tapes) == 0
+        assert fn([]).shape == (1, 0, 0)
+
+    @pytest.mark.parametrize("num_params", [1, 2, 5])
+    def test_number_of_tapes(self, num_params):
+        """Test that the unshifted tape is shared by the diagonal entries, and the
+        shifts by +-pi of the diagonal entries are identified"""
+        with qml.tape.JacobianTape() as tape:
+            for i in range(num_params):
+                qml.RX(0.1 * i, wires=[0])
+                qml.RY(0.2 * i, wires=[0])
+            qml.expval(qml.PauliZ(0))
+
+        tapes, _ = param_shift_hessian(tape)
+        p = 2 * num_params
+        assert len(tapes) == 2 * p * (p - 1) + p + 1
+
+        tapes, _ = param_shift_hessian(tape, f0=np.array([1.0]))
+        assert len(tapes) == 2 * p * (p - 1) + p
+
+    def test_distinct_tapes(self):
+        """Test that all generated tapes are distinct"""
+        with qml.tape.JacobianTape() as tape:
+            qml.RX(0.1, wires=[0])
+            qml.CRY(0.2, wires=[0, 1])
+            qml.RZ(0.3, wires=[1])
+            qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+        tapes, _ = param_shift_hessian(tape)
+        unique_tapes, _ = qml.gradients.deduplicate_tapes(tapes)
+        assert len(unique_tapes) == len(tapes)
+
+    def test_argnum(self):
+        """Test that only the entries of the parameters in argnum are computed"""
+        dev = qml.device("default.qubit", wires=2)
+
+        with qml.tape.JacobianTape() as tape:
+            qml.RX(0.1, wires=[0])
+            qml.RY(0.2, wires=[0])
+            qml.RX(0.3, wires=[0])
+            qml.expval(qml.PauliZ(0))
+
+        tapes, fn = param_shift_hessian(tape, argnum=[0, 2])
+        res = fn(dev.batch_execute(tapes))
+        assert len(tapes) == 2 * 2 + 2 + 1
+
+        tapes, fn = param_shift_hessian(tape)
+        expected = fn(dev.batch_execute(tapes))
+
+        assert np.allclose(res[:, 1], 0)
+        assert np.allclose(res[:, :, 1], 0)
+        assert np.allclose(res[:, ::2, ::2], expected[:, ::2, ::2])
+
+    def test_f0(self):
+        """Test that the provided output of the unshifted tape is used"""
+        dev = qml.device("default.qubit", wires=1)
+
+        with qml.tape.JacobianTape() as tape:
+            qml.RX(0.1, wires=[0])
+            qml.RY(0.2, wires=[0])
+            qml.probs(wires=0)
+
+        tapes, fn = param_shift_hessian(tape)
+        expected = fn(dev.batch_execute(tapes))
+
+        tapes, fn = param_shift_hessian(tape, f0=dev.batch_execute([tape])[0])
+        res = fn(dev.batch_execute(tapes))
+        assert np.allclose(res, expected)
+
+
+class TestParamShiftHessianIntegration:
+    """Integration tests comparing the param_shift_hessian function
+    to the Hessian computed using backpropagation"""
+
+    def test_expval(self, tol):
+        """Test the Hessian of multiple expectation values"""
+        dev = qml.device("default.qubit", wires=2)
+        params = np.array([0.543, -0.654, 0.3], requires_grad=True)
+
+        def ansatz(x):
+            qml.RX(x[0], wires=[0])
+            qml.RY(x[1], wires=[1])
+            qml.CNOT(wires=[0, 1])
+            qml.RX(x[2], wires=[1])
+
+        with qml.tape.JacobianTape() as tape:
+            ansatz(params)
+            qml.expval(qml.PauliZ(0))
+            qml.expval(qml.PauliY(1))
+
+        tapes, fn = param_shift_hessian(tape)
+        res = fn(dev.batch_execute(tapes))
+        assert res.shape == (2, 3, 3)
+
+        @qml.qnode(qml.device("default.qubit.autograd", wires=2), diff_method="backprop")
+        def circuit(x):
+            ansatz(x)
+            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliY(1))
+
+        expected = qml.jacobian(qml.jacobian(circuit))(params)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_ragged_probs(self, tol):
+        """Test the Hessian of probabilities with ragged output, with respect
+        to a parameter with a four-term parameter-shift rule"""
+        dev = qml.device("default.qubit", wires=2)
+        params = np.array([0.4, 0.7], requires_grad=True)
+
+        with qml.tape.JacobianTape() as tape:
+            qml.RX(params[0], wires=[0])
+            qml.CRX(params[1], wires=[0, 1])
+            qml.probs(wires=0)
+            qml.probs(wires=[0, 1])
+
+        tapes, fn = param_shift_hessian(tape)
+        res = fn(dev.batch_execute(tapes))
+        assert res.shape == (6, 2, 2)
+
+        @qml.qnode(qml.device("default.qubit.autograd", wires=2), diff_method="backprop")
+        def circuit(x):
+            qml.RX(x[0], wires=[0])
+            qml.CRX(x[1], wires=[0, 1])
+            return qml.probs(wires=[0, 1])
+
+        expected = qml.jacobian(qml.jacobian(circuit))(params)
+        assert np.allclose(res[2:], expected, atol=tol, rtol=0)
+
+    def test_tape_hessian(self, mocker, tol):
+        """Test that the Hessian method of tapes uses a single batch of tapes
+        generated by param_shift_hessian"""
+        spy = mocker.spy(qml.gradients, "param_shift_hessian")
+        dev = qml.device("default.qubit", wires=2)
+        params = np.array([0.543, -0.654, 0.3], requires_grad=True)
+
+        def ansatz(x):
+            qml.RX(x[0], wires=[0])
+            qml.RY(x[1], wires=[1])
+            qml.CNOT(wires=[0, 1])
+            qml.RX(x[2], wires=[1])
+
+        with qml.tape.QubitParamShiftTape() as tape:
+            ansatz(params)
+            qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+        res = tape.hessian(dev)
+        assert res.shape == (3, 3)
+        assert spy.call_count == 1
+        assert dev.num_executions == 2 * 3 * 2 + 3 + 1
+
+        @qml.qnode(qml.device("default.qubit.autograd", wires=2), diff_method="backprop")
+        def circuit(x):
+            ansatz(x)
+            return qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+        expected = qml.jacobian(qml.grad(circuit))(params)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
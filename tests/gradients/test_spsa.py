@@ -0,0 +1,283 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Tests for the gradients.spsa module.
+"""
+import pytest
+
+from pennylane import numpy as np
+
+import pennylane as qml
+from pennylane.gradients import spsa_grad
+from pennylane.gradients.spsa import rademacher_directions
+
+
+class TestRademacherDirections:
+    """Tests for the rademacher_directions function"""
+
+    def test_behaviour(self):
+        """Test that the directions have the requested shape and entries +-1"""
+        directions = rademacher_directions(50, 7, rng=0)
+        assert directions.shape == (50, 7)
+        assert np.all(np.abs(directions) == 1)
+
+    def test_seed(self):
+        """Test that the same seed results in the same directions, while a
+        generator results in new directions with every call"""
+        assert np.all(rademacher_directions(5, 4, rng=1) == rademacher_directions(5, 4, rng=1))
+
+        rng = np.random.default_rng(1)
+        assert np.any(rademacher_directions(5, 4, rng=rng) != rademacher_directions(5, 4, rng=rng))
+
+
+class TestSpsaGrad:
+    """Tests for the SPSA gradient transform"""
+
+    def test_no_trainable_parameters(self):
+        """Test that if the tape has no trainable parameters, no tapes are
+        generated and the returned Jacobian is empty"""
+        with qml.tape.JacobianTape() as tape:
+            qml.RX(0.543, wires=[0])
+            qml.RY(-0.654, wires=[1])
+            qml.expval(qml.PauliZ(0))
+
+        tape.trainable_params = {}
+
+        tapes, fn = spsa_grad(tape)
+        res = fn([])
+        assert len(tapes) == 0
+        assert res.shape == (1, 0)
+
+    @pytest.mark.parametrize("num_params", [2, 10, 50])
+    def test_number_of_tapes(self, num_params):
+        """Test that the number of generated tapes is independent of the number of parameters"""
+        with qml.tape.JacobianTape() as tape:
+            for i in range(num_params):
+                qml.RX(0.1 * i, wires=[i % 2])
+            qml.expval(qml.PauliZ(0))
+
+        tapes, _ = spsa_grad(tape, num_directions=3)
+        assert len(tapes) == 6
+
+        tapes, _ = spsa_grad(tape, num_directions=3, strategy="forward", approx_order=1)
+        assert len(tapes) == 4
+
+        f0 = np.array([1.0])
+        tapes, _ = spsa_grad(tape, num_directions=3, strategy="forward", approx_order=1, f0=f0)
+        assert len(tapes) == 3
+
+    def test_simultaneous_perturbation(self):
+        """Test that all trainable parameters are shifted by the step size along the direction"""
+        with qml.tape.JacobianTape() as tape:
+            qml.RX(0.1, wires=[0])
+            qml.RY(0.2, wires=[0])
+            qml.RX(0.3, wires=[0])
+            qml.expval(qml.PauliZ(0))
+
+        tape.trainable_params = {0, 2}
+        tapes, _ = spsa_grad(tape, h=0.01, sampler_rng=42)
+        direction = rademacher_directions(1, 2, rng=42)[0]
+
+        assert np.allclose(tapes[0].get_parameters(), [0.1, 0.3] - 0.01 * direction)
+        assert np.allclose(tapes[1].get_parameters(), [0.1, 0.3] + 0.01 * direction)
+        assert np.allclose(tapes[0].get_parameters(trainable_only=False)[1], 0.2)
+
+    def test_single_direction(self):
+        """Test that a single direction gives the derivative along the direction,
+        multiplied by the direction"""
+        dev = qml.device("default.qubit", wires=2)
+        x = 0.543
+        y = -0.654
+
+        with qml.tape.JacobianTape() as tape:
+            qml.RX(x, wires=[0])
+            qml.RY(y, wires=[1])
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+        tapes, fn = spsa_grad(tape, h=1e-4, sampler_rng=3)
+        res = fn(dev.batch_execute(tapes))
+        assert res.shape == (1, 2)
+
+        direction = rademacher_directions(1, 2, rng=3)[0]
+        grad = np.array([-np.sin(y) * np.sin(x), np.cos(y) * np.cos(x)])
+        assert np.allclose(res[0], np.dot(grad, direction) * direction, atol=1e-6)
+
+    @pytest.mark.parametrize("measurement", ["expval", "probs"])
+    def test_f0(self, measurement):
+        """Test that an explicitly passed unshifted result is used, including if it is
+        zero or an array with several entries"""
+        dev = qml.device("default.qubit", wires=2)
+
+        with qml.tape.JacobianTape() as tape:
+            qml.RX(np.pi / 2, wires=[0])
+            qml.RY(0.3, wires=[1])
+            qml.CNOT(wires=[0, 1])
+
+            if measurement == "expval":
+                qml.expval(qml.PauliZ(0))
+            else:
+                qml.probs(wires=[0, 1])
+
+        f0 = dev.batch_execute([tape])[0]
+        if measurement == "expval":
+            assert np.allclose(f0, 0)
+            f0 = 0.0
+
+        kwargs = dict(strategy="forward", approx_order=1, num_directions=3, sampler_rng=5)
+        tapes, fn = spsa_grad(tape, **kwargs)
+        expected = fn(dev.batch_execute(tapes))
+
+        tapes, fn = spsa_grad(tape, f0=f0, **kwargs)
+        assert len(tapes) == 3
+        assert np.allclose(fn(dev.batch_execute(tapes)), expected)
+
+    @pytest.mark.parametrize(
+        "approx_order,strategy", [(1, "forward"), (2, "center"), (2, "backward")]
+    )
+    def test_averaged_estimate(self, approx_order, strategy):
+        """Test that averaging over many directions approximates the gradient"""
+        dev = qml.device("default.qubit", wires=2)
+        params = [0.543, -0.654, 0.2]
+
+        with qml.tape.JacobianTape() as tape:
+            qml.RX(params[0], wires=[0])
+            qml.RY(params[1], wires=[1])
+            qml.RX(params[2], wires=[0])
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.PauliZ(0))
+            qml.var(qml.PauliX(1))
+
+        tapes, fn = spsa_grad(
+            tape,
+            approx_order=approx_order,
+            strategy=strategy,
+            num_directions=2000,
+            sampler_rng=0,
+        )
+        res = fn(dev.batch_execute(tapes))
+        expected = tape.jacobian(dev, method="numeric")
+
+        assert res.shape == (2, 3)
+        assert np.allclose(res, expected, atol=0.05, rtol=0)
+
+    def test_argnum(self):
+        """Test that only the parameters in argnum are perturbed, and the derivatives
+        with respect to the remaining parameters are zero"""
+        dev = qml.device("default.qubit", wires=2)
+
+        with qml.tape.JacobianTape() as tape:
+            qml.RX(0.543, wires=[0])
+            qml.RY(-0.654, wires=[0])
+            qml.expval(qml.PauliZ(0))
+
+        tapes, fn = spsa_grad(tape, argnum=1, num_directions=2)
+        res = fn(dev.batch_execute(tapes))
+
+        for t in tapes:
+            assert np.allclose(t.get_parameters()[0], 0.543)
+
+        # a single perturbed parameter results in the exact derivative
+        expected = tape.jacobian(dev, method="numeric")
+        assert res[0, 0] == 0
+        assert np.allclose(res[0, 1], expected[0, 1], atol=1e-4)
+
+    def test_ragged_output(self):
+        """Test that the Jacobian is correctly returned for a tape
+        with ragged output"""
+        dev = qml.device("default.qubit", wires=3)
+        params = [1.0, 1.0, 1.0]
+
+        with qml.tape.JacobianTape() as tape:
+            qml.RX(params[0], wires=[0])
+            qml.RY(params[1], wires=[1])
+            qml.RZ(params[2], wires=[2])
+            qml.CNOT(wires=[0, 1])
+            qml.probs(wires=0)
+            qml.probs(wires=[1, 2])
+
+        tapes, fn = spsa_grad(tape, num_directions=2)
+        res = fn(dev.batch_execute(tapes))
+        assert res.shape == (6, 3)
+
+    def test_autograd(self):
+        """Tests that the output of the SPSA transform can be differentiated using autograd"""
+        dev = qml.device("default.qubit.autograd", wires=2)
+        params = np.array([0.543, -0.654], requires_grad=True)
+
+        def cost_fn(x):
+            with qml.tape.JacobianTape() as tape:
+                qml.RX(x[0], wires=[0])
+                qml.RY(x[1], wires=[1])
+                qml.CNOT(wires=[0, 1])
+                qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+            tape.trainable_params = {0, 1}
+            tapes, fn = spsa_grad(tape, h=1e-4, sampler_rng=5)
+            return fn(dev.batch_execute(tapes))[0]
+
+        res = qml.jacobian(cost_fn)(params)
+
+        # the estimate is the directional second derivative, multiplied by the direction
+        direction = rademacher_directions(1, 2, rng=5)[0]
+        x, y = params
+        hessian = np.array(
+            [
+                [-np.cos(x) * np.sin(y), -np.cos(y) * np.sin(x)],
+                [-np.cos(y) * np.sin(x), -np.cos(x) * np.sin(y)],
+            ]
+        )
+        expected = np.outer(direction, hessian @ direction)
+        assert np.allclose(res, expected, atol=1e-4, rtol=0)
+
+
+class TestSpsaQNode:
+    """Tests for QNodes using the SPSA differentiation method"""
+
+    def test_qnode_gradient(self):
+        """Test that the gradient of a QNode using SPSA approximates the analytic gradient,
+        and that a random number generator results in new directions for every evaluation"""
+        dev = qml.device("default.qubit", wires=1)
+        rng = np.random.default_rng(0)
+
+        @qml.qnode(dev, diff_method="spsa", num_directions=1000, sampler_rng=rng)
+        def circuit(x):
+            qml.RX(x[0], wires=0)
+            qml.RY(x[1], wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        x = np.array([0.4, 0.5], requires_grad=True)
+        res1 = qml.grad(circuit)(x)
+        res2 = qml.grad(circuit)(x)
+
+        expected = [-np.sin(x[0]) * np.cos(x[1]), -np.cos(x[0]) * np.sin(x[1])]
+        assert np.allclose(res1, expected, atol=0.05)
+        assert not np.allclose(res1, res2)
+
+    def test_qnode_executions(self):
+        """Test that the number of device executions used by SPSA is independent
+        of the number of parameters"""
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev, diff_method="spsa", num_directions=2)
+        def circuit(x):
+            qml.templates.StronglyEntanglingLayers(x, wires=[0, 1])
+            return qml.expval(qml.PauliZ(0))
+
+        x = np.random.random([5, 2, 3], requires_grad=True)
+        circuit(x)
+        executions = dev.num_executions
+
+        qml.grad(circuit)(x)
+        assert dev.num_executions - executions == 1 + 4
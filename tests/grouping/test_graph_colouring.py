@@ -16,7 +16,14 @@ Unit tests for heuristic Pauli graph colouring functions in ``grouping/graph_col
 """
 import pytest
 import numpy as np
-from pennylane.grouping.graph_colouring import largest_first, recursive_largest_first
+import scipy.sparse
+from pennylane.grouping.graph_colouring import (
+    dsatur,
+    largest_first,
+    recursive_largest_first,
+    sorted_insertion,
+)
+from pennylane.grouping.utils import _complement_adj_matrix
 
 
 class TestGraphcolouringFunctions:
@@ -72,9 +79,14 @@ class TestGraphcolouringFunctions:
         dummy_terms = np.reshape(list(range(n_terms)), (n_terms, 1))
         lf_colouring = largest_first(dummy_terms, adjacency_matrix)
         rlf_colouring = recursive_largest_first(dummy_terms, adjacency_matrix)
+        dsatur_colouring = dsatur(dummy_terms, adjacency_matrix)
+        sparse_colouring = dsatur(dummy_terms, scipy.sparse.csr_matrix(adjacency_matrix))
 
         assert self.verify_graph_colour_solution(adjacency_matrix, lf_colouring)
         assert self.verify_graph_colour_solution(adjacency_matrix, rlf_colouring)
+        assert self.verify_graph_colour_solution(adjacency_matrix, dsatur_colouring)
+        assert self.verify_graph_colour_solution(adjacency_matrix, sparse_colouring)
+        assert sum(len(g) for g in dsatur_colouring.values()) == n_terms
 
     term_counts = list(range(10))
 
@@ -87,6 +99,50 @@ class TestGraphcolouringFunctions:
         dummy_terms = np.reshape(list(range(n_terms)), (n_terms, 1))
         lf_colouring = largest_first(dummy_terms, adjacency_matrix)
         rlf_colouring = recursive_largest_first(dummy_terms, adjacency_matrix)
+        dsatur_colouring = dsatur(dummy_terms, adjacency_matrix)
 
         assert self.verify_graph_colour_solution(adjacency_matrix, lf_colouring)
         assert self.verify_graph_colour_solution(adjacency_matrix, rlf_colouring)
+        assert self.verify_graph_colour_solution(adjacency_matrix, dsatur_colouring)
+        assert len(dsatur_colouring) == min(n_terms, 1)
+
+    def test_dsatur_bipartite(self):
+        """Tests that DSATUR colours a cycle of even length with two colours, where largest
+        first may require three colours."""
+        n_terms = 8
+        adjacency_matrix = np.zeros((n_terms, n_terms))
+        for i in range(n_terms):
+            adjacency_matrix[i, (i + 1) % n_terms] = adjacency_matrix[(i + 1) % n_terms, i] = 1
+
+        dummy_terms = np.reshape(list(range(n_terms)), (n_terms, 1))
+        colouring = dsatur(dummy_terms, adjacency_matrix)
+
+        assert self.verify_graph_colour_solution(adjacency_matrix, colouring)
+        assert len(colouring) == 2
+
+    @pytest.mark.parametrize("grouping_type", ["qwc", "commuting", "anticommuting"])
+    def test_sorted_insertion(self, grouping_type):
+        """Tests that sorted insertion partitions Pauli words such that all words in a
+        partition satisfy the relation, and inserts the words by decreasing coefficients."""
+        rng = np.random.default_rng(0)
+        binary_observables = np.unique((rng.random((80, 10)) < 0.3).astype(float), axis=0)[:60]
+        binary_observables = rng.permutation(binary_observables)
+        coefficients = rng.normal(size=60)
+
+        adjacency_matrix = _complement_adj_matrix(binary_observables, grouping_type)
+        dummy_terms = np.reshape(list(range(60)), (60, 1))
+
+        colouring = sorted_insertion(binary_observables, grouping_type, coefficients)
+        indices = {
+            colour: [int(np.flatnonzero((binary_observables == w).all(axis=1))[0]) for w in group]
+            for colour, group in colouring.items()
+        }
+
+        assert sorted(i for g in indices.values() for i in g) == list(range(60))
+        assert self.verify_graph_colour_solution(
+            adjacency_matrix, {c: [dummy_terms[i] for i in g] for c, g in indices.items()}
+        )
+
+        # the first word of the first partition has the largest coefficient
+        assert indices[1][0] == np.argmax(np.abs(coefficients))
+        assert all(np.all(np.diff(np.abs(coefficients[g])) <= 0) for g in indices.values())
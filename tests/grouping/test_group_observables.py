@@ -16,9 +16,14 @@ Unit tests for ``PauliGroupingStrategy`` and ``group_observables`` in ``grouping
 """
 import pytest
 import numpy as np
+import pennylane as qml
 from pennylane import Identity, PauliX, PauliY, PauliZ
 from pennylane.grouping.utils import are_identical_pauli_words
-from pennylane.grouping.group_observables import PauliGroupingStrategy, group_observables
+from pennylane.grouping.group_observables import (
+    GRAPH_COLOURING_METHODS,
+    PauliGroupingStrategy,
+    group_observables,
+)
 
 
 class TestPauliGroupingStrategy:
@@ -281,6 +286,80 @@ class TestGroupObservables:
             for j, pauli in enumerate(partition):
                 assert are_identical_pauli_words(pauli, anticom_partitions_sol[i][j])
 
+    @pytest.mark.parametrize("grouping_type", ["qwc", "commuting", "anticommuting"])
+    @pytest.mark.parametrize("method", ["lf", "rlf", "dsatur", "si"])
+    @pytest.mark.parametrize("observables", observables_list)
+    def test_partitioning_methods(self, observables, grouping_type, method):
+        """Tests that all colouring methods give valid partitions, and keep the coefficients
+        with their Pauli words"""
+        coefficients = list(np.arange(1.0, len(observables) + 1))
+        partitions, partitioned_coeffs = group_observables(
+            observables, coefficients, grouping_type=grouping_type, method=method
+        )
+
+        assert sorted(c for g in partitioned_coeffs for c in g) == coefficients
+
+        for partition, coeffs in zip(partitions, partitioned_coeffs):
+            for pauli_word, c in zip(partition, coeffs):
+                assert pauli_word.compare(observables[int(c) - 1])
+
+            strategy = PauliGroupingStrategy(partition, grouping_type)
+            assert not np.any(strategy.complement_adj_matrix_for_operator())
+
+    def test_sorted_insertion_order(self):
+        """Tests that the sorted insertion method inserts the Pauli words by decreasing
+        magnitude of their coefficients"""
+        observables = [PauliX(0), PauliZ(0), PauliZ(0) @ PauliZ(1), PauliX(1)]
+        coefficients = [0.1, -0.5, 0.3, 0.2]
+
+        partitions, partitioned_coeffs = group_observables(observables, coefficients, method="si")
+
+        assert partitioned_coeffs == [[-0.5, 0.3], [0.2, 0.1]]
+        assert are_identical_pauli_words(partitions[1][0], PauliX(1))
+
+    def test_sorted_insertion_no_graph(self, mocker):
+        """Tests that sorted insertion is not a graph colouring method, and partitions the
+        Pauli words without constructing the adjacency matrix"""
+        observables = [PauliX(0), PauliZ(0), PauliZ(0) @ PauliZ(1), PauliX(1)]
+        strategy = PauliGroupingStrategy(observables, graph_colourer="si")
+        spy = mocker.spy(strategy, "complement_adj_matrix_for_operator")
+
+        assert "si" not in GRAPH_COLOURING_METHODS
+        assert strategy.graph_colourer is None
+        assert len(strategy.colour_pauli_graph()) == 2
+        assert strategy.adj_matrix is None
+        spy.assert_not_called()
+
+    @pytest.mark.parametrize("grouping_type", ["qwc", "commuting", "anticommuting"])
+    @pytest.mark.parametrize("method", ["lf", "rlf", "dsatur", "si"])
+    def test_pauli_sum_partitioning(self, grouping_type, method):
+        """Tests that grouping a ``PauliSum`` gives the same partitions and coefficients as
+        grouping the corresponding observables"""
+        observables = observables_list[0] + [PauliZ(0) @ PauliX(1)]
+        coefficients = list(np.arange(1.0, len(observables) + 1))
+
+        H = qml.Hamiltonian(coefficients, observables)
+        psum = qml.PauliSum.from_hamiltonian(H)
+
+        partitions, partitioned_coeffs = group_observables(
+            observables, coefficients, grouping_type=grouping_type, method=method
+        )
+        res = group_observables(psum, grouping_type=grouping_type, method=method)
+
+        assert len(res) == len(partitions)
+        assert all(isinstance(g, qml.PauliSum) for g in res)
+
+        for group, partition, coeffs in zip(res, partitions, partitioned_coeffs):
+            assert all(are_identical_pauli_words(*pair) for pair in zip(group.ops, partition))
+            assert sorted(group.coeffs) == sorted(coeffs)
+
+    def test_pauli_sum_coefficients_exception(self):
+        """Tests that an exception is raised if coefficients are passed with a ``PauliSum``"""
+        psum = qml.PauliSum.from_hamiltonian(qml.Hamiltonian([0.5], [PauliX(1)]))
+
+        with pytest.raises(ValueError, match="coefficients of a PauliSum are contained"):
+            group_observables(psum, [0.5])
+
     def test_group_observables_exception(self):
         """Tests that the ``group_observables`` function raises an exception if
         the lengths of coefficients and observables do not agree."""
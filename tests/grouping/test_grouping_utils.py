@@ -32,6 +32,8 @@ from pennylane.grouping.utils import (
     is_qwc,
     observables_to_binary_matrix,
     qwc_complement_adj_matrix,
+    _complement_adj_blocks,
+    _complement_adj_matrix,
 )
 
 
@@ -276,6 +278,7 @@ class TestGroupingUtils:
 
         expected = np.array([[0.0, 1.0, 1.0], [1.0, 0.0, 0.0], [1.0, 0.0, 0.0]])
 
+        assert adj.dtype == np.float64
         assert np.all(adj == expected)
 
         binary_obs_list = list(binary_observables)
@@ -286,6 +289,40 @@ class TestGroupingUtils:
         adj = qwc_complement_adj_matrix(binary_obs_tuple)
         assert np.all(adj == expected)
 
+    @pytest.mark.parametrize("grouping_type", ["qwc", "commuting", "anticommuting"])
+    @pytest.mark.parametrize("n_qubits", [1, 5, 70])
+    def test_complement_adj_matrix(self, grouping_type, n_qubits):
+        """Tests that the blocked adjacency matrices agree with the pairwise relations, in both
+        the dense and sparse format"""
+        rng = np.random.default_rng(42)
+        binary_observables = (rng.random((40, 2 * n_qubits)) < 0.3).astype(float)
+
+        expected = np.zeros((40, 40))
+        for i, a in enumerate(binary_observables):
+            for j, b in enumerate(binary_observables):
+                if grouping_type == "qwc":
+                    expected[i, j] = not is_qwc(a, b)
+                    continue
+
+                # symplectic inner product
+                anticommuting = (a[:n_qubits] @ b[n_qubits:] + a[n_qubits:] @ b[:n_qubits]) % 2
+
+                if grouping_type == "commuting":
+                    expected[i, j] = anticommuting
+                else:
+                    expected[i, j] = i != j and not anticommuting
+
+        adj = _complement_adj_matrix(binary_observables, grouping_type)
+        assert adj.dtype == bool
+        assert np.array_equal(adj, expected)
+
+        sparse_adj = _complement_adj_matrix(binary_observables, grouping_type, sparse=True)
+        assert np.array_equal(sparse_adj.toarray(), expected)
+
+        blocks = list(_complement_adj_blocks(binary_observables, grouping_type, block_size=7))
+        assert [start for start, _ in blocks] == list(range(0, 40, 7))
+        assert np.array_equal(np.vstack([block for _, block in blocks]), expected)
+
     def test_qwc_complement_adj_matrix_exception(self):
         """Tests that the ``qwc_complement_adj_matrix`` function raises an exception if
         the matrix is not binary."""
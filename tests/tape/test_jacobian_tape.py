@@ -640,6 +640,31 @@ class TestJacobianIntegration:
 
         assert np.allclose(res, expected, atol=tol, rtol=0)
 
+    def test_spsa(self, mocker):
+        """Tests that the SPSA method uses the SPSA gradient transform, and that the
+        provided parameters are used without modifying the tape"""
+        spy = mocker.spy(qml.gradients, "spsa_grad")
+        dev = qml.device("default.qubit", wires=2)
+        x = 0.543
+        y = -0.654
+
+        with JacobianTape() as tape:
+            qml.RX(0.1, wires=[0])
+            qml.RY(0.2, wires=[1])
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+        res = tape.jacobian(dev, params=[x, y], method="spsa", num_directions=1000, sampler_rng=0)
+        assert res.shape == (1, 2)
+        assert tape.get_parameters() == [0.1, 0.2]
+        assert spy.call_args[1]["num_directions"] == 1000
+
+        expected = np.array([[-np.sin(y) * np.sin(x), np.cos(y) * np.cos(x)]])
+        assert np.allclose(res, expected, atol=0.05, rtol=0)
+
+        with pytest.raises(ValueError, match="Order must be 1 or 2"):
+            tape.jacobian(dev, method="spsa", order=3)
+
 
 class TestJacobianCVIntegration:
     """Intgration tests for the Jacobian method and CV circuits"""
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Unit tests for the QNode"""
+import sys
+
 import pytest
 import numpy as np
 from collections import defaultdict
@@ -240,6 +242,10 @@ class TestValidation:
         assert qn._tape == QubitParamShiftTape
         assert qn.diff_options["method"] == "analytic"
 
+        qn = QNode(dummyfunc, dev, diff_method="spsa")
+        assert qn._tape == JacobianTape
+        assert qn.diff_options["method"] == "spsa"
+
         # check that get_best_method was only ever called once
         mock_best.assert_called_once()
 
@@ -960,6 +966,202 @@ class TestMutability:
         np.testing.assert_allclose(grad, 0, atol=tol, rtol=0)
 
 
+class TestCompiled:
+    """Tests for compiled QNodes"""
+
+    def test_rebinding(self, mocker, tol):
+        """Test that a compiled QNode is only compiled once, and
+        rebinds the tape parameters on further evaluations"""
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev, diff_method="parameter-shift", compiled=True)
+        def circuit(weights, x):
+            qml.templates.StronglyEntanglingLayers(weights, wires=[0, 1])
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0) @ qml.PauliZ(1))
+
+        @qml.qnode(dev, diff_method="parameter-shift")
+        def expected(weights, x):
+            qml.templates.StronglyEntanglingLayers(weights, wires=[0, 1])
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0) @ qml.PauliZ(1))
+
+        weights = pnp.random.random([2, 2, 3], requires_grad=True)
+        spy = mocker.spy(circuit, "construct")
+
+        res = circuit(weights, 0.1)
+        assert spy.call_count == 1
+        assert np.allclose(res, expected(weights, 0.1), atol=tol, rtol=0)
+
+        # the tape is compiled when the signature is encountered for the second time
+        res = circuit(weights, 0.1)
+        assert spy.call_count == 3
+
+        res = circuit(weights * 2, 0.5)
+        assert spy.call_count == 3
+        assert circuit.qtape.get_parameters()[-1] == 0.5
+        assert np.allclose(res, expected(weights * 2, 0.5), atol=tol, rtol=0)
+
+        grad = qml.grad(circuit, argnum=0)(weights, 0.3)
+        assert spy.call_count == 3
+        assert np.allclose(grad, qml.grad(expected, argnum=0)(weights, 0.3), atol=tol, rtol=0)
+
+    def test_retracing(self, mocker):
+        """Test that a compiled QNode is traced again if the shapes of the
+        trainable arguments, or the values of the other arguments change"""
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev, compiled=True)
+        def circuit(x, wires=(0, 1), num_layers=1):
+            for _ in range(num_layers):
+                for i, w in enumerate(wires):
+                    qml.RX(x[i], wires=w)
+            return qml.expval(qml.PauliZ(0))
+
+        spy = mocker.spy(circuit, "_compile")
+        x = pnp.array([0.1, 0.2], requires_grad=True)
+
+        circuit(x, wires=[0, 1])
+        circuit(x + 1, wires=[0, 1])
+        circuit(x + 2, wires=[0, 1])
+        assert spy.call_count == 1
+
+        for _ in range(2):
+            circuit(x, wires=[1, 0])
+        assert spy.call_count == 2
+        assert circuit.qtape.operations[0].wires.tolist() == [1]
+
+        for _ in range(2):
+            circuit(x, wires=[0, 1], num_layers=2)
+        assert spy.call_count == 3
+        assert len(circuit.qtape.operations) == 4
+
+        for _ in range(2):
+            circuit(pnp.array([0.1, 0.2, 0.3], requires_grad=True), wires=[0, 1, 0])
+        assert spy.call_count == 4
+
+        # previously compiled signatures are reused
+        res = circuit(x, wires=[1, 0])
+        assert spy.call_count == 4
+        assert np.allclose(res, np.cos(x[1]))
+
+    def test_signature_cache(self, mocker, monkeypatch):
+        """Test that signatures encountered only once are not compiled, and that
+        only the most recently used signatures are remembered"""
+        monkeypatch.setattr(sys.modules["pennylane.qnode"], "_COMPILED_CACHE_SIZE", 2)
+        dev = qml.device("default.qubit", wires=1)
+
+        @qml.qnode(dev, compiled=True)
+        def circuit(x, data=None):
+            qml.RX(data, wires=0)
+            qml.RY(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        spy_compile = mocker.spy(circuit, "_compile")
+        spy_construct = mocker.spy(circuit, "construct")
+        x = pnp.array(0.5, requires_grad=True)
+
+        for data in [0.1, 0.2, 0.3, 0.4]:
+            res = circuit(x, data=data)
+            assert np.allclose(res, np.cos(data) * np.cos(0.5))
+
+        assert spy_compile.call_count == 0
+        assert spy_construct.call_count == 4
+        assert len(circuit._compiled_tapes) == 2
+
+        # the signature of the first data sample was evicted
+        circuit(x, data=0.1)
+        assert spy_compile.call_count == 0
+
+        circuit(x, data=0.1)
+        assert spy_compile.call_count == 1
+
+    def test_non_trainable_argument(self, mocker):
+        """Test that a non-trainable argument is not rebound"""
+        dev = qml.device("default.qubit", wires=1)
+
+        @qml.qnode(dev, compiled=True)
+        def circuit(x, y):
+            qml.RX(x, wires=0)
+            qml.RY(y, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        spy = mocker.spy(circuit, "_compile")
+        y = pnp.array(0.4, requires_grad=False)
+
+        circuit(0.1, y)
+        circuit(0.2, y)
+        circuit(0.3, y)
+        assert spy.call_count == 1
+
+        res = circuit(0.2, pnp.array(0.6, requires_grad=False))
+        res = circuit(0.2, pnp.array(0.6, requires_grad=False))
+        assert spy.call_count == 2
+        assert np.allclose(res, np.cos(0.2) * np.cos(0.6))
+
+    @pytest.mark.parametrize("diff_method", ["parameter-shift", "adjoint", "finite-diff"])
+    def test_non_trainable_tensor_gradient(self, diff_method, tol):
+        """Test that a compiled QNode with tape parameters taken from a non-trainable
+        tensor argument can be evaluated and differentiated"""
+        dev = qml.device("default.qubit", wires=1)
+
+        @qml.qnode(dev, diff_method=diff_method, compiled=True)
+        def circuit(x, data):
+            qml.RX(data[0], wires=0)
+            qml.RY(x[0], wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        data = pnp.array([0.3], requires_grad=False)
+        x = pnp.array([0.5], requires_grad=True)
+
+        res = circuit(x, data)
+        assert np.allclose(res, np.cos(0.3) * np.cos(0.5), atol=tol, rtol=0)
+
+        grad = qml.grad(circuit)(x, data)
+        assert np.allclose(grad, [-np.cos(0.3) * np.sin(0.5)], atol=1e-6, rtol=0)
+
+        res = circuit(x * 2, data)
+        assert np.allclose(res, np.cos(0.3) * np.cos(1.0), atol=tol, rtol=0)
+
+    def test_unbound_parameters(self, mocker):
+        """Test that a warning is raised, and the tape is constructed on every evaluation,
+        if the tape parameters are not the trainable arguments"""
+        dev = qml.device("default.qubit", wires=1)
+
+        @qml.qnode(dev, compiled=True)
+        def circuit(x):
+            qml.RX(2 * x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        spy = mocker.spy(circuit, "construct")
+
+        circuit(0.1)
+
+        with pytest.warns(UserWarning, match="could not be bound"):
+            circuit(0.1)
+
+        res = circuit(0.3)
+        assert spy.call_count == 4
+        assert np.allclose(res, np.cos(0.6))
+
+    def test_hamiltonian_coefficients(self):
+        """Test that a Hamiltonian with coefficients depending on the
+        trainable arguments is not compiled"""
+        dev = qml.device("default.qubit", wires=1)
+
+        @qml.qnode(dev, diff_method="parameter-shift", compiled=True)
+        def circuit(x):
+            qml.RX(0.5, wires=0)
+            return qml.expval(qml.Hamiltonian([x], [qml.PauliZ(0)]))
+
+        circuit(pnp.array(1.0, requires_grad=True))
+
+        with pytest.warns(UserWarning, match="could not be bound"):
+            circuit(pnp.array(1.0, requires_grad=True))
+
+        assert np.allclose(circuit(2.0), 2 * np.cos(0.5))
+
+
 class TestShots:
     """Unittests for specifying shots per call."""
 
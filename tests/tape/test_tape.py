@@ -309,6 +309,100 @@ class TestGraph:
         spy.assert_called_once()
 
 
+class TestHash:
+    """Tests for the tape hash"""
+
+    @staticmethod
+    def make_tape(x, y, A=np.diag([1.0, -1.0])):
+        """Returns a tape with the given parameters"""
+        with QuantumTape() as tape:
+            qml.RX(x, wires=0)
+            qml.Rot(*y, wires=1)
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.PauliZ(0) @ qml.Hermitian(A, wires=1))
+            qml.probs(wires=[1, 0])
+
+        return tape
+
+    def test_graph_not_constructed(self, mocker):
+        """Test that computing the hash does not construct the circuit graph"""
+        spy = mocker.spy(CircuitGraph, "__init__")
+        tape = self.make_tape(0.1, np.array([0.1, 0.2, 0.3]))
+
+        assert isinstance(tape.hash, int)
+        spy.assert_not_called()
+
+    def test_equal_circuits(self):
+        """Test that tapes recording the same circuit have the same hash"""
+        tape1 = self.make_tape(0.1, np.array([0.1, 0.2, 0.3]))
+        tape2 = self.make_tape(0.1, np.array([0.1, 0.2, 0.3]))
+        assert tape1.hash == tape2.hash
+
+    @pytest.mark.parametrize(
+        "x, y, A",
+        [
+            (0.2, np.array([0.1, 0.2, 0.3]), np.diag([1.0, -1.0])),
+            (0.1, np.array([0.1, 0.2, 0.4]), np.diag([1.0, -1.0])),
+            (0.1, np.array([0.1, 0.2, 0.3]), np.diag([1.0, 1.0])),
+        ],
+    )
+    def test_different_parameters(self, x, y, A):
+        """Test that tapes differing in the parameters of their operations or
+        observables have different hashes"""
+        tape1 = self.make_tape(0.1, np.array([0.1, 0.2, 0.3]))
+        tape2 = self.make_tape(x, y, A)
+        assert tape1.hash != tape2.hash
+
+    def test_arraybox_parameters(self):
+        """Test that the hash of a tape with autograd ArrayBox parameters depends on
+        all values of the parameters, including values omitted from their string
+        representation"""
+        A = np.diag(np.arange(64, dtype=np.float64))
+        B = A.copy()
+        B[32, 32] = -1.0
+        assert str(A) == str(B)
+
+        hashes = []
+
+        def cost(x):
+            for mat in [A, A, B]:
+                with QuantumTape() as tape:
+                    qml.RX(x, wires=0)
+                    qml.expval(qml.Hermitian(mat * x, wires=range(6)))
+
+                hashes.append(tape.hash)
+
+            return x
+
+        qml.grad(cost)(qml.numpy.array(0.5, requires_grad=True))
+        assert hashes[0] == hashes[1]
+        assert hashes[0] != hashes[2]
+
+    def test_different_return_types(self):
+        """Test that tapes differing only in their return types have different hashes"""
+        with QuantumTape() as tape1:
+            qml.RX(0.1, wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        with QuantumTape() as tape2:
+            qml.RX(0.1, wires=0)
+            qml.var(qml.PauliZ(0))
+
+        assert tape1.hash != tape2.hash
+
+    def test_different_wires(self):
+        """Test that tapes differing only in their wires have different hashes"""
+        with QuantumTape() as tape1:
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.PauliZ(0))
+
+        with QuantumTape() as tape2:
+            qml.CNOT(wires=[1, 0])
+            qml.expval(qml.PauliZ(0))
+
+        assert tape1.hash != tape2.hash
+
+
 class TestResourceEstimation:
     """Tests for verifying resource counts and depths of tapes."""
 
@@ -18,9 +18,7 @@ Unit tests for the :mod:`pennylane` configuration classe :class:`Configuration`.
 
 import contextlib
 import io
-import importlib
 import re
-import pkg_resources
 
 import pytest
 
@@ -49,15 +47,9 @@ def test_qchem_not_installed_error(monkeypatch):
     """Test QChem causes an import error on access
     if not installed"""
 
-    class Entry:
-        """Dummy entry point for mocking"""
-
-        name = None
-
     with monkeypatch.context() as m:
-        m.setattr(pkg_resources, "iter_entry_points", lambda name: [Entry()])
-
-        importlib.reload(qml)
+        m.setattr(qml, "_get_entry_points", lambda group: {})
+        m.delattr(qml, "qchem", raising=False)
 
         with pytest.raises(ImportError, match="PennyLane-QChem not installed."):
             print(qml.qchem)
@@ -65,4 +57,4 @@ def test_qchem_not_installed_error(monkeypatch):
         with pytest.raises(ImportError, match="PennyLane-QChem not installed."):
             qml.qchem.generate_hamiltonian()
 
-    importlib.reload(qml)
+        m.delattr(qml, "qchem")
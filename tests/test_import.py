@@ -0,0 +1,170 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Tests for importing PennyLane, and the lazy discovery of plugin entry points.
+"""
+# pylint: disable=protected-access
+import json
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+import pennylane as qml
+from pennylane import _entry_points
+
+LAZY_MODULES = [
+    "pkg_resources",
+    "importlib.metadata",
+    "scipy.stats",
+    "pennylane.collections",
+    "pennylane.fourier",
+    "pennylane.grouping",
+    "pennylane.kernels",
+    "pennylane.qaoa",
+    "pennylane.qnn",
+    "pennylane_qchem",
+    "pennylane.interfaces.jax",
+    "pennylane.interfaces.tf",
+    "pennylane.interfaces.torch",
+    "jax",
+    "tensorflow",
+    "torch",
+]
+
+
+def run_python(code, tmpdir, importtime=False):
+    """Runs Python code in a new process with an empty entry point cache directory,
+    and returns the standard output, or the standard error if ``importtime`` is True"""
+    env = dict(os.environ, PENNYLANE_CACHE_DIR=str(tmpdir))
+    flags = ["-X", "importtime"] if importtime else []
+    res = subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    return res.stderr if importtime else res.stdout
+
+
+def cumulative_import_times(report):
+    """Returns the cumulative import times in microseconds of the modules listed in
+    the output of ``-X importtime``"""
+    times = re.findall(r"^import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)$", report, flags=re.M)
+    return {module: int(t) for t, module in times}
+
+
+@pytest.fixture
+def cache_dir(tmpdir, monkeypatch):
+    """Empty directory for the entry point cache, and a fresh entry point table"""
+    monkeypatch.setenv("PENNYLANE_CACHE_DIR", str(tmpdir))
+    monkeypatch.setattr(_entry_points, "_table", None)
+    yield tmpdir
+
+
+class TestImport:
+    """Tests for the modules imported by ``import pennylane``"""
+
+    def test_lazy_modules(self, tmpdir):
+        """Test that importing PennyLane neither imports the lazily loaded subpackages,
+        nor scans the installed distributions for plugins"""
+        code = "import sys, json, pennylane; print(json.dumps(sorted(sys.modules)))"
+        out = run_python(code, tmpdir)
+        modules = json.loads(out)
+
+        assert not [m for m in LAZY_MODULES if m in modules]
+        assert not os.listdir(str(tmpdir))
+
+    def test_relative_import_time(self, tmpdir):
+        """Test that importing PennyLane takes at most a few times as long as importing
+        NumPy, as reported by ``-X importtime`` in the same process. Eagerly importing the
+        lazily loaded modules roughly doubles this ratio."""
+        ratios = []
+
+        for _ in range(3):
+            times = cumulative_import_times(run_python("import pennylane", tmpdir, True))
+            ratios.append(times["pennylane"] / times["numpy"])
+
+        assert min(ratios) < 5
+
+    def test_lazy_attributes(self):
+        """Test that the lazily loaded subpackages and attributes are available"""
+        assert qml.qaoa.cost_layer is not None
+        assert qml.grouping.group_observables is not None
+        assert qml.map is qml.collections.map
+        assert qml.QNodeCollection is qml.collections.QNodeCollection
+        assert {"qaoa", "grouping", "map", "qchem"}.issubset(dir(qml))
+
+    def test_missing_attribute(self):
+        """Test that accessing an attribute that does not exist raises an error"""
+        with pytest.raises(AttributeError, match="has no attribute 'not_a_module'"):
+            qml.not_a_module  # pylint: disable=pointless-statement
+
+
+class TestEntryPoints:
+    """Tests for the discovery and caching of entry points"""
+
+    def test_cache(self, cache_dir, mocker):
+        """Test that the entry points are scanned once, and then loaded from the cache"""
+        spy = mocker.spy(_entry_points, "_scan")
+
+        devices = _entry_points.entry_points("pennylane.plugins")
+        assert "default.qubit" in devices
+        assert devices["default.qubit"].load() is qml.devices.DefaultQubit
+        assert spy.call_count == 1
+        assert len(os.listdir(str(cache_dir))) == 1
+
+        # a new process loads the cached table
+        _entry_points._table = None
+        assert _entry_points.entry_points("pennylane.plugins").keys() == devices.keys()
+        assert spy.call_count == 1
+
+        # refreshing scans the distributions again
+        _entry_points.entry_points("pennylane.plugins", refresh=True)
+        assert spy.call_count == 2
+
+    def test_cache_invalidated(self, cache_dir, mocker, monkeypatch):
+        """Test that the cache is invalidated if the environment fingerprint changes"""
+        spy = mocker.spy(_entry_points, "_scan")
+        _entry_points.entry_points("pennylane.plugins")
+
+        monkeypatch.setattr(_entry_points, "fingerprint", lambda: "changed")
+        _entry_points._table = None
+        _entry_points.entry_points("pennylane.plugins")
+
+        assert spy.call_count == 2
+
+    def test_corrupt_cache(self, cache_dir):
+        """Test that a corrupt cache file is ignored and overwritten"""
+        with open(_entry_points.cache_file(), "w") as f:
+            f.write("{not json")
+
+        assert "default.qubit" in _entry_points.entry_points("pennylane.plugins")
+
+        with open(_entry_points.cache_file(), "r") as f:
+            assert json.load(f)["fingerprint"] == _entry_points.fingerprint()
+
+    def test_entry_point_table(self, cache_dir, mocker):
+        """Test that an entry point table only discovers the entry points when accessed"""
+        spy = mocker.spy(_entry_points, "entry_points")
+        table = _entry_points.EntryPointTable("pennylane.plugins")
+        assert spy.call_count == 0
+
+        assert "default.qubit" in table
+        assert len(table) == len(dict(table.items()))
+        assert spy.call_count == 1
@@ -0,0 +1,148 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the :class:`~.PauliSum` class.
+"""
+import numpy as np
+import pytest
+
+import pennylane as qml
+from pennylane import PauliSum
+from pennylane.wires import Wires
+
+COEFFS = [0.5, -0.2, 0.3, 1.1, 0.7]
+OPS = [
+    qml.PauliX(0) @ qml.PauliY("a"),
+    qml.PauliZ(1),
+    qml.PauliY("a") @ qml.Identity(2) @ qml.PauliX(0),
+    qml.Identity(1),
+    qml.PauliZ(0) @ qml.PauliZ(1) @ qml.PauliY(2) @ qml.PauliX(3),
+]
+
+
+def random_hamiltonian(num_terms, num_wires, seed=0):
+    """Returns a Hamiltonian of random Pauli words"""
+    rng = np.random.default_rng(seed)
+    paulis = [qml.Identity, qml.PauliX, qml.PauliY, qml.PauliZ]
+    words = rng.integers(0, 4, size=(num_terms, num_wires))
+
+    ops = [qml.operation.Tensor(*[paulis[p](w) for w, p in enumerate(word)]) for word in words]
+    return qml.Hamiltonian(rng.normal(size=num_terms), ops)
+
+
+class TestPauliSum:
+    """Tests for the PauliSum class"""
+
+    def test_from_hamiltonian(self):
+        """Test that the bitmasks of a Hamiltonian are packed in the order of its wires"""
+        H = qml.Hamiltonian(COEFFS, OPS)
+        psum = PauliSum.from_hamiltonian(H, wires=[0, "a", 1, 2, 3])
+
+        assert len(psum) == 5
+        assert psum.wires == Wires([0, "a", 1, 2, 3])
+        assert np.allclose(psum.coeffs, COEFFS)
+
+        expected = [
+            [1, 1, 0, 0, 0, 0, 1, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 1, 0, 0],
+            [1, 1, 0, 0, 0, 0, 1, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 1, 1, 1, 0, 1, 1, 0],
+        ]
+        assert np.array_equal(psum.binary, expected)
+        assert psum.x.shape == psum.z.shape == (5, 1)
+        assert psum.x.dtype == np.uint8
+
+    def test_many_wires(self):
+        """Test that the bitmasks of words on more than eight wires are packed into several bytes"""
+        H = qml.Hamiltonian([1.0], [qml.PauliX(0) @ qml.PauliY(9) @ qml.PauliZ(17)])
+        psum = PauliSum.from_hamiltonian(H, wires=range(20))
+
+        assert psum.x.shape == (1, 3)
+        assert np.array_equal(psum.x, [[0b10000000, 0b01000000, 0b00000000]])
+        assert np.array_equal(psum.z, [[0b00000000, 0b01000000, 0b01000000]])
+
+    def test_round_trip(self):
+        """Test that converting to a Hamiltonian and back gives the same terms"""
+        H = qml.Hamiltonian(COEFFS, OPS)
+        psum = PauliSum.from_hamiltonian(H)
+        H_new = psum.to_hamiltonian()
+
+        assert isinstance(H_new, qml.Hamiltonian)
+        assert H_new.coeffs == COEFFS
+        assert all(op.compare(new_op) for op, new_op in zip(OPS, H_new.ops))
+        assert H_new.ops[3].name == "Identity"
+
+    @pytest.mark.parametrize(
+        "op, error, match",
+        [
+            (qml.Hermitian(np.eye(2), wires=0), TypeError, "Expected a Hamiltonian of Pauli"),
+            (qml.PauliX(0) @ qml.Hadamard(1), TypeError, "Expected a Hamiltonian of Pauli"),
+            (qml.PauliX(0) @ qml.PauliZ(0), ValueError, "acts more than once on the same wire"),
+        ],
+    )
+    def test_invalid_hamiltonian(self, op, error, match):
+        """Test that an error is raised for Hamiltonians with terms that are not Pauli words"""
+        H = qml.Hamiltonian([1.0], [op])
+
+        with pytest.raises(error, match=match):
+            PauliSum.from_hamiltonian(H)
+
+    def test_invalid_shape(self):
+        """Test that an error is raised if the bitmasks do not match the terms and wires"""
+        with pytest.raises(ValueError, match="Expected coefficients of shape"):
+            PauliSum([1.0, 2.0], np.zeros((2, 1)), np.zeros((2, 2)), wires=[0, 1])
+
+    def test_immutable(self):
+        """Test that the arrays of a Pauli sum cannot be modified"""
+        psum = PauliSum.from_hamiltonian(qml.Hamiltonian(COEFFS, OPS))
+
+        with pytest.raises(ValueError, match="read-only"):
+            psum.coeffs[0] = 1.0
+
+    def test_simplify(self):
+        """Test that simplify combines identical words in the order of their first occurrence
+        and removes vanishing terms"""
+        H = qml.Hamiltonian(COEFFS + [-1.1], OPS + [qml.Identity(0)])
+        psum = PauliSum.from_hamiltonian(H).simplify()
+
+        assert np.allclose(psum.coeffs, [0.8, -0.2, 0.7])
+        assert psum.to_hamiltonian().compare(
+            qml.Hamiltonian([0.8, -0.2, 0.7], [OPS[0], OPS[1], OPS[4]])
+        )
+
+    def test_simplify_matches_hamiltonian(self):
+        """Test that simplifying a Pauli sum agrees with simplifying the Hamiltonian"""
+        H = random_hamiltonian(500, 4)
+        psum = PauliSum.from_hamiltonian(H).simplify()
+        H.simplify()
+
+        assert psum.to_hamiltonian().compare(H)
+        assert len(psum) == len(H.ops)
+
+    def test_getitem(self):
+        """Test that indexing a Pauli sum selects the terms"""
+        psum = PauliSum.from_hamiltonian(qml.Hamiltonian(COEFFS, OPS))
+
+        assert np.allclose(psum[[4, 1]].coeffs, [0.7, -0.2])
+        assert np.array_equal(psum[[4, 1]].binary, psum.binary[[4, 1]])
+        assert np.allclose(psum[1:3].coeffs, [-0.2, 0.3])
+        assert len(psum[2]) == 1
+
+    def test_memory(self):
+        """Test that a Pauli sum is a compact representation of a Hamiltonian"""
+        psum = PauliSum.from_hamiltonian(random_hamiltonian(1000, 12))
+
+        # coefficient and two bytes per bitmask
+        assert psum.coeffs.nbytes + psum.x.nbytes + psum.z.nbytes == 1000 * 12
@@ -382,12 +382,44 @@ class TestGenerateSamples:
 
         assert dev._samples == (number_of_states, dev.num_wires)
 
+    def test_samples_stored_as_indices(self):
+        """Tests that samples generated during execution are stored as integer indices,
+        and only converted to the binary representation when accessed"""
+        dev = qml.device("default.qubit", wires=3, shots=100)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.Hadamard(wires=0)
+            qml.CNOT(wires=[0, 2])
+            qml.RX(0.4, wires=1)
+            qml.probs(wires=[2, 0])
+
+        prob = dev.execute(tape)[0]
+
+        assert dev._sample_indices.shape == (100,)
+        assert dev._binary_samples is None
+        assert np.allclose(prob[[1, 2]], 0)
+
+        sample = dev.sample(qml.PauliZ(2))
+        assert dev._binary_samples is None
+
+        binary = dev._samples
+        expected = (dev._sample_indices[:, None] >> np.array([2, 1, 0])) & 1
+        assert np.array_equal(binary, expected)
+        assert np.array_equal(sample, 1 - 2 * binary[:, 2])
+
+        # statistics are identical when computed from the binary samples
+        dev._samples = binary
+        assert dev._sample_indices is None
+        assert np.allclose(dev.estimate_probability(wires=[2, 0]), prob)
+        assert np.array_equal(dev.sample(qml.PauliZ(2)), sample)
+
 
 class TestSampleBasisStates:
     """Test the sample_basis_states method"""
 
-    def test_sampling_with_correct_arguments(self, mock_qubit_device, monkeypatch):
-        """Tests that the sample_basis_states method samples with the correct arguments"""
+    def test_sampling_with_correct_arguments(self, mock_qubit_device):
+        """Tests that the sample_basis_states method draws the same samples as
+        numpy.random.choice with the state probabilities"""
 
         shots = 1000
 
@@ -396,14 +428,23 @@ class TestSampleBasisStates:
         dev.shots = shots
         state_probs = [0.1, 0.2, 0.3, 0.4]
 
-        with monkeypatch.context() as m:
-            # Mock the numpy.random.choice method such that it returns the expected values
-            m.setattr("numpy.random.choice", lambda x, y, p: (x, y, p))
-            res = dev.sample_basis_states(number_of_states, state_probs)
+        np.random.seed(42)
+        res = dev.sample_basis_states(number_of_states, state_probs)
+
+        np.random.seed(42)
+        expected = np.random.choice(np.arange(number_of_states), shots, p=state_probs)
 
-        assert np.array_equal(res[0], np.array([0, 1, 2, 3]))
-        assert res[1] == shots
-        assert res[2] == state_probs
+        assert res.shape == (shots,)
+        assert np.array_equal(res, expected)
+
+    def test_zero_probabilities_not_sampled(self, mock_qubit_device):
+        """Tests that basis states with zero probability are never sampled"""
+        dev = mock_qubit_device()
+        dev.shots = 10000
+        state_probs = np.array([0.0, 0.5, 0.0, 0.0, 0.5, 0.0, 0.0, 0.0])
+
+        res = dev.sample_basis_states(8, state_probs)
+        assert set(res.tolist()) == {1, 4}
 
     def test_raises_deprecation_warning(self, mock_qubit_device, monkeypatch):
         """Test that sampling basis states on a device with shots=None produces a warning."""
@@ -626,6 +667,52 @@ class TestEstimateProb:
 
         assert np.allclose(res, expected)
 
+    @pytest.mark.parametrize("wires", [[0], [2, 0], [0, 1, 2]])
+    def test_estimate_probability_bins(
+        self, wires, mock_qubit_device_with_original_statistics, monkeypatch
+    ):
+        """Tests that the probabilities are estimated separately for each bin"""
+        dev = mock_qubit_device_with_original_statistics(wires=3)
+        samples = np.random.randint(0, 2, size=(60, 3))
+
+        with monkeypatch.context() as m:
+            m.setattr(dev, "_samples", samples)
+            m.setattr(dev, "shots", 60)
+            res = dev.estimate_probability(wires=wires, shot_range=(6, 60), bin_size=9)
+
+        indices = samples[6:, wires] @ 2 ** np.arange(len(wires))[::-1]
+        expected = np.zeros([2 ** len(wires), 6])
+
+        for b, idx in enumerate(indices.reshape(6, 9)):
+            basis_states, counts = np.unique(idx, return_counts=True)
+            expected[basis_states, b] = counts / 9
+
+        assert res.shape == (2 ** len(wires), 6)
+        assert np.allclose(res, expected)
+
+    def test_sample_indices_shared(self, mocker):
+        """Tests that the basis state indices of the samples are computed once for all
+        observables measured on the same wires"""
+        dev = qml.device("default.qubit", wires=2, shots=100)
+        spy = mocker.spy(dev, "_compute_sample_basis_indices")
+
+        with qml.tape.QuantumTape() as tape:
+            qml.Hadamard(wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.Hermitian(np.diag([1, 2, 3, 4]), wires=[0, 1]))
+            qml.var(qml.Hermitian(np.diag([1, 2, 3, 4]), wires=[0, 1]))
+            qml.expval(qml.PauliZ(1))
+
+        res = dev.execute(tape)
+
+        assert spy.call_count == 2
+
+        # the samples are either |00> or |11>
+        p = (res[0] - 1) / 3
+        assert np.isclose(res[1], 9 * p * (1 - p))
+        assert np.isclose(res[2], 1 - 2 * p)
+        assert dev._sample_index_cache is None
+
 
 class TestMarginalProb:
     """Test the marginal_prob method"""
@@ -845,6 +932,99 @@ class TestBatchExecution:
         assert len(res) == 3
         assert np.allclose(res[0], dev.execute(empty_tape), rtol=tol, atol=0)
 
+    def test_validity_checked_once_per_structure(self, mocker):
+        """Tests that circuits sharing the same structure are only validated and
+        diagonalized once per batch."""
+        dev = qml.device("default.qubit", wires=2)
+        spy = mocker.spy(dev, "check_validity")
+
+        tapes = []
+
+        for x in [0.1, 0.2, 0.3]:
+            with qml.tape.QuantumTape() as tape:
+                qml.RX(x, wires=0)
+                qml.CNOT(wires=[0, 1])
+                qml.expval(qml.PauliX(1))
+
+            tapes.append(tape)
+
+        res = dev.batch_execute(tapes + [self.tape1])
+
+        assert spy.call_count == 2
+        assert np.allclose(np.squeeze(res[:3]), 0)
+        assert dev._structure_cache is None
+
+        # outside of a batch, every execution is validated
+        dev.execute(tapes[0])
+        dev.execute(tapes[0])
+        assert spy.call_count == 4
+
+
+class TestCircuitStructure:
+    """Tests for the circuit_structure method."""
+
+    def test_parameters_ignored(self):
+        """Tests that circuits differing only in their gate parameters share a structure."""
+        with qml.tape.QuantumTape() as tape1:
+            qml.RX(0.1, wires=0)
+            qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+        with qml.tape.QuantumTape() as tape2:
+            qml.RX(0.5, wires=0)
+            qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+        assert QubitDevice.circuit_structure(tape1) == QubitDevice.circuit_structure(tape2)
+
+    @pytest.mark.parametrize(
+        "op, obs",
+        [
+            (qml.RY(0.1, wires=0), qml.expval(qml.PauliZ(0) @ qml.PauliX(1))),
+            (qml.RX(0.1, wires=1), qml.expval(qml.PauliZ(0) @ qml.PauliX(1))),
+            (qml.RX(0.1, wires=0), qml.var(qml.PauliZ(0) @ qml.PauliX(1))),
+            (qml.RX(0.1, wires=0), qml.expval(qml.PauliZ(0) @ qml.PauliY(1))),
+            (qml.RX(0.1, wires=0), qml.expval(qml.Hermitian(np.eye(4), wires=[0, 1]))),
+            (qml.RX(0.1, wires=0), qml.probs(wires=[0, 1])),
+        ],
+    )
+    def test_structure_differs(self, op, obs):
+        """Tests that circuits with different operations or measurements have
+        different structures."""
+        with qml.tape.QuantumTape() as tape1:
+            qml.RX(0.1, wires=0)
+            qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+        with qml.tape.QuantumTape() as tape2:
+            qml.apply(op)
+            qml.apply(obs)
+
+        assert QubitDevice.circuit_structure(tape1) != QubitDevice.circuit_structure(tape2)
+
+    def test_inverse_operations(self):
+        """Tests that inverted operations change the structure."""
+        with qml.tape.QuantumTape() as tape1:
+            qml.RX(0.1, wires=0)
+
+        with qml.tape.QuantumTape() as tape2:
+            qml.RX(0.1, wires=0).inv()
+
+        assert QubitDevice.circuit_structure(tape1) != QubitDevice.circuit_structure(tape2)
+
+    def test_observable_parameters(self):
+        """Tests that observable parameters are part of the structure."""
+        A = np.diag([1.0, 2.0])
+
+        with qml.tape.QuantumTape() as tape1:
+            qml.expval(qml.Hermitian(A, wires=0))
+
+        with qml.tape.QuantumTape() as tape2:
+            qml.expval(qml.Hermitian(A.copy(), wires=0))
+
+        with qml.tape.QuantumTape() as tape3:
+            qml.expval(qml.Hermitian(2 * A, wires=0))
+
+        assert QubitDevice.circuit_structure(tape1) == QubitDevice.circuit_structure(tape2)
+        assert QubitDevice.circuit_structure(tape1) != QubitDevice.circuit_structure(tape3)
+
 
 class TestShotList:
     """Tests for passing shots as a list"""
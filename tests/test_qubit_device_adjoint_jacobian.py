@@ -54,13 +54,13 @@ class TestAdjointJacobian:
 
     def test_unsupported_op(self, dev):
         """Test if a QuantumFunctionError is raised for an unsupported operation, i.e.,
-        multi-parameter operations that are not qml.Rot"""
+        trainable operations without a generator or a decomposition"""
 
         with qml.tape.JacobianTape() as tape:
-            qml.CRot(0.1, 0.2, 0.3, wires=[0, 1])
+            qml.QubitUnitary(np.eye(4), wires=[0, 1])
             qml.expval(qml.PauliZ(0))
 
-        with pytest.raises(qml.QuantumFunctionError, match="The CRot operation is not"):
+        with pytest.raises(qml.QuantumFunctionError, match="The QubitUnitary operation is not"):
             dev.adjoint_jacobian(tape)
 
     @pytest.mark.parametrize("theta", np.linspace(-2 * np.pi, 2 * np.pi, 7))
@@ -205,6 +205,61 @@ class TestAdjointJacobian:
         # the different methods agree
         assert np.allclose(grad_D, grad_F, atol=tol, rtol=0)
 
+    @pytest.mark.parametrize("inverse", [False, True])
+    @pytest.mark.parametrize(
+        "op, args", [(qml.CRot, [0.5, 0.3, -0.7]), (qml.U3, [0.2, -0.4, 0.9]), (qml.U2, [0.1, 1.2])]
+    )
+    def test_multiple_parameter_gates(self, op, args, inverse, tol, dev):
+        """Tests that multi-parameter gates other than Rot, including inverted ones, are
+        differentiated by decomposing them."""
+
+        def make_tape(params):
+            with qml.tape.JacobianTape() as tape:
+                qml.Hadamard(wires=0)
+                qml.RX(0.4, wires=1)
+                gate = op(*params, wires=range(op.num_wires))
+                if inverse:
+                    gate.inv()
+                qml.CNOT(wires=[0, 1])
+                qml.expval(qml.PauliX(0))
+                qml.expval(qml.PauliY(1))
+
+            return tape
+
+        def cost(params):
+            dev.reset()
+            return np.array(dev.execute(make_tape(params).expand()))
+
+        tape = make_tape(args)
+        tape.trainable_params = set(range(1, len(args) + 1))
+
+        cost(args)
+        grad_D = dev.adjoint_jacobian(tape, starting_state=dev._pre_rotated_state)
+
+        # central finite differences of the decomposed circuit
+        h = 1e-7
+        grad_F = np.zeros_like(grad_D)
+        for i in range(len(args)):
+            shift = np.eye(len(args))[i] * h
+            grad_F[:, i] = (cost(args + shift) - cost(args - shift)) / (2 * h)
+
+        assert np.allclose(grad_D, grad_F, atol=tol, rtol=0)
+
+    def test_tape_not_mutated(self, dev):
+        """Tests that computing the jacobian does not invert the operations or modify the
+        observables of the tape"""
+
+        with qml.tape.JacobianTape() as tape:
+            qml.RX(0.4, wires=[0])
+            qml.Rot(0.5, 0.3, -0.7, wires=[0]).inv()
+            qml.CRY(-0.2, wires=[0, 1])
+            qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+
+        dev.adjoint_jacobian(tape)
+
+        assert [op.inverse for op in tape.operations] == [False, True, False]
+        assert not hasattr(tape.observables[0], "base_name")
+
     def test_use_device_state(self, tol, dev):
         """Tests that when using the device state, the correct answer is still returned."""
 
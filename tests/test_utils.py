@@ -17,6 +17,7 @@ Unit tests for the :mod:`pennylane.utils` module.
 # pylint: disable=no-self-use,too-many-arguments,protected-access
 import functools
 import itertools
+from operator import matmul
 import pytest
 
 import numpy as np
@@ -135,6 +136,59 @@ class TestDecomposition:
         linear_comb = sum([decomposed_coeff[i] * o.matrix for i, o in enumerate(decomposed_obs)])
         assert np.allclose(hamiltonian, linear_comb)
 
+    def test_decomposition_trace(self):
+        """Tests that the coefficients and the order of the Pauli words agree with computing
+        the trace of the product with each Pauli word"""
+        rng = np.random.default_rng(42)
+        A = rng.normal(size=(8, 8)) + 1j * rng.normal(size=(8, 8))
+        hamiltonian = A + A.conj().T
+
+        coeffs, obs = pu.decompose_hamiltonian(hamiltonian)
+        paulis = [Identity, PauliX, PauliY, PauliZ]
+
+        for i, term in enumerate(itertools.product(paulis, repeat=3)):
+            expected = functools.reduce(matmul, [t(w) for w, t in enumerate(term)])
+            matrix = functools.reduce(np.kron, [t._matrix() for t in term])
+
+            assert obs[i].compare(expected)
+            assert np.isclose(coeffs[i], np.trace(matrix @ hamiltonian) / 8)
+
+    @pytest.mark.parametrize("hamiltonian", test_hamiltonians)
+    def test_sparse_input(self, hamiltonian):
+        """Tests that sparse matrices are decomposed into the same terms as dense matrices"""
+        coeffs, obs = pu.decompose_hamiltonian(hamiltonian)
+        sparse_coeffs, sparse_obs = pu.decompose_hamiltonian(scipy.sparse.csr_matrix(hamiltonian))
+
+        assert np.allclose(coeffs, sparse_coeffs)
+        assert all(o.compare(s) for o, s in zip(obs, sparse_obs))
+
+    def test_sparse_not_hermitian(self):
+        """Tests that an exception is raised if a sparse Hamiltonian is not Hermitian"""
+        with pytest.raises(ValueError, match="The Hamiltonian is not Hermitian"):
+            pu.decompose_hamiltonian(scipy.sparse.coo_matrix([[1, 2], [3, 4]]))
+
+    def test_tol(self):
+        """Tests that Pauli words with small coefficients are discarded"""
+        hamiltonian = np.diag([1.0, 1.1, 0.9, 1.0])
+        coeffs, obs = pu.decompose_hamiltonian(hamiltonian, hide_identity=True, tol=0.01)
+        assert np.allclose(coeffs, [1.0, -0.05, 0.05])
+
+        coeffs, obs = pu.decompose_hamiltonian(hamiltonian, hide_identity=True, tol=0.1)
+        assert coeffs == [1.0]
+        assert obs[0].name == ["Identity", "Identity"]
+
+    def test_return_hamiltonian(self):
+        """Tests that the decomposition is returned as a Hamiltonian if requested"""
+        H = pu.decompose_hamiltonian(
+            scipy.sparse.diags([0.0, 1.0, 1.0, 2.0]), hide_identity=True, return_hamiltonian=True
+        )
+        expected = qml.Hamiltonian(
+            [1.0, -0.5, -0.5], [Identity(0) @ Identity(1), PauliZ(1), PauliZ(0)]
+        )
+
+        assert isinstance(H, qml.Hamiltonian)
+        assert H.compare(expected)
+
 
 class TestSparse:
     """Tests the sparse_hamiltonian function"""
@@ -201,6 +255,89 @@ class TestSparse:
         with pytest.raises(TypeError, match="Passed Hamiltonian must be of type"):
             qml.utils.sparse_hamiltonian(np.eye(2))
 
+    def test_sparse_matrix_pauli_words(self):
+        """Tests that the matrix of a sum of Pauli words and other observables agrees with the
+        sum of the dense Kronecker products"""
+        rng = np.random.default_rng(42)
+        paulis = [Identity, PauliX, PauliY, PauliZ]
+        wires = range(5)
+
+        ops = []
+        expected = np.zeros((32, 32), dtype=np.complex128)
+        coeffs = rng.normal(size=20)
+
+        for coeff in coeffs[:-1]:
+            factors = [paulis[i](w) for i, w in zip(rng.integers(4, size=5), wires)]
+            ops.append(Tensor(*factors))
+            expected += coeff * functools.reduce(np.kron, [f.matrix for f in factors])
+
+        A = np.array([[1.0, 2.0 + 1j], [2.0 - 1j, -1.0]])
+        ops.append(qml.PauliX(0) @ qml.Hermitian(A, 2))
+        expected += coeffs[-1] * np.kron(
+            np.kron(np.kron(qml.PauliX._matrix(), np.eye(2)), A), np.eye(4)
+        )
+
+        H = qml.Hamiltonian(coeffs, ops)
+
+        res = qml.utils.sparse_hamiltonian(H, format="csr")
+
+        assert isinstance(res, scipy.sparse.csr_matrix)
+        assert np.allclose(res.toarray(), expected)
+
+    def test_sparse_cache(self, mocker):
+        """Tests that the matrix is cached on the Hamiltonian, and recomputed if the
+        Hamiltonian changes"""
+        H = qml.Hamiltonian([0.5, -0.2], [qml.PauliX(0) @ qml.PauliZ(1), qml.PauliY(1)])
+        spy = mocker.spy(pu, "_sparse_pauli_sum")
+
+        res1 = qml.utils.sparse_hamiltonian(H, cache=True)
+        res2 = qml.utils.sparse_hamiltonian(H, cache=True)
+
+        assert spy.call_count == 1
+        assert isinstance(res2, scipy.sparse.coo_matrix)
+        assert np.allclose(res1.toarray(), res2.toarray())
+
+        res2.data[:] = 0
+        assert np.allclose(qml.utils.sparse_hamiltonian(H, cache=True).toarray(), res1.toarray())
+
+        H *= 2
+        res3 = qml.utils.sparse_hamiltonian(H, cache=True)
+
+        assert spy.call_count == 2
+        assert np.allclose(res3.toarray(), 2 * res1.toarray())
+
+    def test_sparse_pauli_sum(self):
+        """Tests that the matrix of a ``PauliSum`` agrees with the matrix of the Hamiltonian"""
+        H = qml.Hamiltonian(
+            [0.5, -0.2, 0.3, 0.1],
+            [qml.PauliX(0) @ qml.PauliZ(2), qml.PauliY(1), qml.PauliZ(0), qml.Identity(2)],
+        )
+        psum = qml.PauliSum.from_hamiltonian(H)
+
+        res = qml.utils.sparse_hamiltonian(psum, cache=True, format="csr")
+        expected = qml.utils.sparse_hamiltonian(H)
+
+        assert isinstance(res, scipy.sparse.csr_matrix)
+        assert np.allclose(res.toarray(), expected.toarray())
+        assert psum._sparse_matrix[1] is not res
+
+    def test_sparse_expval(self, tol):
+        """Tests that the expectation value of the sparse matrix agrees with the expectation
+        value of the Hamiltonian"""
+        H = qml.Hamiltonian(
+            [0.5, -0.2, 0.3], [qml.PauliX(0) @ qml.PauliZ(2), qml.PauliY(1), qml.PauliZ(0)]
+        )
+        ops = [qml.RX(0.3, wires=0), qml.CNOT(wires=[0, 1]), qml.RY(0.5, wires=2)]
+        ops += [qml.CRX(0.2, wires=[2, 0]), qml.RY(0.4, wires=1)]
+
+        dev = qml.device("default.qubit", wires=3)
+        dev.apply(ops)
+
+        res = dev.expval(qml.SparseHamiltonian(qml.utils.sparse_hamiltonian(H), wires=range(3)))
+        expected = dev.expval(H)
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
 
 class TestFlatten:
     """Tests the flatten and unflatten functions"""
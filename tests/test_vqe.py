@@ -14,6 +14,8 @@
 """
 Unit tests for the :mod:`pennylane.vqe` submodule.
 """
+import itertools
+
 import numpy as np
 import pytest
 
@@ -707,6 +709,39 @@ class TestHamiltonian:
         old_H.simplify()
         assert old_H.compare(new_H)
 
+    def test_simplify_order(self):
+        """Tests that simplify keeps the terms in the order of their first occurrence,
+        and that a cancelled term is appended again if it reappears"""
+        ops = [
+            qml.PauliZ(0) @ qml.PauliX(1),
+            qml.PauliY(2),
+            qml.PauliX(1) @ qml.Identity(3) @ qml.PauliZ(0),
+            qml.PauliX(0),
+            qml.PauliY(2),
+            qml.PauliY(2),
+        ]
+        H = qml.Hamiltonian([1, 0.5, 2, 0.3, -0.5, 0.7], ops)
+        H.simplify()
+
+        assert H.coeffs == [3, 0.3, 0.7]
+        assert [op.name for op in H.ops] == [["PauliZ", "PauliX"], "PauliX", "PauliY"]
+
+    def test_simplify_many_terms(self):
+        """Tests that simplify combines the like-terms of a Hamiltonian with many terms"""
+        paulis = [qml.Identity, qml.PauliX, qml.PauliY, qml.PauliZ]
+        words = list(itertools.product(range(4), repeat=4))
+
+        ops = []
+        for word in words + words[::-1]:
+            ops.append(qml.operation.Tensor(*[paulis[p](w) for w, p in enumerate(word)]))
+
+        H = qml.Hamiltonian(np.ones(len(ops)), ops)
+        H.simplify()
+
+        assert len(H.ops) == 4 ** 4
+        assert np.allclose(H.coeffs, 2)
+        assert H.compare(qml.Hamiltonian(2 * np.ones(len(words)), ops[: len(words)]))
+
     def test_data(self):
         """Tests the obs_data method"""
 
@@ -993,6 +1028,23 @@ class TestVQE:
 
         assert np.allclose(c1, c2)
 
+    def test_optimize_pauli_sum(self):
+        """Test that an ExpvalCost of a PauliSum with observable optimization gives the same
+        result as the ExpvalCost of the Hamiltonian"""
+        dev = qml.device("default.qubit", wires=4)
+        psum = qml.PauliSum.from_hamiltonian(big_hamiltonian)
+
+        cost = qml.ExpvalCost(qml.templates.StronglyEntanglingLayers, psum, dev, optimize=True)
+        cost2 = qml.ExpvalCost(qml.templates.StronglyEntanglingLayers, big_hamiltonian, dev)
+
+        w = pnp.array(qml.init.strong_ent_layers_uniform(2, 4, seed=1967), requires_grad=True)
+
+        c1 = cost(w)
+        assert dev.num_executions == 5  # Number of groups in the Hamiltonian
+
+        assert np.allclose(c1, cost2(w))
+        assert np.allclose(qml.grad(cost)(w), qml.grad(cost2)(w))
+
     @pytest.mark.parametrize("interface", ["tf", "torch", "autograd"])
     def test_optimize_multiple_terms(self, interface, tf_support, torch_support):
         """Test that an ExpvalCost with observable optimization gives the same
@@ -1310,10 +1362,11 @@ class TestNewVQE:
         assert res == expected
 
     def test_error_multiple_expvals(self):
-        """Tests that error is thrown if more than one expval is evaluated."""
+        """Tests that error is thrown if more than one expval is evaluated on a device
+        that does not support Hamiltonians."""
         observables = [qml.PauliZ(0), qml.PauliY(0), qml.PauliZ(1)]
         coeffs = [1.0] * len(observables)
-        dev = qml.device("default.qubit", wires=3)
+        dev = qml.device("default.qubit", wires=3, shots=100)
         H = qml.Hamiltonian(coeffs, observables)
         w = qml.init.strong_ent_layers_uniform(2, 4, seed=1967)
 
@@ -1325,6 +1378,56 @@ class TestNewVQE:
         with pytest.raises(ValueError, match="At the moment"):
             circuit()
 
+    @pytest.mark.parametrize("diff_method", ["best", "parameter-shift", "adjoint"])
+    def test_native_hamiltonian(self, diff_method, mocker, tol):
+        """Tests that Hamiltonians are evaluated by default.qubit without splitting the tape,
+        also when returned together with other expectation values."""
+        dev = qml.device("default.qubit", wires=5)
+        spy = mocker.spy(qml.transforms, "hamiltonian_expand")
+        w = pnp.array(qml.init.strong_ent_layers_uniform(2, 4, seed=1967), requires_grad=True)
+
+        @qml.qnode(dev, diff_method=diff_method)
+        def circuit(w):
+            qml.templates.StronglyEntanglingLayers(w, wires=range(4))
+            qml.RX(w[0, 0, 0], wires=4)
+            return qml.expval(big_hamiltonian), qml.expval(qml.PauliZ(4))
+
+        res = circuit(w)
+        assert spy.call_count == 0
+        assert dev.num_executions == 1
+
+        H = np.kron(qml.utils.sparse_hamiltonian(big_hamiltonian).toarray(), np.eye(2))
+        assert np.allclose(res[0], np.vdot(dev.state, H @ dev.state), atol=tol)
+        assert np.allclose(res[1], np.cos(w[0, 0, 0]), atol=tol)
+
+        jac = qml.jacobian(circuit)(w)
+        assert np.allclose(jac[0], big_hamiltonian_grad, atol=tol)
+        assert spy.call_count == 0
+
+    @pytest.mark.parametrize("diff_method", ["parameter-shift", "adjoint"])
+    def test_trainable_coefficients_split(self, diff_method, mocker, tol):
+        """Tests that the tape is split into the Hamiltonian terms if the coefficients
+        are trainable and the QNode does not use backpropagation."""
+        dev = qml.device("default.qubit", wires=2)
+        spy = mocker.spy(qml.transforms, "hamiltonian_expand")
+        obs = [qml.PauliZ(0), qml.PauliX(0) @ qml.PauliZ(1)]
+
+        @qml.qnode(dev, diff_method=diff_method)
+        def circuit(x, coeffs):
+            qml.RY(x, wires=0)
+            return qml.expval(qml.Hamiltonian(coeffs, obs))
+
+        x = pnp.array(0.4, requires_grad=True)
+        coeffs = pnp.array([0.1, 0.2], requires_grad=True)
+        grad = qml.grad(circuit)(x, coeffs)
+
+        assert spy.call_count == 1
+        assert np.allclose(grad[0], -0.1 * np.sin(0.4) + 0.2 * np.cos(0.4), atol=tol)
+        assert np.allclose(grad[1], [np.cos(0.4), np.sin(0.4)], atol=tol)
+
+        circuit(x, pnp.array([0.1, 0.2], requires_grad=False))
+        assert spy.call_count == 1
+
     def test_error_non_expval_measurement(self):
         """Tests that error is thrown if sample() or var() is used."""
         observables = [qml.PauliZ(0), qml.PauliY(0), qml.PauliZ(1)]
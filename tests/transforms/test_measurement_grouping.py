@@ -0,0 +1,72 @@
+# Copyright 2018-2021 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the measurement_grouping transform.
+"""
+import numpy as np
+import pennylane as qml
+
+dev = qml.device("default.qubit", wires=3)
+
+with qml.tape.QuantumTape() as tape:
+    qml.RX(0.1, wires=0)
+    qml.RX(0.2, wires=1)
+    qml.CNOT(wires=[0, 1])
+    qml.CNOT(wires=[1, 2])
+
+obs = [qml.PauliZ(0), qml.PauliX(0) @ qml.PauliZ(1), qml.PauliX(2)]
+coeffs = [2.0, -0.54, 0.1]
+
+
+def expected_expval(observables, coefficients):
+    """Returns the expectation value of the Hamiltonian evaluated on the tape"""
+    H = qml.Hamiltonian(coefficients, observables)
+
+    with qml.tape.QuantumTape() as expected_tape:
+        for op in tape.operations:
+            op.queue()
+        qml.expval(H)
+
+    return dev.batch_execute([expected_tape])[0]
+
+
+class TestMeasurementGrouping:
+    """Tests for the measurement_grouping transform"""
+
+    def test_observables_and_coefficients(self, tol):
+        """Test that the qubit-wise commuting observables are measured on the same tape,
+        and that the expectation value of the Hamiltonian is returned"""
+        tapes, fn = qml.transforms.measurement_grouping(tape, obs, coeffs)
+        assert len(tapes) == 2
+
+        res = fn(dev.batch_execute(tapes))
+        assert np.allclose(res, expected_expval(obs, coeffs), atol=tol, rtol=0)
+
+    def test_no_coefficients(self, tol):
+        """Test that all coefficients are one if they are not specified"""
+        observables = [qml.PauliZ(0), qml.PauliX(0)]
+        tapes, fn = qml.transforms.measurement_grouping(tape, observables)
+        assert len(tapes) == 2
+
+        res = fn(dev.batch_execute(tapes))
+        assert np.allclose(res, expected_expval(observables, [1.0, 1.0]), atol=tol, rtol=0)
+
+    def test_pauli_sum(self, tol):
+        """Test that a PauliSum provides both the observables and the coefficients"""
+        psum = qml.PauliSum.from_hamiltonian(qml.Hamiltonian(coeffs, obs))
+        tapes, fn = qml.transforms.measurement_grouping(tape, psum)
+        assert len(tapes) == 2
+
+        res = fn(dev.batch_execute(tapes))
+        assert np.allclose(res, expected_expval(obs, coeffs), atol=tol, rtol=0)